@@ -0,0 +1,223 @@
+"""
+Deterministic logic benchmarks for every game.
+
+    python -m benchmarks.run                      # run all, compare to baseline
+    python -m benchmarks.run --only snake_len500  # run selected scenarios
+    python -m benchmarks.run --save-baseline      # record the current numbers
+
+Each scenario seeds random, drives the game's update() through the headless
+runner without rendering, and reports ticks/sec plus per-tick latency
+percentiles. It runs --repeats times, each on a fresh game and controller,
+and the run with the median p50 is kept. The repeats go in rounds over all
+the scenarios rather than back to back, so the median isn't taken from one
+fast or slow stretch of a shared VM. Results go to a JSON file.
+
+With a baseline present, each scenario's p50 tick time is compared, measured
+in units of a fixed calibration loop timed just before the run: p50 because a
+single preempted tick skews the mean of microsecond ticks, calibrated because
+a shared VM's speed drifts between runs. Scenarios slower by more than the
+tolerance are run again to confirm, then reported, and the exit code is
+non-zero. Baselines only compare with runs of the same --seed and --ticks.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from games.headless import HeadlessRunner
+from games.registry import find_entry, load_game_class
+from benchmarks.scenarios import SCENARIOS
+
+DEFAULT_OUTPUT = os.path.join("benchmarks", "results.json")
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+CALIBRATION_ITERATIONS = 100000
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def calibrate(loops=5):
+    """ms a fixed pure-Python loop takes right now (best of a few): how fast this machine is running."""
+    best = None
+    for _ in range(loops):
+        start = time.perf_counter_ns()
+        total = 0
+        for i in range(CALIBRATION_ITERATIONS):
+            total += i & 7
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / 1e6
+
+
+def run_scenario(scenario, ticks, seed):
+    calibration_ms = calibrate()
+    random.seed(seed)
+    module_name, class_name, game_kwargs = find_entry(scenario.game_name)
+    game_class = load_game_class(module_name, class_name)
+    runner = HeadlessRunner(game_class, game_name=scenario.game_name, seed=seed, **game_kwargs)
+    if scenario.setup:
+        scenario.setup(runner.game)
+    controller = scenario.make_controller() if scenario.make_controller else None
+
+    latencies = []
+    restarts = 0
+    perf_counter_ns = time.perf_counter_ns
+    start = perf_counter_ns()
+    for _ in range(ticks):
+        events = controller(runner) if controller else None
+        tick_start = perf_counter_ns()
+        runner.step(events or ())
+        latencies.append(perf_counter_ns() - tick_start)
+        if runner.is_over():
+            # Restart outside the timed tick, back into the same scenario
+            restarts += 1
+            if scenario.setup:
+                scenario.setup(runner.game)
+            else:
+                runner.game.reset()
+    elapsed = (perf_counter_ns() - start) / 1e9
+
+    latencies.sort()
+    total = sum(latencies) / 1e9
+    result = {
+        "game": scenario.game_name,
+        "ticks": ticks,
+        "restarts": restarts,
+        "elapsed_s": round(elapsed, 4),
+        "ticks_per_sec": round(ticks / total, 1) if total > 0 else 0.0,
+        "tick_us": {
+            "p50": round(percentile(latencies, 0.50) / 1000, 2),
+            "p95": round(percentile(latencies, 0.95) / 1000, 2),
+            "p99": round(percentile(latencies, 0.99) / 1000, 2),
+            "max": round(latencies[-1] / 1000, 2),
+        },
+        # p50 in units of the calibration loop, comparable across a VM's speed swings
+        "p50_per_calibration": round(percentile(latencies, 0.50) / 1e6 / calibration_ms, 6),
+        "calibration_ms": round(calibration_ms, 3),
+    }
+    if hasattr(controller, "stats"):
+        result["controller"] = controller.stats()  # e.g. an autopilot's search rate
+    return result
+
+
+def run_rounds(scenarios, ticks, seed, repeats, runs):
+    """Adds repeats runs of each scenario to runs, one of each per round."""
+    for _ in range(repeats):
+        for scenario in scenarios:
+            runs.setdefault(scenario.name, []).append(run_scenario(scenario, ticks[scenario.name], seed))
+
+
+def median_run(runs):
+    """The run with the median calibrated p50, labelled with how many runs it was picked from."""
+    result = sorted(runs, key=lambda r: r["p50_per_calibration"])[len(runs) // 2]
+    result["repeats"] = len(runs)
+    return result
+
+
+def mismatched_settings(report, baseline):
+    """Names of scenarios (or "seed") run differently from the baseline, so not comparable."""
+    mismatched = ["seed"] if report["seed"] != baseline.get("seed") else []
+    for name, result in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base and base["ticks"] != result["ticks"]:
+            mismatched.append(name)
+    return mismatched
+
+
+def compare(results, baseline, tolerance):
+    """Returns a list of (name, baseline, current) calibrated p50s for regressed scenarios."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        if result["p50_per_calibration"] > base["p50_per_calibration"] * (1 + tolerance):
+            regressions.append((name, base["p50_per_calibration"], result["p50_per_calibration"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run deterministic game logic benchmarks.")
+    parser.add_argument("--only", nargs="+", metavar="SCENARIO", help="scenario names to run")
+    parser.add_argument("--ticks", type=int, help="override ticks per scenario")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--repeats", type=int, default=5, help="runs per scenario; the median is kept")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed p50 tick time growth (fraction)")
+    args = parser.parse_args(argv)
+
+    scenarios = SCENARIOS
+    if args.only:
+        known = {s.name for s in SCENARIOS}
+        unknown = set(args.only) - known
+        if unknown:
+            parser.error(f"unknown scenarios: {', '.join(sorted(unknown))} (known: {', '.join(sorted(known))})")
+        scenarios = [s for s in SCENARIOS if s.name in args.only]
+
+    ticks = {s.name: args.ticks or s.ticks for s in scenarios}
+    runs = {}
+    run_rounds(scenarios, ticks, args.seed, args.repeats, runs)
+    results = {}
+    for scenario in scenarios:
+        result = results[scenario.name] = median_run(runs[scenario.name])
+        tick_us = result["tick_us"]
+        print(f"{scenario.name:<18} {result['ticks_per_sec']:>11.0f} ticks/s   "
+              f"p50 {tick_us['p50']:>7.1f}us  p95 {tick_us['p95']:>7.1f}us  "
+              f"p99 {tick_us['p99']:>7.1f}us  max {tick_us['max']:>8.1f}us")
+        if "controller" in result:
+            print(f"{'':<18} " + "  ".join(f"{key} {value}" for key, value in result["controller"].items()))
+
+    report = {
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scenarios": results,
+    }
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --save-baseline to record one.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    mismatched = mismatched_settings(report, baseline)
+    if mismatched:
+        print(f"Not comparable with {args.baseline}: different --seed/--ticks for {', '.join(mismatched)}")
+        return 2
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        # A shared machine can be slow for seconds at a time; a real regression shows up again
+        print(f"Re-running {len(regressions)} slower scenario(s) to confirm")
+        slower = {name for name, _, _ in regressions}
+        run_rounds([s for s in scenarios if s.name in slower], ticks, args.seed, args.repeats, runs)
+        for name in slower:
+            results[name] = median_run(runs[name])
+        regressions = compare(results, baseline, args.tolerance)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: p50 {before:.3g} -> {after:.3g} calibration loops/tick ({after / before - 1:+.0%})")
+    if not regressions:
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+import random
+from functools import partial
+import pygame
+from settings import *
+from games.headless import key_event
+from games.snake_ai import SnakeAutopilot
+from games.tetris import SHIFT_KEYS
+from games.tetris_ai import TetrisAutopilot
+
+# Each scenario: a game from the registry, an optional setup() that puts the
+# game into a stressful state (re-applied whenever the game ends), and an
+# optional make_controller() that builds a fresh controller(runner) for every
+# run, so nothing one run leaves in a controller carries into the next.
+
+
+class Scenario:
+    def __init__(self, name, game_name, setup=None, make_controller=None, ticks=5000):
+        self.name = name
+        self.game_name = game_name
+        self.setup = setup
+        self.make_controller = make_controller
+        self.ticks = ticks
+
+
+def random_keys(keys, every=5):
+    """Controller that taps a random key from keys every few ticks."""
+    def controller(runner):
+        if runner.ticks % every == 0:
+            return [key_event(random.choice(keys))]
+        return None
+    return controller
+
+
+def random_clicks(buttons=(1,), every=10):
+    def controller(runner):
+        if runner.ticks % every == 0:
+            pos = (random.randint(0, SCREEN_WIDTH - 1), random.randint(0, SCREEN_HEIGHT - 1))
+            return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=random.choice(buttons), pos=pos)]
+        return None
+    return controller
+
+
+def hold_and_fire(fire_key=pygame.K_SPACE, every=20):
+    """Sweeps left/right with held keys and fires constantly."""
+    def controller(runner):
+        keyboard = runner.keyboard
+        if runner.ticks % every == 0:
+            keyboard.release_all()
+            keyboard.press(random.choice([pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP]))
+        return [key_event(fire_key)]
+    return controller
+
+
+class HeldShift:
+    """
+    Tetris controller that holds left or right for hold ticks, then hard
+    drops, and measures auto-shift timing: each move the piece makes is
+    compared with when the game's das/arr say it was due (the press itself,
+    then das, then every arr ms). stats() reports the worst lateness, which
+    should stay under one tick (SIM_TICK_MS).
+    """
+    def __init__(self, hold=40):
+        self.hold = hold
+        self.latencies = []  # ms each move came after it was due
+        self.piece = None    # Piece of the press being measured
+        self.tick_time = 0
+
+    def __call__(self, runner):
+        game, keyboard = runner.game, runner.keyboard
+        now = game.get_ticks()
+        # Moves made during the previous tick, which ran at self.tick_time
+        if self.piece is not None and game.current_piece is self.piece:
+            for _ in range(abs(self.piece['x'] - self.x)):
+                self.latencies.append(self.tick_time - self._due(game))
+                self.moves += 1
+            self.x = self.piece['x']
+            if self._due(game) <= self.tick_time:
+                self.piece = None  # Blocked by a wall or the stack; later moves are off the schedule
+        else:
+            self.piece = None  # Locked, or game over and restarted; measure the next press
+
+        events = None
+        phase = runner.ticks % (self.hold + 2)
+        if phase == 0:
+            key = random.choice(list(SHIFT_KEYS))
+            keyboard.press(key)
+            events = [key_event(key)]
+            self.piece, self.x, self.moves, self.pressed_at = game.current_piece, game.current_piece['x'], 0, now
+        elif phase == self.hold:
+            keyboard.release_all()
+            self.piece = None
+        elif phase == self.hold + 1:
+            events = [key_event(pygame.K_SPACE)]
+        self.tick_time = now
+        return events
+
+    def _due(self, game):
+        """Clock time the next move of the current press is due at."""
+        if self.moves == 0:
+            return self.pressed_at
+        return self.pressed_at + game.das + (self.moves - 1) * game.arr
+
+    def stats(self):
+        return {
+            "moves": len(self.latencies),
+            "max_shift_latency_ms": round(max(self.latencies), 2) if self.latencies else 0,
+            "tick_ms": round(SIM_TICK_MS, 2),
+        }
+
+
+# --- Stress setups ---
+
+def snake_long(length=500):
+    def setup(game):
+        # Serpentine body filling the top rows; the head runs into open space
+        cells = []
+        for y in range(SNAKE_GRID_HEIGHT):
+            row = range(SNAKE_GRID_WIDTH) if y % 2 == 0 else range(SNAKE_GRID_WIDTH - 1, -1, -1)
+            for x in row:
+                cells.append((x, y))
+                if len(cells) == length:
+                    break
+            if len(cells) == length:
+                break
+        game.reset()
+        game.set_body(reversed(cells))
+        game.direction = game.next_direction = (0, 1)
+        game.food = game._get_random_position()
+        game.move_interval = 0  # Move every tick
+    return setup
+
+
+def snake_every_tick():
+    def setup(game):
+        game.reset()
+        game.move_interval = 0  # A move, so a planning step, every tick
+    return setup
+
+
+def arena_crowd(count=300):
+    def setup(game):
+        game.snake_count = count
+        game.reset()
+        game.autopilot = True  # Player too, so the run never stops on a game over
+        game.move_interval = 0  # Every snake moves every tick
+    return setup
+
+
+def invaders_late(level=8):
+    def setup(game):
+        game.reset()
+        game.level = level
+        game._start_level()
+        game.lives = 10 ** 9
+        game.shoot_cooldown = 0
+    return setup
+
+
+def asteroids_field(count=200):
+    def setup(game):
+        game.reset()
+        game.asteroids = []
+        for _ in range(count):
+            game._spawn_asteroid(size=random.randint(1, 3))
+        game.invincible_until = float("inf")
+    return setup
+
+
+def tetris_profile(name):
+    def setup(game):
+        game.set_input_profile(name)
+        game.reset()
+    return setup
+
+
+def tetris_nearly_full(filled_rows=16):
+    def setup(game):
+        game.reset()
+        for r in range(TETRIS_ROWS - filled_rows, TETRIS_ROWS):
+            hole = random.randrange(TETRIS_COLS)
+            game.set_row(r, [COLORS["GRID"] if c != hole else 0 for c in range(TETRIS_COLS)])
+        game.drop_interval = 0  # Drop every tick
+    return setup
+
+
+SCENARIOS = [
+    # One plain run per game with scripted input
+    Scenario("tetris", "Tetris", make_controller=partial(random_keys, [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_SPACE])),
+    Scenario("snake", "Snake", make_controller=partial(random_keys, [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN])),
+    Scenario("snake_arena", "Snake Arena", make_controller=partial(random_keys, [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN])),
+    Scenario("breakout", "Breakout", make_controller=hold_and_fire),
+    Scenario("pong", "Pong", make_controller=hold_and_fire),
+    Scenario("invaders", "Invaders", make_controller=hold_and_fire),
+    Scenario("flappy", "Flappy", make_controller=partial(random_keys, [pygame.K_SPACE], every=25)),
+    Scenario("minesweeper", "Minesweeper", make_controller=partial(random_clicks, buttons=(1, 1, 3))),
+    Scenario("memory", "Memory", make_controller=random_clicks),
+    Scenario("asteroids", "Asteroids", make_controller=hold_and_fire),
+    # Hot-path stress cases
+    Scenario("snake_len500", "Snake", setup=snake_long(500)),
+    Scenario("snake_arena_crowd", "Snake Arena", setup=arena_crowd(300), ticks=1000),
+    Scenario("snake_xl", "Snake XL", make_controller=partial(random_keys, [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN])),
+    # Seeded runs need the node budget alone; the _1ms run shows the deadline holding
+    Scenario("snake_autopilot", "Snake", setup=snake_every_tick(), make_controller=partial(SnakeAutopilot, time_budget_ms=None)),
+    Scenario("snake_xl_autopilot", "Snake XL", setup=snake_every_tick(), make_controller=partial(SnakeAutopilot, time_budget_ms=None)),
+    Scenario("snake_xl_autopilot_1ms", "Snake XL", setup=snake_every_tick(), make_controller=partial(SnakeAutopilot, time_budget_ms=1.0)),
+    Scenario("invaders_late", "Invaders", setup=invaders_late(8), make_controller=hold_and_fire),
+    Scenario("asteroids_field", "Asteroids", setup=asteroids_field(200), make_controller=hold_and_fire),
+    Scenario("tetris_full", "Tetris", setup=tetris_nearly_full(16),
+             make_controller=partial(random_keys, [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP], every=3)),
+    # Placement search runs in the (untimed) controller; its own rate is reported alongside
+    Scenario("tetris_autopilot", "Tetris", make_controller=partial(TetrisAutopilot, placement_budget=None, time_budget_ms=None)),
+    # Held left/right under each auto-shift profile; reports the worst move lateness
+    *[Scenario(f"tetris_das_{name}", "Tetris", setup=tetris_profile(name), make_controller=HeldShift)
+      for name in TETRIS_INPUT_PROFILES],
+]
@@ -1,15 +1,14 @@
 import pygame
 import math
-import random
 from settings import *
 from games.base_game import BaseGame
 
 class AsteroidsGame(BaseGame):
     """Classic Asteroids: destroy rocks, avoid collisions. Arrow keys + Space."""
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Asteroids"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Asteroids", clock=None, input_source=None):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_HUD)
+        self.font = self.text.get_font(FONT_SIZE_HUD)
         self.reset()
 
     def reset(self):
@@ -26,18 +25,18 @@ class AsteroidsGame(BaseGame):
         self.score = 0
         self.game_over = False
         self.lives = 3
-        self.invincible_until = pygame.time.get_ticks() + 2000
+        self.invincible_until = self.get_ticks() + 2000
 
     def _spawn_asteroid(self, size=3, x=None, y=None):
         if x is None:
-            x = random.randint(0, SCREEN_WIDTH - 1)
+            x = self.rng.randint(0, SCREEN_WIDTH - 1)
         if y is None:
-            y = random.randint(0, SCREEN_HEIGHT - 1)
-        angle = random.random() * 2 * math.pi
-        speed = ASTEROIDS_ASTEROID_SPEED * (0.5 + random.random())
+            y = self.rng.randint(0, SCREEN_HEIGHT - 1)
+        angle = self.rng.random() * 2 * math.pi
+        speed = ASTEROIDS_ASTEROID_SPEED * (0.5 + self.rng.random())
         self.asteroids.append({
             'x': x, 'y': y, 'vx': math.cos(angle) * speed, 'vy': math.sin(angle) * speed,
-            'size': size, 'points': 8, 'angles': [random.random() * 2 * math.pi for _ in range(8)]
+            'size': size, 'points': 8, 'angles': [self.rng.random() * 2 * math.pi for _ in range(8)]
         })
 
     def _ship_rect(self):
@@ -71,7 +70,7 @@ class AsteroidsGame(BaseGame):
     def update(self):
         if self.game_over:
             return
-        keys = pygame.key.get_pressed()
+        keys = self.get_pressed()
         if keys[pygame.K_LEFT]:
             self.ship_angle -= math.radians(ASTEROIDS_ROTATION_SPEED)
         if keys[pygame.K_RIGHT]:
@@ -105,7 +104,7 @@ class AsteroidsGame(BaseGame):
                 dy = b['y'] - a['y']
                 if dx * dx + dy * dy < (20 + a['size'] * 15) ** 2:
                     self.score += ASTEROIDS_ASTEROID_POINTS * a['size']
-                    self.play_sound("explosion")
+                    self.play_sound("explosion", volume=0.4 + 0.2 * a['size'])  # Bigger rock, louder bang
                     if b in self.bullets:
                         self.bullets.remove(b)
                     self.asteroids.remove(a)
@@ -118,7 +117,7 @@ class AsteroidsGame(BaseGame):
             for _ in range(ASTEROIDS_ASTEROID_COUNT):
                 self._spawn_asteroid(size=3)
 
-        now = pygame.time.get_ticks()
+        now = self.get_ticks()
         if now >= self.invincible_until:
             ship_r = self._ship_rect()
             for a in self.asteroids:
@@ -147,7 +146,7 @@ class AsteroidsGame(BaseGame):
             pts = []
             for i in range(a['points']):
                 r = 8 + a['size'] * 8
-                ang = a['angles'][i] + pygame.time.get_ticks() * 0.001
+                ang = a['angles'][i] + self.get_ticks() * 0.001
                 pts.append((a['x'] + math.cos(ang) * r, a['y'] + math.sin(ang) * r))
             if len(pts) >= 3:
                 pygame.draw.polygon(self.screen, COLORS["GRID"], pts, 2)
@@ -157,10 +156,9 @@ class AsteroidsGame(BaseGame):
         left = (cx + math.cos(angle + 2.5) * ASTEROIDS_SHIP_SIZE, cy + math.sin(angle + 2.5) * ASTEROIDS_SHIP_SIZE)
         right = (cx + math.cos(angle - 2.5) * ASTEROIDS_SHIP_SIZE, cy + math.sin(angle - 2.5) * ASTEROIDS_SHIP_SIZE)
         pygame.draw.polygon(self.screen, COLORS["PADDLE"], [tip, left, right])
-        inv = pygame.time.get_ticks() < self.invincible_until
-        if inv and (pygame.time.get_ticks() // 100) % 2 == 0:
+        inv = self.get_ticks() < self.invincible_until
+        if inv and (self.get_ticks() // 100) % 2 == 0:
             pygame.draw.polygon(self.screen, COLORS["WARNING"], [tip, left, right], 2)
-        score_surf = self.font.render(f"Score: {self.score}  Lives: {self.lives}", True, COLORS["TEXT"])
-        self.screen.blit(score_surf, (10, 10))
+        self.text.draw_hud(self.screen, self.font, f"Score: {self.score}  Lives: {self.lives}", COLORS["TEXT"], (10, 10))
         if self.game_over:
             self.draw_game_over_overlay(f"Score: {self.score}")
@@ -1,9 +1,16 @@
 import pygame
+import random
 from abc import ABC, abstractmethod
 from settings import *
+from ui.dirty import DirtyTracker
+from ui.text import text_renderer
 
 class BaseGame(ABC):
-    def __init__(self, screen, create_game_callback=None, game_over_callback=None, highscore_manager=None, sound_manager=None, game_name="Unknown"):
+    # Games that track their drawn regions in self.dirty_tracker set this so
+    # the "dirty" render mode can skip the full-screen flip for them
+    reports_dirty_rects = False
+
+    def __init__(self, screen, create_game_callback=None, game_over_callback=None, highscore_manager=None, sound_manager=None, game_name="Unknown", clock=None, input_source=None):
         self.screen = screen
         # Callback to return to menu or switch states
         self.create_game_callback = create_game_callback 
@@ -11,13 +18,43 @@ class BaseGame(ABC):
         self.highscore_manager = highscore_manager
         self.sound_manager = sound_manager
         self.game_name = game_name
+        # Time and held-key sources. Default to the real pygame modules; the
+        # headless runner swaps in a simulated clock and scripted keyboard.
+        self.clock = clock or pygame.time
+        self.input = input_source or pygame.key
+        # Per-game random stream; seed it (then reset) to make a run reproducible
+        self.rng = random.Random()
+        # True while managers/replay.py records or replays a session: nothing may depend on wall-clock time then
+        self.recorded = False
         self.active = False
-        self.font_overlay_big = pygame.font.SysFont(FONT_NAME, 64)
-        self.font_overlay_small = pygame.font.SysFont(FONT_NAME, 32)
+        # Set by GameStateManager each frame; 1.0 means "draw the latest tick"
+        self.render_alpha = 1.0
+        self.dirty_tracker = DirtyTracker(enabled=RENDER_MODE == "dirty" and self.reports_dirty_rects)
+        # Shared font/text cache; draw_hud() for text that changes every frame
+        self.text = text_renderer
+        self.font_overlay_big = self.text.get_font(64)
+        self.font_overlay_small = self.text.get_font(32)
+        # Composited game-over overlay and the (message, high score) it shows
+        self.overlay_surface = None
+        self.overlay_key = None
+        # Attract mode: games with an autopilot (create_autopilot) play and restart themselves
+        self.autopilot = None
+        self.game_over_time = 0
+
+    def get_ticks(self):
+        """Milliseconds from the game's clock (use instead of pygame.time.get_ticks)."""
+        return self.clock.get_ticks()
+
+    def get_pressed(self):
+        """Held-key state from the game's input source (use instead of pygame.key.get_pressed)."""
+        return self.input.get_pressed()
 
-    def play_sound(self, sound_name):
+    def seed(self, seed):
+        self.rng.seed(seed)
+
+    def play_sound(self, sound_name, pitch=1.0, volume=1.0):
         if self.sound_manager:
-            self.sound_manager.play(sound_name)
+            self.sound_manager.play(sound_name, pitch=pitch, volume=volume)
 
     @abstractmethod
     def handle_events(self, event):
@@ -38,26 +75,90 @@ class BaseGame(ABC):
         """Reset the game state to start over."""
         pass
 
+    def start_session(self):
+        """
+        Called on entering the game (and by ReplayPlayer), before reset().
+        Options that outlive reset(), like the autopilot, go back to how a
+        fresh instance has them, so every session replays from a known state.
+        """
+        self.autopilot = None
+
+    # --- Attract mode ---
+
+    def create_autopilot(self):
+        """The autopilot AUTOPILOT_TOGGLE_KEY switches on; None if the game has none."""
+        return None
+
+    def toggle_autopilot(self):
+        self.autopilot = None if self.autopilot else self.create_autopilot()
+
+    def handle_autopilot_key(self, event):
+        """Toggles the autopilot on AUTOPILOT_TOGGLE_KEY. Returns True if the event was used."""
+        if event.type == pygame.KEYDOWN and event.key == AUTOPILOT_TOGGLE_KEY:
+            self.toggle_autopilot()
+            return True
+        return False
+
+    def end_game(self):
+        """Game over; the score only counts if a person was playing."""
+        self.game_over = True
+        self.game_over_time = self.get_ticks()
+        self.play_sound("gameover")
+        if not self.autopilot:
+            self.check_and_save_highscore(self.score)
+
+    def restart_attract_mode(self):
+        """Restarts a finished game ATTRACT_RESTART_MS after it ended, if the autopilot is on. True if it did."""
+        if self.game_over and self.autopilot and self.get_ticks() - self.game_over_time > ATTRACT_RESTART_MS:
+            self.reset()
+            return True
+        return False
+
+    def draw_autopilot_hud(self, font, pos):
+        if self.autopilot:
+            self.text.draw_hud(self.screen, font, "AUTOPILOT (A)", COLORS["WARNING"], pos)
+
+    def interpolate_pos(self, prev, current):
+        """Blends the previous and current tick positions by render_alpha."""
+        a = self.render_alpha
+        return (prev[0] + (current[0] - prev[0]) * a, prev[1] + (current[1] - prev[1]) * a)
+
+    def get_dirty_rects(self):
+        """Regions changed since last frame, or None when a full flip is needed."""
+        return self.dirty_tracker.collect()
+
     def draw_text_centered(self, text, font, color, center_x, center_y):
-        surf = font.render(text, True, color)
-        rect = surf.get_rect(center=(center_x, center_y))
-        self.screen.blit(surf, rect)
+        self.text.draw(self.screen, font, text, color, center=(center_x, center_y))
 
     def draw_game_over_overlay(self, message="GAME OVER"):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(150) # Slightly darker for better contrast
-        overlay.fill(COLORS["BACKGROUND"])
-        self.screen.blit(overlay, (0, 0))
-
-        self.draw_text_centered(message, self.font_overlay_big, COLORS["DANGER"], SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60)
-        
-        # Show High Score
+        # Games sit on this screen for long stretches, so the overlay is
+        # composited once per message/high score and then blitted in one call
+        high_score = self.highscore_manager.get_score(self.game_name) if self.highscore_manager else None
+        key = (message, high_score)
+        if key != self.overlay_key:
+            self.overlay_surface = self._build_game_over_overlay(message, high_score)
+            self.overlay_key = key
+        self.screen.blit(self.overlay_surface, (0, 0))
+        self.dirty_tracker.track("game_over_overlay", self.screen.get_rect(), key)
+
+    def _build_game_over_overlay(self, message, high_score):
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((*COLORS["BACKGROUND"], 150)) # Slightly darker for better contrast
+
+        lines = [(message, self.font_overlay_big, COLORS["DANGER"], -60)]
+        # Show High Score ("-" until the game has a finished run)
         if self.highscore_manager:
-            high_score = self.highscore_manager.get_score(self.game_name)
-            self.draw_text_centered(f"High Score: {high_score}", self.font_overlay_small, COLORS["HIGHLIGHT"], SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            best_text = "-" if high_score is None else high_score
+            lines.append((f"High Score: {best_text}", self.font_overlay_small, COLORS["HIGHLIGHT"], 0))
+        lines.append(("Press SPACE to Restart", self.font_overlay_small, COLORS["TEXT"], 50))
+        lines.append(("Press ESC for Menu", self.font_overlay_small, COLORS["GRID"], 90))
+
+        for text, font, color, dy in lines:
+            self.text.draw(overlay, font, text, color, center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + dy))
 
-        self.draw_text_centered("Press SPACE to Restart", self.font_overlay_small, COLORS["TEXT"], SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)
-        self.draw_text_centered("Press ESC for Menu", self.font_overlay_small, COLORS["GRID"], SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90)
+        if pygame.display.get_surface():
+            overlay = overlay.convert_alpha()
+        return overlay
 
     def check_and_save_highscore(self, current_score):
         if self.highscore_manager:
@@ -1,13 +1,12 @@
 import pygame
-import random
 from settings import *
 from games.base_game import BaseGame
 
 class BreakoutGame(BaseGame):
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Breakout"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Breakout", clock=None, input_source=None):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_HUD)
+        self.font = self.text.get_font(FONT_SIZE_HUD)
         self.reset()
 
     def reset(self):
@@ -24,8 +23,10 @@ class BreakoutGame(BaseGame):
             BREAKOUT_BALL_RADIUS * 2
         )
         self.ball_speed = [5, -5]
+        self.prev_ball_pos = self.ball_rect.topleft
         self.bricks = self._create_bricks()
         self.score = 0
+        self.combo = 0  # Bricks hit since the ball last touched the paddle
         self.lives = 3
         self.game_over = False
         self.won = False
@@ -71,7 +72,7 @@ class BreakoutGame(BaseGame):
             return
 
         # Paddle Movement
-        keys = pygame.key.get_pressed()
+        keys = self.get_pressed()
         if keys[pygame.K_LEFT]:
             self.paddle_rect.x -= 8
         if keys[pygame.K_RIGHT]:
@@ -82,6 +83,7 @@ class BreakoutGame(BaseGame):
         if self.paddle_rect.right > SCREEN_WIDTH: self.paddle_rect.right = SCREEN_WIDTH
 
         # Ball Movement
+        self.prev_ball_pos = self.ball_rect.topleft
         self.ball_rect.x += self.ball_speed[0]
         self.ball_rect.y += self.ball_speed[1]
 
@@ -101,11 +103,13 @@ class BreakoutGame(BaseGame):
                 self.play_sound("explosion")
                 # Reset ball
                 self.ball_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-                self.ball_speed = [5 * random.choice([-1, 1]), -5]
+                self.ball_speed = [5 * self.rng.choice([-1, 1]), -5]
+                self.prev_ball_pos = self.ball_rect.topleft
 
         # Paddle Collision
         if self.ball_rect.colliderect(self.paddle_rect):
             self.play_sound("select")
+            self.combo = 0
             self.ball_speed[1] = -abs(self.ball_speed[1]) # Bounce up
             # Adjust angle based on hit position
             offset = (self.ball_rect.centerx - self.paddle_rect.centerx) / (BREAKOUT_PADDLE_WIDTH / 2)
@@ -118,7 +122,9 @@ class BreakoutGame(BaseGame):
             brick = self.bricks.pop(hit_index)
             self.ball_speed[1] = -self.ball_speed[1]
             self.score += 10
-            self.play_sound("score")
+            self.combo += 1
+            # Each brick in a chain blips a little higher
+            self.play_sound("score", pitch=min(2.0, 1.0 + 0.08 * (self.combo - 1)))
             if not self.bricks:
                 self.won = True
                 self.check_and_save_highscore(self.score)
@@ -129,16 +135,17 @@ class BreakoutGame(BaseGame):
         # Draw Paddle
         pygame.draw.rect(self.screen, COLORS["ACCENT"], self.paddle_rect)
 
-        # Draw Ball
-        pygame.draw.ellipse(self.screen, COLORS["WHITE"], self.ball_rect)
+        # Draw Ball (interpolated between ticks)
+        ball_draw_rect = self.ball_rect.copy()
+        ball_draw_rect.topleft = self.interpolate_pos(self.prev_ball_pos, self.ball_rect.topleft)
+        pygame.draw.ellipse(self.screen, COLORS["WHITE"], ball_draw_rect)
 
         # Draw Bricks
         for brick in self.bricks:
             pygame.draw.rect(self.screen, brick['color'], brick['rect'])
 
         # Draw HUD
-        score_surf = self.font.render(f"Score: {self.score}  Lives: {self.lives}", True, COLORS["TEXT"])
-        self.screen.blit(score_surf, (10, 10))
+        self.text.draw_hud(self.screen, self.font, f"Score: {self.score}  Lives: {self.lives}", COLORS["TEXT"], (10, 10))
 
         if self.game_over:
             self.draw_game_over_overlay("GAME OVER")
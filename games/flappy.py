@@ -1,22 +1,22 @@
 import pygame
-import random
 from settings import *
 from games.base_game import BaseGame
 
 class FlappyGame(BaseGame):
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Flappy"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Flappy", clock=None, input_source=None):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_HUD)
+        self.font = self.text.get_font(FONT_SIZE_HUD)
         self.reset()
 
     def reset(self):
         self.bird_rect = pygame.Rect(100, SCREEN_HEIGHT // 2, 30, 30)
         self.bird_velocity = 0
+        self.prev_bird_pos = self.bird_rect.topleft
         self.pipes = []
         self.score = 0
         self.game_over = False
-        self.last_pipe_time = pygame.time.get_ticks()
+        self.last_pipe_time = self.get_ticks()
 
     def handle_events(self, event):
         if self.game_over:
@@ -39,11 +39,12 @@ class FlappyGame(BaseGame):
             return
 
         # Bird Physics
+        self.prev_bird_pos = self.bird_rect.topleft
         self.bird_velocity += FLAPPY_GRAVITY
         self.bird_rect.y += int(self.bird_velocity)
 
         # Pipe Generation
-        current_time = pygame.time.get_ticks()
+        current_time = self.get_ticks()
         if current_time - self.last_pipe_time > FLAPPY_PIPE_FREQUENCY:
             self.last_pipe_time = current_time
             self._create_pipe()
@@ -72,7 +73,7 @@ class FlappyGame(BaseGame):
             self.play_sound("explosion")
 
     def _create_pipe(self):
-        gap_y = random.randint(100, SCREEN_HEIGHT - 100 - FLAPPY_PIPE_GAP)
+        gap_y = self.rng.randint(100, SCREEN_HEIGHT - 100 - FLAPPY_PIPE_GAP)
         pipe_width = 60
         
         top_rect = pygame.Rect(SCREEN_WIDTH, 0, pipe_width, gap_y)
@@ -95,13 +96,14 @@ class FlappyGame(BaseGame):
             pygame.draw.rect(self.screen, COLORS["GRID"], pipe['top'], 2)
             pygame.draw.rect(self.screen, COLORS["GRID"], pipe['bottom'], 2)
 
-        # Draw Bird
-        pygame.draw.rect(self.screen, COLORS["WARNING"], self.bird_rect)
-        pygame.draw.rect(self.screen, COLORS["TEXT"], self.bird_rect, 1)
+        # Draw Bird (interpolated between ticks)
+        bird_draw_rect = self.bird_rect.copy()
+        bird_draw_rect.topleft = self.interpolate_pos(self.prev_bird_pos, self.bird_rect.topleft)
+        pygame.draw.rect(self.screen, COLORS["WARNING"], bird_draw_rect)
+        pygame.draw.rect(self.screen, COLORS["TEXT"], bird_draw_rect, 1)
 
         # Draw Score
-        score_surf = self.font.render(f"Score: {self.score}", True, COLORS["TEXT"])
-        self.screen.blit(score_surf, (10, 10))
+        self.text.draw_hud(self.screen, self.font, f"Score: {self.score}", COLORS["TEXT"], (10, 10))
 
         if self.game_over:
             self.draw_game_over_overlay()
\ No newline at end of file
@@ -0,0 +1,132 @@
+import os
+import time
+import pygame
+from settings import *
+
+
+def init_headless():
+    """
+    Initializes pygame with the SDL dummy drivers (unless a driver was already
+    chosen) and returns an off-screen surface to use as the game's screen.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if not pygame.get_init():
+        pygame.init()
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def key_event(key, down=True):
+    """Builds a KEYDOWN/KEYUP event like the ones pygame.event.get() returns."""
+    event_type = pygame.KEYDOWN if down else pygame.KEYUP
+    return pygame.event.Event(event_type, key=key, mod=0, unicode="", scancode=0)
+
+
+class SimClock:
+    """
+    Stand-in for pygame.time that only moves when advanced. Time is derived
+    from a tick count exactly like GameStateManager.get_ticks(), so the two
+    clocks agree to the millisecond.
+    """
+    def __init__(self, tick_ms=SIM_TICK_MS, start_tick=0):
+        self.tick_ms = tick_ms
+        self.tick = start_tick
+
+    def get_ticks(self):
+        return int(self.tick * self.tick_ms)
+
+    def advance(self, ticks=1):
+        self.tick += ticks
+
+
+class KeyboardState:
+    """Stand-in for pygame.key whose held keys are set by a script or bot."""
+    def __init__(self):
+        self.held = set()
+
+    def press(self, key):
+        self.held.add(key)
+
+    def release(self, key):
+        self.held.discard(key)
+
+    def release_all(self):
+        self.held.clear()
+
+    def get_pressed(self):
+        return self
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class HeadlessRunner:
+    """
+    Steps a BaseGame subclass without a window or real clock, as fast as the
+    logic allows. Rendering is skipped unless render_every is set.
+
+        runner = HeadlessRunner(SnakeGame)
+        stats = runner.run(10000)
+    """
+    def __init__(self, game_class, game_name=None, tick_ms=SIM_TICK_MS, render_every=0,
+                 restart_on_game_over=False, seed=None, **game_kwargs):
+        self.screen = init_headless()
+        self.clock = SimClock(tick_ms)
+        self.keyboard = KeyboardState()
+        self.tick_ms = tick_ms
+        self.render_every = render_every
+        self.restart_on_game_over = restart_on_game_over
+        self.ticks = 0
+        self.restarts = 0
+        self.menu_requests = 0
+
+        kwargs = dict(game_kwargs)
+        if game_name is not None:
+            kwargs["game_name"] = game_name
+        self.game = game_class(self.screen, self._return_to_menu,
+                               clock=self.clock, input_source=self.keyboard, **kwargs)
+        if seed is not None:
+            self.game.seed(seed)
+            self.game.reset()
+
+    def _return_to_menu(self):
+        # No menu when headless; just count it so scripts can assert on it
+        self.menu_requests += 1
+
+    def is_over(self):
+        return getattr(self.game, "game_over", False) or getattr(self.game, "won", False)
+
+    def step(self, events=()):
+        """Delivers events, then runs one simulation tick (same order as main loop)."""
+        for event in events:
+            self.game.handle_events(event)
+        self.game.update()
+        self.clock.advance()
+        self.ticks += 1
+
+        if self.render_every and self.ticks % self.render_every == 0:
+            self.game.draw()
+
+        if self.restart_on_game_over and self.is_over():
+            self.game.reset()
+            self.restarts += 1
+
+    def run(self, ticks, controller=None):
+        """
+        Runs a fixed number of ticks. controller(runner) is called before every
+        tick and may press/release keys on runner.keyboard or return a list of
+        events to deliver. Returns a small stats dict.
+        """
+        start = time.perf_counter()
+        for _ in range(ticks):
+            events = controller(self) if controller else None
+            self.step(events or ())
+            if self.is_over() and not self.restart_on_game_over:
+                break
+        elapsed = time.perf_counter() - start
+        return {
+            "ticks": self.ticks,
+            "restarts": self.restarts,
+            "elapsed_s": elapsed,
+            "ticks_per_sec": self.ticks / elapsed if elapsed > 0 else 0.0,
+        }
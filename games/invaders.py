@@ -1,13 +1,12 @@
 import pygame
-import random
 from settings import *
 from games.base_game import BaseGame
 
 class InvadersGame(BaseGame):
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Invaders"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Invaders", clock=None, input_source=None):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_HUD)
+        self.font = self.text.get_font(FONT_SIZE_HUD)
         self.reset()
 
     def reset(self):
@@ -88,7 +87,7 @@ class InvadersGame(BaseGame):
         if self.game_over:
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = self.get_ticks()
 
         # Check if Level Cleared
         if not self.enemies:
@@ -99,7 +98,7 @@ class InvadersGame(BaseGame):
             return
 
         # Player Movement
-        keys = pygame.key.get_pressed()
+        keys = self.get_pressed()
         if keys[pygame.K_LEFT]:
             self.player_rect.x -= INVADERS_PLAYER_SPEED
         if keys[pygame.K_RIGHT]:
@@ -139,7 +138,7 @@ class InvadersGame(BaseGame):
                     self.play_sound("explosion")
                     
                     # Chance to drop powerup
-                    if random.random() < 0.1: # 10% chance
+                    if self.rng.random() < 0.1: # 10% chance
                         self._spawn_powerup(e.centerx, e.centery)
                         
                     hit = True
@@ -150,7 +149,7 @@ class InvadersGame(BaseGame):
         if current_time - self.last_enemy_shot > self.enemy_shoot_interval and self.enemies:
             # Scale firing rate with number of enemies (fewer enemies = faster shooting to keep pressure)
             # Or simpler: just random enemies shoot
-            shooter = random.choice(self.enemies)
+            shooter = self.rng.choice(self.enemies)
             bullet = pygame.Rect(shooter.centerx - 2, shooter.bottom, 4, 10)
             self.enemy_bullets.append(bullet)
             self.last_enemy_shot = current_time
@@ -185,14 +184,14 @@ class InvadersGame(BaseGame):
             self.shield_active = False
 
     def _spawn_powerup(self, x, y):
-        p_type = random.choice(['SHIELD', 'TRIPLE', 'LIFE'])
+        p_type = self.rng.choice(['SHIELD', 'TRIPLE', 'LIFE'])
         rect = pygame.Rect(x - 10, y - 10, 20, 20)
         self.powerups.append({'rect': rect, 'type': p_type})
 
     def _apply_powerup(self, p_type):
         if p_type == 'SHIELD':
             self.shield_active = True
-            self.shield_timer = pygame.time.get_ticks()
+            self.shield_timer = self.get_ticks()
         elif p_type == 'TRIPLE':
             self.bullet_count = 3
             # Effect lasts until game over or reset? Let's make it permanent for the life?
@@ -205,7 +204,7 @@ class InvadersGame(BaseGame):
             self.lives += 1
 
     def _shoot(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.get_ticks()
         if current_time - self.last_shot > self.shoot_cooldown:
             if self.bullet_count == 1:
                 bullet = pygame.Rect(self.player_rect.centerx - 2, self.player_rect.top, 4, 10)
@@ -265,12 +264,10 @@ class InvadersGame(BaseGame):
             
             pygame.draw.rect(self.screen, color, p['rect'])
             # Simple text char
-            txt_surf = self.font.render(txt, True, COLORS["BLACK"])
-            self.screen.blit(txt_surf, (p['rect'].x + 5, p['rect'].y))
+            self.screen.blit(self.text.render(self.font, txt, COLORS["BLACK"]), (p['rect'].x + 5, p['rect'].y))
 
         # Draw HUD
-        score_surf = self.font.render(f"Score: {self.score}  Lives: {self.lives}  Level: {self.level}", True, COLORS["TEXT"])
-        self.screen.blit(score_surf, (10, 10))
+        self.text.draw_hud(self.screen, self.font, f"Score: {self.score}  Lives: {self.lives}  Level: {self.level}", COLORS["TEXT"], (10, 10))
 
         if self.game_over:
             self.draw_game_over_overlay(f"GAME OVER - Lvl {self.level}")
@@ -1,14 +1,15 @@
 import pygame
-import random
 from settings import *
 from games.base_game import BaseGame
 
 class MemoryGame(BaseGame):
     """Card matching (concentration) game. Click two cards to find pairs."""
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Memory"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    reports_dirty_rects = True
+
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Memory", clock=None, input_source=None):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_HUD)
+        self.font = self.text.get_font(FONT_SIZE_HUD)
         self.reset()
 
     def reset(self):
@@ -19,7 +20,7 @@ class MemoryGame(BaseGame):
         self.offset_y = MEMORY_OFFSET_Y
         n_pairs = (self.rows * self.cols) // 2
         values = list(range(n_pairs)) * 2
-        random.shuffle(values)
+        self.rng.shuffle(values)
         self.cards = []  # list of {'value': int, 'flipped': bool, 'matched': bool}
         for v in values:
             self.cards.append({'value': v, 'flipped': False, 'matched': False})
@@ -28,6 +29,7 @@ class MemoryGame(BaseGame):
         self.matches = 0
         self.game_over = False
         self.lock_until = 0  # delay before hiding non-matching pair
+        self.pending_hide = None  # (i, j) of a non-matching pair to flip back
 
     def _index_at_pos(self, mx, my):
         c = (mx - self.offset_x) // self.cell_size
@@ -49,9 +51,9 @@ class MemoryGame(BaseGame):
             self.return_to_menu()
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if pygame.time.get_ticks() < self.lock_until:
+            if self.get_ticks() < self.lock_until:
                 return
-            idx = self._index_at_pos(*pygame.mouse.get_pos())
+            idx = self._index_at_pos(*event.pos)
             if idx is None:
                 return
             card = self.cards[idx]
@@ -74,23 +76,20 @@ class MemoryGame(BaseGame):
                         self.check_and_save_highscore(self.moves)
                         self.play_sound("gameover")
                 else:
-                    self.lock_until = pygame.time.get_ticks() + 800
-                    def hide_pair():
-                        first_card['flipped'] = False
-                        card['flipped'] = False
+                    self.lock_until = self.get_ticks() + 800
                     # We'll hide in update() when lock_until expires
-                    self._pending_hide = (self.first_index, idx)
+                    self.pending_hide = (self.first_index, idx)
                 self.first_index = None
 
     def update(self):
         if self.game_over:
             return
-        now = pygame.time.get_ticks()
-        if hasattr(self, '_pending_hide') and now >= self.lock_until:
-            i, j = self._pending_hide
+        now = self.get_ticks()
+        if self.pending_hide and now >= self.lock_until:
+            i, j = self.pending_hide
             self.cards[i]['flipped'] = False
             self.cards[j]['flipped'] = False
-            del self._pending_hide
+            self.pending_hide = None
 
     def draw(self):
         self.screen.fill(COLORS["BACKGROUND"])
@@ -101,18 +100,18 @@ class MemoryGame(BaseGame):
             x = self.offset_x + c * self.cell_size
             y = self.offset_y + r * self.cell_size
             rect = pygame.Rect(x + 2, y + 2, self.cell_size - 4, self.cell_size - 4)
+            self.dirty_tracker.track(idx, rect, (card['matched'], card['flipped'], card['value']))
             if card['matched']:
                 pygame.draw.rect(self.screen, COLORS["SUCCESS"], rect, border_radius=6)
                 pygame.draw.rect(self.screen, COLORS["GRID"], rect, 2, border_radius=6)
             elif card['flipped']:
                 pygame.draw.rect(self.screen, palette[card['value'] % len(palette)], rect, border_radius=6)
                 pygame.draw.rect(self.screen, COLORS["GRID"], rect, 2, border_radius=6)
-                num = self.font.render(str(card['value'] + 1), True, COLORS["BLACK"])
-                self.screen.blit(num, num.get_rect(center=rect.center))
+                self.text.draw(self.screen, self.font, str(card['value'] + 1), COLORS["BLACK"], center=rect.center)
             else:
                 pygame.draw.rect(self.screen, COLORS["GRID"], rect, border_radius=6)
                 pygame.draw.rect(self.screen, COLORS["ACCENT"], rect, 2, border_radius=6)
-        score_surf = self.font.render(f"Moves: {self.moves}  Pairs: {self.matches}", True, COLORS["TEXT"])
-        self.screen.blit(score_surf, (10, 10))
+        hud_rect = self.text.draw_hud(self.screen, self.font, f"Moves: {self.moves}  Pairs: {self.matches}", COLORS["TEXT"], (10, 10))
+        self.dirty_tracker.track("hud", hud_rect, (self.moves, self.matches))
         if self.game_over:
             self.draw_game_over_overlay(f"Moves: {self.moves}")
@@ -1,13 +1,14 @@
 import pygame
-import random
 from settings import *
 from games.base_game import BaseGame
 
 class MinesweeperGame(BaseGame):
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Minesweeper"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    reports_dirty_rects = True
+
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Minesweeper", clock=None, input_source=None):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
-        self.font = pygame.font.SysFont(FONT_NAME, 24)
+        self.font = self.text.get_font(24)
         self.reset()
 
     def reset(self):
@@ -26,15 +27,15 @@ class MinesweeperGame(BaseGame):
         
         self.game_over = False
         self.won = False
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.get_ticks()
         self.time_elapsed = 0
         self.first_click = True
 
     def _place_mines(self):
         mines_placed = 0
         while mines_placed < self.num_mines:
-            r = random.randint(0, self.rows - 1)
-            c = random.randint(0, self.cols - 1)
+            r = self.rng.randint(0, self.rows - 1)
+            c = self.rng.randint(0, self.cols - 1)
             if not self.grid[r][c]['mine']:
                 self.grid[r][c]['mine'] = True
                 mines_placed += 1
@@ -68,7 +69,7 @@ class MinesweeperGame(BaseGame):
                 self.return_to_menu()
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            mx, my = pygame.mouse.get_pos()
+            mx, my = event.pos
             # Convert mouse pos to grid coords
             c = (mx - self.offset_x) // self.cell_size
             r = (my - self.offset_y) // self.cell_size
@@ -91,8 +92,8 @@ class MinesweeperGame(BaseGame):
                 # Move mine
                 cell['mine'] = False
                 while True:
-                    nr = random.randint(0, self.rows - 1)
-                    nc = random.randint(0, self.cols - 1)
+                    nr = self.rng.randint(0, self.rows - 1)
+                    nc = self.rng.randint(0, self.cols - 1)
                     if not self.grid[nr][nc]['mine'] and (nr != r or nc != c):
                         self.grid[nr][nc]['mine'] = True
                         break
@@ -142,14 +143,12 @@ class MinesweeperGame(BaseGame):
                     return
         self.won = True
         self.play_sound("score")
-        # Highscore is based on time (lower is better), but current highscore manager assumes higher is better.
-        # We can store negative time or inverted score. Let's store inverted time (e.g., 10000 - time_seconds)
-        score = max(0, 1000 - int(self.time_elapsed)) 
-        self.check_and_save_highscore(score)
+        # Highscore is the time in seconds (lower is better, see LOWER_SCORE_IS_BETTER)
+        self.check_and_save_highscore(int(self.time_elapsed))
 
     def update(self):
         if not self.game_over and not self.won:
-            self.time_elapsed = (pygame.time.get_ticks() - self.start_time) / 1000
+            self.time_elapsed = (self.get_ticks() - self.start_time) / 1000
 
     def draw(self):
         self.screen.fill(COLORS["BACKGROUND"])
@@ -164,6 +163,7 @@ class MinesweeperGame(BaseGame):
                 )
                 
                 cell = self.grid[r][c]
+                self.dirty_tracker.track((r, c), rect, (cell['revealed'], cell['flagged'], cell['mine'], cell['neighbors']))
                 
                 if cell['revealed']:
                     if cell['mine']:
@@ -178,9 +178,7 @@ class MinesweeperGame(BaseGame):
                                 (128, 0, 0), (0, 128, 128), (0, 0, 0), (128, 128, 128)
                             ]
                             color = colors[cell['neighbors'] - 1]
-                            text = self.font.render(str(cell['neighbors']), True, color)
-                            text_rect = text.get_rect(center=rect.center)
-                            self.screen.blit(text, text_rect)
+                            self.text.draw(self.screen, self.font, str(cell['neighbors']), color, center=rect.center)
                 else:
                     # Unrevealed
                     pygame.draw.rect(self.screen, (100, 100, 100), rect)
@@ -203,13 +201,15 @@ class MinesweeperGame(BaseGame):
                 pygame.draw.rect(self.screen, COLORS["GRID"], rect, 1)
 
         # Draw HUD
-        time_text = self.font.render(f"Time: {int(self.time_elapsed)}", True, COLORS["TEXT"])
-        self.screen.blit(time_text, (self.offset_x, self.offset_y - 30))
+        time_rect = self.text.draw_hud(self.screen, self.font, f"Time: {int(self.time_elapsed)}", COLORS["TEXT"], (self.offset_x, self.offset_y - 30))
+        self.dirty_tracker.track("time", time_rect, int(self.time_elapsed))
         
         mines_left = self.num_mines - sum(1 for r in range(self.rows) for c in range(self.cols) if self.grid[r][c]['flagged'])
-        mines_text = self.font.render(f"Mines: {mines_left}", True, COLORS["TEXT"])
-        mines_rect = mines_text.get_rect(topright=(self.offset_x + self.cols * self.cell_size, self.offset_y - 30))
-        self.screen.blit(mines_text, mines_rect)
+        mines_text = f"Mines: {mines_left}"
+        mines_surf = self.text.render_hud(self.font, mines_text, COLORS["TEXT"])
+        mines_rect = mines_surf.get_rect(topright=(self.offset_x + self.cols * self.cell_size, self.offset_y - 30))
+        self.screen.blit(mines_surf, mines_rect)
+        self.dirty_tracker.track("mines", mines_rect, mines_left)
 
         if self.game_over:
             self.draw_game_over_overlay("GAME OVER")
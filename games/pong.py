@@ -1,13 +1,12 @@
 import pygame
-import random
 from settings import *
 from games.base_game import BaseGame
 
 class PongGame(BaseGame):
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Pong"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Pong", clock=None, input_source=None):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_HUD)
+        self.font = self.text.get_font(FONT_SIZE_HUD)
         self.reset()
 
     def reset(self):
@@ -15,8 +14,9 @@ class PongGame(BaseGame):
         self.paddle_right = pygame.Rect(SCREEN_WIDTH - 20 - PONG_PADDLE_WIDTH, SCREEN_HEIGHT // 2 - PONG_PADDLE_HEIGHT // 2, PONG_PADDLE_WIDTH, PONG_PADDLE_HEIGHT)
         self.ball = pygame.Rect(SCREEN_WIDTH // 2 - PONG_BALL_RADIUS, SCREEN_HEIGHT // 2 - PONG_BALL_RADIUS, PONG_BALL_RADIUS * 2, PONG_BALL_RADIUS * 2)
         
-        self.ball_speed_x = PONG_BALL_SPEED_X * random.choice((1, -1))
-        self.ball_speed_y = PONG_BALL_SPEED_Y * random.choice((1, -1))
+        self.ball_speed_x = PONG_BALL_SPEED_X * self.rng.choice((1, -1))
+        self.ball_speed_y = PONG_BALL_SPEED_Y * self.rng.choice((1, -1))
+        self.prev_ball_pos = self.ball.topleft
         
         self.score_left = 0
         self.score_right = 0
@@ -41,7 +41,7 @@ class PongGame(BaseGame):
             return
 
         # Player Movement (Left Paddle)
-        keys = pygame.key.get_pressed()
+        keys = self.get_pressed()
         if keys[pygame.K_w] or keys[pygame.K_UP]:
             self.paddle_left.y -= PONG_PADDLE_SPEED
         if keys[pygame.K_s] or keys[pygame.K_DOWN]:
@@ -61,6 +61,7 @@ class PongGame(BaseGame):
         self.paddle_right.clamp_ip(self.screen.get_rect())
 
         # Ball Movement
+        self.prev_ball_pos = self.ball.topleft
         self.ball.x += self.ball_speed_x
         self.ball.y += self.ball_speed_y
 
@@ -103,8 +104,9 @@ class PongGame(BaseGame):
 
     def _reset_ball(self):
         self.ball.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        self.ball_speed_x = PONG_BALL_SPEED_X * random.choice((1, -1))
-        self.ball_speed_y = PONG_BALL_SPEED_Y * random.choice((1, -1))
+        self.prev_ball_pos = self.ball.topleft
+        self.ball_speed_x = PONG_BALL_SPEED_X * self.rng.choice((1, -1))
+        self.ball_speed_y = PONG_BALL_SPEED_Y * self.rng.choice((1, -1))
 
     def draw(self):
         self.screen.fill(COLORS["BACKGROUND"])
@@ -116,13 +118,14 @@ class PongGame(BaseGame):
         pygame.draw.rect(self.screen, COLORS["PADDLE"], self.paddle_left)
         pygame.draw.rect(self.screen, COLORS["ENEMY"], self.paddle_right)
 
-        # Draw Ball
-        pygame.draw.ellipse(self.screen, COLORS["BALL"], self.ball)
+        # Draw Ball (interpolated between ticks)
+        ball_draw_rect = self.ball.copy()
+        ball_draw_rect.topleft = self.interpolate_pos(self.prev_ball_pos, self.ball.topleft)
+        pygame.draw.ellipse(self.screen, COLORS["BALL"], ball_draw_rect)
 
         # Draw Scores
-        score_text = self.font.render(f"{self.score_left}   {self.score_right}", True, COLORS["TEXT"])
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 30))
-        self.screen.blit(score_text, score_rect)
+        score_surf = self.text.render_hud(self.font, f"{self.score_left}   {self.score_right}", COLORS["TEXT"])
+        self.screen.blit(score_surf, score_surf.get_rect(center=(SCREEN_WIDTH // 2, 30)))
 
         if self.game_over:
             msg = "YOU WIN!" if self.winner == "PLAYER" else "YOU LOSE!"
@@ -0,0 +1,102 @@
+import importlib
+from collections import OrderedDict
+
+from settings import *
+
+# Menu order. Only metadata lives here: (menu name, module, class name), plus
+# optionally a dict of extra constructor arguments for variants of a game.
+# Modules are imported and games constructed the first time they're selected.
+GAME_ENTRIES = [
+    ("Tetris", "games.tetris", "TetrisGame"),
+    ("Snake", "games.snake", "SnakeGame"),
+    ("Snake XL", "games.snake", "SnakeGame", {"grid_size": SNAKE_LARGE_GRID}),
+    ("Snake Arena", "games.snake_arena", "SnakeArenaGame"),
+    ("Breakout", "games.breakout", "BreakoutGame"),
+    ("Pong", "games.pong", "PongGame"),
+    ("Invaders", "games.invaders", "InvadersGame"),
+    ("Flappy", "games.flappy", "FlappyGame"),
+    ("Minesweeper", "games.minesweeper", "MinesweeperGame"),
+    ("Memory", "games.memory", "MemoryGame"),
+    ("Asteroids", "games.asteroids", "AsteroidsGame"),
+]
+
+
+def load_game_class(module_name, class_name):
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def find_entry(name, entries=GAME_ENTRIES):
+    """(module, class name, constructor kwargs) of the entry called name."""
+    for entry_name, module_name, class_name, *options in entries:
+        if entry_name == name:
+            return module_name, class_name, (options[0] if options else {})
+    raise KeyError(name)
+
+
+class GameRegistry:
+    """
+    Lazily constructed games, looked up by menu name.
+
+    Behaves like the {"Name": GameInstance} dict MainMenu used to get, but
+    nothing is imported or built until registry[name] is first accessed.
+    With max_live set, the least recently used instances beyond that count
+    are dropped (they're rebuilt on next selection; set_state resets them
+    anyway).
+    """
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None,
+                 clock=None, entries=GAME_ENTRIES, max_live=None):
+        self.screen = screen
+        self.return_to_menu = return_to_menu_callback
+        self.highscore_manager = highscore_manager
+        self.sound_manager = sound_manager
+        self.clock = clock
+        self.entries = OrderedDict((entry[0], find_entry(entry[0], entries)) for entry in entries)
+        self.max_live = max_live
+        self.instances = OrderedDict()  # Least recently used first
+
+    def keys(self):
+        return list(self.entries.keys())
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __getitem__(self, name):
+        game = self.instances.get(name)
+        if game is None:
+            game = self._create(name)
+            self.instances[name] = game
+            self._evict_over_limit(keep=name)
+        else:
+            self.instances.move_to_end(name)
+        return game
+
+    def is_loaded(self, name):
+        return name in self.instances
+
+    def get_class(self, name):
+        module_name, class_name, _ = self.entries[name]
+        return load_game_class(module_name, class_name)
+
+    def evict(self, name):
+        """Drops a constructed instance, if any. Returns True if one was dropped."""
+        return self.instances.pop(name, None) is not None
+
+    def _create(self, name):
+        game_class = self.get_class(name)
+        return game_class(self.screen, self.return_to_menu, self.highscore_manager, self.sound_manager,
+                          name, clock=self.clock, **self.entries[name][2])
+
+    def _evict_over_limit(self, keep):
+        if self.max_live is None:
+            return
+        for name in list(self.instances):
+            if len(self.instances) <= self.max_live:
+                break
+            if name != keep:
+                del self.instances[name]
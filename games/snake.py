@@ -1,17 +1,32 @@
 import pygame
-import random
+from array import array
+from collections import deque
 from settings import *
 from games.base_game import BaseGame
+from games.snake_ai import SnakeAutopilot
 
 class SnakeGame(BaseGame):
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Snake"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Snake", clock=None, input_source=None, grid_size=None):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
+        self.grid_width, self.grid_height = grid_size or (SNAKE_GRID_WIDTH, SNAKE_GRID_HEIGHT)
+        # World bigger than the screen: scroll a camera over it (see draw)
+        self.scrolling = (self.grid_width * SNAKE_CELL_SIZE > SCREEN_WIDTH or
+                          self.grid_height * SNAKE_CELL_SIZE > SCREEN_HEIGHT)
+        # 0..n-1, copied (a memcpy) to seed the free-cell index on every reset
+        self.all_cells = array('i', range(self.grid_width * self.grid_height))
+        self.grid_tile = None
+        self.segment_sprite = None
         self.reset()
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_HUD)
+        self.font = self.text.get_font(FONT_SIZE_HUD)
 
     def reset(self):
-        self.snake = [(5, 5), (4, 5), (3, 5)]
+        head_x, head_y = (self.grid_width // 2, self.grid_height // 2) if self.scrolling else (5, 5)
+        self.set_body([(head_x, head_y), (head_x - 1, head_y), (head_x - 2, head_y)])
+        self.camera = None  # Top-left of the view in world pixels; snaps to the head on first draw
+        self.game_over_time = 0
+        if self.autopilot:
+            self.autopilot.reset()
         self.direction = (1, 0)
         self.next_direction = (1, 0)
         self.food = self._get_random_position()
@@ -23,14 +38,54 @@ class SnakeGame(BaseGame):
         self.move_interval = 150  # milliseconds
         self.active_powerups = [] # List of {'type': type, 'end_time': time}
 
+    def set_body(self, cells):
+        """
+        Replaces the snake (head first) and rebuilds the lookup structures:
+        - occupied: one byte per cell, 1 where the body is (O(1) collisions)
+        - free_cells: indices of every other cell, with free_slot[cell] giving
+          its position there (-1 if occupied), so cells move in and out with
+          a swap-and-pop and a random free cell is a single pick
+        """
+        self.snake = deque(cells)
+        # Built in O(body), not O(board): start with every cell free, then occupy the body
+        self.occupied = bytearray(len(self.all_cells))
+        self.free_cells = self.all_cells[:]
+        self.free_slot = self.all_cells[:]
+        for pos in self.snake:
+            self._occupy(pos)
+
+    def _occupy(self, pos):
+        cell = pos[1] * self.grid_width + pos[0]
+        self.occupied[cell] = 1
+        # Swap-and-pop the cell out of the free list
+        slot = self.free_slot[cell]
+        last = self.free_cells.pop()
+        if last != cell:
+            self.free_cells[slot] = last
+            self.free_slot[last] = slot
+        self.free_slot[cell] = -1
+
+    def _vacate(self, pos):
+        cell = pos[1] * self.grid_width + pos[0]
+        self.occupied[cell] = 0
+        self.free_slot[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
+
     def _get_random_position(self):
-        while True:
-            pos = (random.randint(0, SNAKE_GRID_WIDTH - 1),
-                   random.randint(0, SNAKE_GRID_HEIGHT - 1))
-            if pos not in self.snake:
-                return pos
+        # Any cell not under the snake; None once the board is full
+        if not self.free_cells:
+            return None
+        cell = self.free_cells[self.rng.randrange(len(self.free_cells))]
+        return (cell % self.grid_width, cell // self.grid_width)
+
+    def create_autopilot(self):
+        # A deadline makes moves depend on timing, so recorded sessions go by the node budget alone
+        return SnakeAutopilot(self, time_budget_ms=None if self.recorded else SNAKE_AI_TIME_BUDGET_MS)
 
     def handle_events(self, event):
+        if self.handle_autopilot_key(event):
+            return
+
         if self.game_over:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                 self.reset()
@@ -52,15 +107,18 @@ class SnakeGame(BaseGame):
 
     def update(self):
         if self.game_over:
+            self.restart_attract_mode()
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = self.get_ticks()
+        if self.autopilot:
+            self.autopilot.tick()
         
         # Powerup Spawning
-        if self.powerup is None and random.random() < 0.005: # Chance per frame
+        if self.powerup is None and self.free_cells and self.rng.random() < 0.005: # Chance per frame
              self.powerup = {
                  'pos': self._get_random_position(),
-                 'type': random.choice(['SPEED', 'SLOW', 'BONUS', 'CUT']),
+                 'type': self.rng.choice(['SPEED', 'SLOW', 'BONUS', 'CUT']),
                  'spawn_time': current_time
              }
         
@@ -78,16 +136,15 @@ class SnakeGame(BaseGame):
         dx, dy = self.direction
         new_head = (head_x + dx, head_y + dy)
 
-        # Check collisions (Walls or Self)
-        if (new_head in self.snake or
-            new_head[0] < 0 or new_head[0] >= SNAKE_GRID_WIDTH or
-            new_head[1] < 0 or new_head[1] >= SNAKE_GRID_HEIGHT):
-            self.game_over = True
-            self.play_sound("gameover")
-            self.check_and_save_highscore(self.score)
+        # Check collisions (Walls or Self; the tail cell counts, as it hasn't moved yet)
+        if (new_head[0] < 0 or new_head[0] >= self.grid_width or
+            new_head[1] < 0 or new_head[1] >= self.grid_height or
+            self.occupied[new_head[1] * self.grid_width + new_head[0]]):
+            self.end_game()
             return
 
-        self.snake.insert(0, new_head)
+        self.snake.appendleft(new_head)
+        self._occupy(new_head)
 
         # Check Food
         if new_head == self.food:
@@ -104,7 +161,7 @@ class SnakeGame(BaseGame):
             self.powerup = None
             self.play_sound("select") # Use select sound for powerup
         else:
-            self.snake.pop()
+            self._vacate(self.snake.pop())
 
     def _apply_powerup(self, p_type):
         if p_type == 'SPEED':
@@ -119,70 +176,137 @@ class SnakeGame(BaseGame):
             if len(self.snake) > 3:
                 # Cut half the tail
                 cut_len = len(self.snake) // 2
-                self.snake = self.snake[:len(self.snake) - cut_len]
+                for _ in range(cut_len):
+                    self._vacate(self.snake.pop())
                 self.score += 5
 
+    def _update_camera(self):
+        world_w = self.grid_width * SNAKE_CELL_SIZE
+        world_h = self.grid_height * SNAKE_CELL_SIZE
+        head_x, head_y = self.snake[0]
+        target_x = min(max(0, head_x * SNAKE_CELL_SIZE - SCREEN_WIDTH // 2), max(0, world_w - SCREEN_WIDTH))
+        target_y = min(max(0, head_y * SNAKE_CELL_SIZE - SCREEN_HEIGHT // 2), max(0, world_h - SCREEN_HEIGHT))
+        if self.camera is None:
+            self.camera = [target_x, target_y]
+        else:
+            self.camera[0] += (target_x - self.camera[0]) * SNAKE_CAMERA_SMOOTHING
+            self.camera[1] += (target_y - self.camera[1]) * SNAKE_CAMERA_SMOOTHING
+        return int(self.camera[0]), int(self.camera[1])
+
+    def _build_sprites(self):
+        # Grid lines for one screen plus a cell of slack, scrolled by the camera's sub-cell offset
+        cell = SNAKE_CELL_SIZE
+        self.grid_tile = pygame.Surface((SCREEN_WIDTH + cell, SCREEN_HEIGHT + cell))
+        self.grid_tile.fill(COLORS["BACKGROUND"])
+        for x in range(0, SCREEN_WIDTH + cell, cell):
+            pygame.draw.line(self.grid_tile, (20, 20, 30), (x, 0), (x, SCREEN_HEIGHT + cell))
+        for y in range(0, SCREEN_HEIGHT + cell, cell):
+            pygame.draw.line(self.grid_tile, (20, 20, 30), (0, y), (SCREEN_WIDTH + cell, y))
+
+        # Body segment (Rounded Rect), blitted for every visible body cell
+        self.segment_sprite = pygame.Surface((cell - 2, cell - 2), pygame.SRCALPHA)
+        pygame.draw.rect(self.segment_sprite, COLORS["ACCENT"], self.segment_sprite.get_rect(), border_radius=5)
+
     def draw(self):
-        self.screen.fill(COLORS["BACKGROUND"])
-
-        # Draw Grid (Subtle)
-        for x in range(0, SCREEN_WIDTH, SNAKE_CELL_SIZE):
-            pygame.draw.line(self.screen, (20, 20, 30), (x, 0), (x, SCREEN_HEIGHT))
-        for y in range(0, SCREEN_HEIGHT, SNAKE_CELL_SIZE):
-            pygame.draw.line(self.screen, (20, 20, 30), (0, y), (SCREEN_WIDTH, y))
-
-        # Draw Snake (Rounded Rects)
-        for i, (x, y) in enumerate(self.snake):
-            rect = pygame.Rect(x * SNAKE_CELL_SIZE + 1, y * SNAKE_CELL_SIZE + 1,
-                             SNAKE_CELL_SIZE - 2, SNAKE_CELL_SIZE - 2)
-            color = COLORS["SUCCESS"] if i == 0 else COLORS["ACCENT"] # Head is different
-            
-            # Rounded corners
-            pygame.draw.rect(self.screen, color, rect, border_radius=5)
-            
-            # Eyes for Head
-            if i == 0:
-                eye_radius = 2
-                offset = 5
-                # Simple logic to position eyes based on direction
-                dx, dy = self.direction
-                eye1_pos = (rect.centerx - offset if dx == 0 else rect.centerx, rect.centery - offset if dy == 0 else rect.centery)
-                eye2_pos = (rect.centerx + offset if dx == 0 else rect.centerx, rect.centery + offset if dy == 0 else rect.centery)
-                if dx != 0: eye1_pos, eye2_pos = (rect.centerx + dx*3, rect.centery - offset), (rect.centerx + dx*3, rect.centery + offset)
-                if dy != 0: eye1_pos, eye2_pos = (rect.centerx - offset, rect.centery + dy*3), (rect.centerx + offset, rect.centery + dy*3)
-                
-                pygame.draw.circle(self.screen, COLORS["BLACK"], eye1_pos, eye_radius)
-                pygame.draw.circle(self.screen, COLORS["BLACK"], eye2_pos, eye_radius)
+        if self.grid_tile is None:
+            self._build_sprites()
+        cell = SNAKE_CELL_SIZE
+        cam_x, cam_y = self._update_camera()
+
+        # Draw Grid (Subtle), one cached tile
+        self.screen.blit(self.grid_tile, (-(cam_x % cell), -(cam_y % cell)))
 
+        # Visible cells only; body found by scanning the occupancy rows in view,
+        # so the cost follows the viewport, not the snake's length
+        x0, y0 = cam_x // cell, cam_y // cell
+        x1 = min(self.grid_width, (cam_x + SCREEN_WIDTH) // cell + 1)
+        y1 = min(self.grid_height, (cam_y + SCREEN_HEIGHT) // cell + 1)
+        occupied = self.occupied
+        sprite = self.segment_sprite
+        segments = []
+        for y in range(y0, y1):
+            row = y * self.grid_width
+            index = occupied.find(1, row + x0, row + x1)
+            while index != -1:
+                segments.append((sprite, ((index - row) * cell + 1 - cam_x, y * cell + 1 - cam_y)))
+                index = occupied.find(1, index + 1, row + x1)
+        self.screen.blits(segments, doreturn=False)
+
+        # Head (different colour, with eyes) over its body segment
+        head_x, head_y = self.snake[0]
+        rect = pygame.Rect(head_x * cell + 1 - cam_x, head_y * cell + 1 - cam_y, cell - 2, cell - 2)
+        if self.screen.get_rect().colliderect(rect):
+            pygame.draw.rect(self.screen, COLORS["SUCCESS"], rect, border_radius=5)
+            eye_radius = 2
+            offset = 5
+            # Simple logic to position eyes based on direction
+            dx, dy = self.direction
+            eye1_pos = (rect.centerx - offset if dx == 0 else rect.centerx, rect.centery - offset if dy == 0 else rect.centery)
+            eye2_pos = (rect.centerx + offset if dx == 0 else rect.centerx, rect.centery + offset if dy == 0 else rect.centery)
+            if dx != 0: eye1_pos, eye2_pos = (rect.centerx + dx*3, rect.centery - offset), (rect.centerx + dx*3, rect.centery + offset)
+            if dy != 0: eye1_pos, eye2_pos = (rect.centerx - offset, rect.centery + dy*3), (rect.centerx + offset, rect.centery + dy*3)
+
+            pygame.draw.circle(self.screen, COLORS["BLACK"], eye1_pos, eye_radius)
+            pygame.draw.circle(self.screen, COLORS["BLACK"], eye2_pos, eye_radius)
 
         # Draw Food (Circle)
-        fx, fy = self.food
-        food_center = (fx * SNAKE_CELL_SIZE + SNAKE_CELL_SIZE // 2, fy * SNAKE_CELL_SIZE + SNAKE_CELL_SIZE // 2)
-        pygame.draw.circle(self.screen, COLORS["HIGHLIGHT"], food_center, SNAKE_CELL_SIZE // 2 - 2)
+        if self.food:
+            fx, fy = self.food
+            food_center = (fx * cell + cell // 2 - cam_x, fy * cell + cell // 2 - cam_y)
+            pygame.draw.circle(self.screen, COLORS["HIGHLIGHT"], food_center, cell // 2 - 2)
 
         # Draw Powerup
         if self.powerup:
             px, py = self.powerup['pos']
-            p_rect = pygame.Rect(px * SNAKE_CELL_SIZE, py * SNAKE_CELL_SIZE,
-                                 SNAKE_CELL_SIZE, SNAKE_CELL_SIZE)
-            
+            p_rect = pygame.Rect(px * cell - cam_x, py * cell - cam_y, cell, cell)
+
             p_color = COLORS["WHITE"]
             if self.powerup['type'] == 'SPEED': p_color = COLORS["DANGER"]
             elif self.powerup['type'] == 'SLOW': p_color = COLORS["PADDLE"]
             elif self.powerup['type'] == 'BONUS': p_color = COLORS["WARNING"]
             elif self.powerup['type'] == 'CUT': p_color = (100, 100, 100)
-            
+
             # Star shape or just a smaller circle with ring
-            pygame.draw.circle(self.screen, p_color, p_rect.center, SNAKE_CELL_SIZE // 2 - 2)
-            pygame.draw.circle(self.screen, COLORS["WHITE"], p_rect.center, SNAKE_CELL_SIZE // 2 - 2, 1)
+            pygame.draw.circle(self.screen, p_color, p_rect.center, cell // 2 - 2)
+            pygame.draw.circle(self.screen, COLORS["WHITE"], p_rect.center, cell // 2 - 2, 1)
+
+        if self.scrolling:
+            self._draw_world_edges(cam_x, cam_y)
+            self._draw_minimap(cam_x, cam_y)
 
         # Draw Score
-        score_surf = self.font.render(f"Score: {self.score}", True, COLORS["TEXT"])
-        self.screen.blit(score_surf, (10, 10))
+        self.text.draw_hud(self.screen, self.font, f"Score: {self.score}", COLORS["TEXT"], (10, 10))
+        self.draw_autopilot_hud(self.font, (10, 40))
 
         if self.game_over:
             self.draw_game_over_overlay(f"Score: {self.score}")
 
+    def _draw_world_edges(self, cam_x, cam_y):
+        world = pygame.Rect(-cam_x, -cam_y, self.grid_width * SNAKE_CELL_SIZE, self.grid_height * SNAKE_CELL_SIZE)
+        pygame.draw.rect(self.screen, COLORS["DANGER"], world, 2)
+
+    def _draw_minimap(self, cam_x, cam_y):
+        # Whole world scaled down: view, head, food and powerup (the body would cost O(length))
+        size = SNAKE_MINIMAP_SIZE
+        frame = pygame.Rect(SCREEN_WIDTH - size - 10, SCREEN_HEIGHT - size - 10, size, size)
+        pygame.draw.rect(self.screen, COLORS["BACKGROUND"], frame)
+        pygame.draw.rect(self.screen, COLORS["GRID"], frame, 1)
+        scale_x = size / self.grid_width
+        scale_y = size / self.grid_height
+
+        def to_map(x, y):
+            return (frame.left + int(x * scale_x), frame.top + int(y * scale_y))
+
+        view = pygame.Rect(to_map(cam_x / SNAKE_CELL_SIZE, cam_y / SNAKE_CELL_SIZE),
+                           (max(2, int(SCREEN_WIDTH / SNAKE_CELL_SIZE * scale_x)),
+                            max(2, int(SCREEN_HEIGHT / SNAKE_CELL_SIZE * scale_y))))
+        pygame.draw.rect(self.screen, COLORS["TEXT"], view, 1)
+        if self.food:
+            pygame.draw.circle(self.screen, COLORS["HIGHLIGHT"], to_map(*self.food), 2)
+        if self.powerup:
+            pygame.draw.circle(self.screen, COLORS["WARNING"], to_map(*self.powerup['pos']), 2)
+        pygame.draw.circle(self.screen, COLORS["SUCCESS"], to_map(*self.snake[0]), 2)
+
     def _draw_game_over(self):
         # Deprecated, using BaseGame.draw_game_over_overlay
         pass
\ No newline at end of file
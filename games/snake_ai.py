@@ -0,0 +1,333 @@
+import heapq
+import time
+from array import array
+from settings import *
+
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DEADLINE_EVERY = 4  # Nodes or cells between deadline checks (a few microseconds of work)
+
+
+def flood_fill(width, height, blocked, start, limit, deadline=None):
+    """
+    Free cells (blocked[cell] false) reachable from start, counting no
+    further than limit, or than the cells counted by deadline.
+    """
+    seen = {start}
+    stack = [start]
+    popped = 0
+    while stack and len(seen) < limit:
+        if deadline is not None and popped % DEADLINE_EVERY == 0 and time.perf_counter() > deadline:
+            break
+        popped += 1
+        cell = stack.pop()
+        x, y = cell % width, cell // width
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                neighbour = ny * width + nx
+                if not blocked[neighbour] and neighbour not in seen:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+    return min(len(seen), limit)
+
+
+class BoardOverlay:
+    """
+    A board with some cells changed, read like the bytearray it overlays.
+    Costs the changed cells only, where a copy would cost the whole board.
+    """
+    def __init__(self, base, changes):
+        self.base = base
+        self.changes = changes  # cell -> 0/1
+
+    def __getitem__(self, cell):
+        value = self.changes.get(cell)
+        return self.base[cell] if value is None else value
+
+
+class PathSearch:
+    """
+    A* over the snake grid, grown outward from root until it reaches goal,
+    run a few hundred nodes at a time. Cells are indices (y * width + x).
+
+    Searching from the target back towards the head means the tree stays
+    useful while the head keeps moving: once any cell is in the tree,
+    parent[] walks from it to the root.
+    """
+    def __init__(self, width, height, blocked, root, goal):
+        self.width = width
+        self.height = height
+        self.blocked = blocked
+        self.root = root
+        self.goal = goal
+        self.parent = {root: None}  # cell -> next cell towards root
+        self.cost = {root: 0}
+        # Heap of (f, -g, cell): among equal f, deeper nodes first, so on open
+        # ground A* runs straight at the goal instead of widening a diamond
+        self.open = [(self._estimate(root), 0, root)]
+        self.failed = False
+
+    @property
+    def found(self):
+        return self.goal in self.parent
+
+    def reaches(self, cell):
+        return cell in self.parent
+
+    def _estimate(self, cell):
+        width = self.width
+        return abs(cell % width - self.goal % width) + abs(cell // width - self.goal // width)
+
+    def run(self, budget, deadline=None):
+        """Pops up to budget nodes (stopping early at deadline). Returns the number popped."""
+        width, height = self.width, self.height
+        blocked, parent, cost, open_list = self.blocked, self.parent, self.cost, self.open
+        goal = self.goal
+        goal_x, goal_y = goal % width, goal // width
+        heappop, heappush = heapq.heappop, heapq.heappush
+        expanded = 0
+        while open_list and goal not in parent and expanded < budget:
+            # Checked before popping, so a node is never taken off the heap and left unexpanded
+            if deadline is not None and expanded % DEADLINE_EVERY == 0 and time.perf_counter() > deadline:
+                break
+            _, negative_g, cell = heappop(open_list)
+            expanded += 1
+            g = -negative_g
+            if g > cost[cell]:
+                continue  # Stale heap entry
+            x, y = cell % width, cell // width
+            g += 1
+            # Neighbours inlined (right, left, down, up) with the Manhattan estimate
+            for neighbour, nx, ny in ((cell + 1, x + 1, y), (cell - 1, x - 1, y),
+                                      (cell + width, x, y + 1), (cell - width, x, y - 1)):
+                if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                    continue
+                if blocked[neighbour] and neighbour != goal:
+                    continue
+                known = cost.get(neighbour)
+                if known is None or g < known:
+                    cost[neighbour] = g
+                    parent[neighbour] = cell
+                    heappush(open_list, (g + abs(nx - goal_x) + abs(ny - goal_y), -g, neighbour))
+        if not open_list and not self.found:
+            self.failed = True
+        return expanded
+
+    def path_from(self, cell):
+        """Cells from cell (excluded) to the root (included)."""
+        path = []
+        cell = self.parent[cell]
+        while cell is not None:
+            path.append(cell)
+            cell = self.parent[cell]
+        return path
+
+
+class SnakeAutopilot:
+    """
+    Steers a SnakeGame by setting next_direction every tick.
+
+    The target is the nearer of food and powerup. A path to it is searched
+    backwards from the target (PathSearch); once found, the snake's body is
+    simulated along it and a second search checks that the tail is still
+    reachable from the target afterwards. Targets failing that check are
+    skipped in favour of chasing the tail. While a search is unfinished the
+    snake takes a greedy move that a small flood fill says isn't a dead end.
+
+    Each tick stops at time_budget_ms (SNAKE_AI_TIME_BUDGET_MS), one deadline
+    for the search, the safety check and the fallback's flood fills alike,
+    and at node_budget search nodes. Pass time_budget_ms=None where runs
+    must be deterministic (recorded sessions, benchmarks): the node budget
+    alone then caps the work, though not the time it takes.
+
+    As a HeadlessRunner controller (SnakeGame makes its own for attract mode,
+    with the deadline unless the session is being recorded):
+
+        autopilot = SnakeAutopilot()
+        runner.run(10000, autopilot)
+        print(autopilot.stats())  # Planning time per tick
+    """
+    def __init__(self, game=None, node_budget=SNAKE_AI_NODE_BUDGET, time_budget_ms=SNAKE_AI_TIME_BUDGET_MS):
+        self.node_budget = node_budget
+        self.time_budget_ms = time_budget_ms
+        self.game = None
+        self.expanded_total = 0
+        self.ticks = 0
+        self.tick_ms = array('f')  # Planning time of every tick, for stats()
+        if game is not None:
+            self.attach(game)
+
+    def attach(self, game):
+        self.game = game
+        self.reset()
+
+    def reset(self):
+        self.search = None       # PathSearch towards target (or the tail)
+        self.target = None       # Cell being searched for; None when chasing the tail
+        self.check = None        # PathSearch verifying the tail stays reachable
+        self.safe = False        # Current food/powerup path passed the check
+        self.unsafe_target = None
+        self.unsafe_since = 0
+
+    def __call__(self, runner):
+        """HeadlessRunner controller interface."""
+        if self.game is not runner.game:
+            self.attach(runner.game)
+        self.tick()
+        return None
+
+    def stats(self):
+        times = sorted(self.tick_ms)
+        if not times:
+            return {"ticks": 0}
+
+        def percentile(fraction):
+            return round(times[min(len(times) - 1, int(fraction * len(times)))], 3)
+        return {
+            "ticks": len(times),
+            "nodes_per_tick": round(self.expanded_total / len(times), 1),
+            "plan_ms_p50": percentile(0.50),
+            "plan_ms_p99": percentile(0.99),
+            "plan_ms_max": round(times[-1], 3),
+        }
+
+    def tick(self):
+        game = self.game
+        if game.game_over:
+            return
+        start = time.perf_counter()
+        self._plan(start)
+        self.tick_ms.append((time.perf_counter() - start) * 1000)
+
+    def _plan(self, start):
+        game = self.game
+        self.ticks += 1
+        if self.unsafe_target is not None and self.ticks - self.unsafe_since > SNAKE_AI_RETRY_TICKS:
+            self.unsafe_target = None  # The body has moved on; worth another look
+        budget = self.node_budget
+        deadline = None
+        if self.time_budget_ms is not None:
+            deadline = start + self.time_budget_ms / 1000
+
+        width = game.grid_width
+        head = self._cell(game.snake[0])
+        target = self._choose_target(head)
+
+        if self.search is None or self.target != target or self.search.failed:
+            self._start_search(target, head)
+        elif self.search.goal != head and not self.search.reaches(head) and (
+                self.search.found or len(self.search.parent) > self._stale_limit(self.search)):
+            # Either got to where the head was after it wandered off the tree, or
+            # the old head is walled in by the body that followed it; aim at the head again
+            self._start_search(target, head)
+        search = self.search
+        if not search.reaches(head):
+            budget -= search.run(budget, deadline)
+            if search.failed and self.target is not None:
+                self._mark_unsafe()  # Unreachable for now; chase the tail instead
+
+        if self.search is not None and self.search.reaches(head) and self.target is not None and not self.safe:
+            budget -= self._run_safety_check(head, budget, deadline)
+
+        self.expanded_total += self.node_budget - budget
+        direction = self._planned_direction(head, width)
+        if direction is None:
+            direction = self._fallback_direction(head, target, deadline)
+        if direction is not None:
+            game.next_direction = direction
+
+    def _cell(self, pos):
+        return pos[1] * self.game.grid_width + pos[0]
+
+    def _distance(self, a, b):
+        width = self.game.grid_width
+        return abs(a % width - b % width) + abs(a // width - b // width)
+
+    def _stale_limit(self, search):
+        """Tree size past which a search for an old head position is given up on."""
+        return SNAKE_AI_STALE_FACTOR * (self._distance(search.root, search.goal) + len(self.game.snake))
+
+    def _choose_target(self, head):
+        game = self.game
+        candidates = []
+        if game.food:
+            candidates.append(self._cell(game.food))
+        if game.powerup:
+            candidates.append(self._cell(game.powerup['pos']))
+        candidates = [cell for cell in candidates if cell != self.unsafe_target]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda cell: self._distance(head, cell))
+
+    def _start_search(self, target, head):
+        game = self.game
+        self.target = target
+        self.check = None
+        self.safe = False
+        # No (safe) target: search towards where the tail is now; it will have moved on by then
+        root = target if target is not None else self._cell(game.snake[-1])
+        self.search = PathSearch(game.grid_width, game.grid_height, game.occupied, root, head)
+
+    def _run_safety_check(self, head, budget, deadline):
+        game = self.game
+        if self.check is None:
+            path = self.search.path_from(head)
+            body = game.snake
+            length = len(body)
+            steps = len(path)
+            # Body after following the path and eating at its end: the path
+            # (reversed) followed by the first length + 1 - steps old cells.
+            # Only cells that change are stored, so this costs the path, not the board.
+            changes = dict.fromkeys(path, 1)
+            for k in range(1, min(steps - 1, length) + 1):
+                changes[self._cell(body[-k])] = 0
+            if steps > length + 1:
+                for cell in path[:steps - length - 1]:
+                    changes[cell] = 0
+            new_tail = path[steps - 1 - length] if steps > length else self._cell(body[length - steps])
+            self.check = PathSearch(game.grid_width, game.grid_height, BoardOverlay(game.occupied, changes), new_tail, path[-1])
+
+        expanded = self.check.run(budget, deadline)
+        if self.check.found:
+            self.safe = True
+        elif self.check.failed:
+            self._mark_unsafe()
+        return expanded
+
+    def _mark_unsafe(self):
+        self.unsafe_target = self.target
+        self.unsafe_since = self.ticks
+        self.search = None
+
+    def _planned_direction(self, head, width):
+        search = self.search
+        if search is None or not search.reaches(head):
+            return None
+        step = search.parent[head]
+        if step is None:
+            self.search = None  # Arrived
+            return None
+        if self.game.occupied[step]:
+            self.search = None  # The body moved into the path since it was planned
+            return None
+        return (step % width - head % width, step // width - head // width)
+
+    def _fallback_direction(self, head, target, deadline=None):
+        game = self.game
+        width, height = game.grid_width, game.grid_height
+        hx, hy = head % width, head // width
+        limit = min(len(game.snake) + 1, SNAKE_AI_FLOOD_LIMIT)
+        best = None
+        for dx, dy in DIRECTIONS:
+            nx, ny = hx + dx, hy + dy
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            cell = ny * width + nx
+            if game.occupied[cell]:
+                continue
+            room = flood_fill(width, height, game.occupied, cell, limit, deadline)
+            closeness = -self._distance(cell, target) if target is not None else 0
+            score = (room, closeness)
+            if best is None or score > best[0]:
+                best = (score, (dx, dy))
+        return best[1] if best else None
@@ -0,0 +1,329 @@
+import pygame
+from array import array
+from collections import deque
+from settings import *
+from games.base_game import BaseGame
+from games.snake_ai import DIRECTIONS, flood_fill
+
+PLAYER = 0  # Index of the player's snake
+
+
+class SnakeArenaGame(BaseGame):
+    """
+    The player's snake among a crowd of AI snakes on one board.
+
+    All snakes share one occupancy grid, owner[cell] = snake index + 1 (0 when
+    free), so a collision test is one lookup however many snakes there are.
+    Moves are batched: every snake picks its next cell, the tick is resolved
+    as a whole (walls and bodies first, then heads meeting on the same cell:
+    the longer snake survives, equal lengths both die) and only then applied.
+    Dead snakes turn into food and AI snakes respawn.
+
+    The board is also kept as a surface with one pixel per cell, repainted
+    only where cells change and scaled to the screen in one call, so a frame
+    costs the same with ten snakes as with three hundred.
+    """
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Snake Arena", clock=None, input_source=None, grid_size=None, snake_count=SNAKE_ARENA_SNAKES):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
+        self.return_to_menu = return_to_menu_callback
+        self.grid_width, self.grid_height = grid_size or SNAKE_ARENA_GRID
+        self.snake_count = snake_count
+        # Largest whole cell size that fits the board on screen, centered
+        self.cell_size = max(1, min(SCREEN_WIDTH // self.grid_width, SCREEN_HEIGHT // self.grid_height))
+        self.view = pygame.Rect(0, 0, self.grid_width * self.cell_size, self.grid_height * self.cell_size)
+        self.view.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.board = pygame.Surface((self.grid_width, self.grid_height))
+        self.scaled = pygame.Surface(self.view.size)
+        self.reset()
+        self.font = self.text.get_font(FONT_SIZE_HUD)
+
+    def reset(self):
+        cells = self.grid_width * self.grid_height
+        self.owner = array('H', [0]) * cells
+        # Food: a flag per cell plus a list of food cells with each one's slot in it (swap-and-pop removal)
+        self.food = bytearray(cells)
+        self.food_cells = array('i')
+        self.food_slot = array('i', [-1]) * cells
+        self.board.fill(COLORS["BACKGROUND"])
+
+        self.palette = [self._colors(i) for i in range(self.snake_count + 1)]  # (body, head) per snake
+        self.snakes = []
+        for i in range(self.snake_count + 1):
+            snake = {'body': deque(), 'direction': (1, 0), 'next_direction': (1, 0), 'alive': False,
+                     'target': None, 'respawn_at': 0}
+            self.snakes.append(snake)
+            self._spawn(i)
+        self._top_up_food()
+
+        self.score = 0
+        self.kills = 0
+        self.game_over = False
+        self.move_timer = 0
+        self.move_interval = SNAKE_ARENA_MOVE_MS
+
+    def _colors(self, index):
+        """(body, head) colour of a snake."""
+        if index == PLAYER:
+            return COLORS["ACCENT"], COLORS["SUCCESS"]
+        body = SNAKE_ARENA_COLORS[index % len(SNAKE_ARENA_COLORS)]
+        return body, tuple((c + 255) // 2 for c in body)
+
+    def _paint(self, cell, color):
+        self.board.set_at((cell % self.grid_width, cell // self.grid_width), color)
+
+    def _spawn(self, index):
+        """Places a snake on a random free straight run of cells. Returns False if none was found."""
+        snake = self.snakes[index]
+        width, height = self.grid_width, self.grid_height
+        length = SNAKE_ARENA_START_LENGTH
+        for _ in range(20):
+            dx, dy = self.rng.choice(DIRECTIONS)
+            x, y = self.rng.randrange(width), self.rng.randrange(height)
+            # Body behind the head plus a few free cells ahead of it
+            run = [(x + dx * k, y + dy * k) for k in range(-(length - 1), length)]
+            if all(0 <= cx < width and 0 <= cy < height and not self.owner[cy * width + cx] for cx, cy in run):
+                break
+        else:
+            snake['respawn_at'] = self.get_ticks() + SNAKE_ARENA_RESPAWN_MS
+            return False
+
+        body_color, head_color = self.palette[index]
+        snake['body'] = deque(cy * width + cx for cx, cy in reversed(run[:length]))
+        for cell in snake['body']:
+            self.owner[cell] = index + 1
+            self._paint(cell, body_color)
+            if self.food[cell]:
+                self._remove_food(cell)
+        self._paint(snake['body'][0], head_color)
+        snake['direction'] = snake['next_direction'] = (dx, dy)
+        snake['alive'] = True
+        snake['target'] = None
+        return True
+
+    # --- Food ---
+
+    def _add_food(self, cell):
+        if self.food[cell] or self.owner[cell]:
+            return
+        self.food[cell] = 1
+        self.food_slot[cell] = len(self.food_cells)
+        self.food_cells.append(cell)
+        self._paint(cell, COLORS["HIGHLIGHT"])
+
+    def _remove_food(self, cell):
+        self.food[cell] = 0
+        slot = self.food_slot[cell]
+        last = self.food_cells.pop()
+        if last != cell:
+            self.food_cells[slot] = last
+            self.food_slot[last] = slot
+        self.food_slot[cell] = -1
+
+    def _top_up_food(self):
+        cells = self.grid_width * self.grid_height
+        for _ in range(SNAKE_ARENA_FOOD - len(self.food_cells)):
+            self._add_food(self.rng.randrange(cells))  # Landing on a snake just skips that one
+
+    # --- Input ---
+
+    def create_autopilot(self):
+        return True  # The player's snake thinks like the AI snakes (_think); no state of its own
+
+    def handle_events(self, event):
+        if event.type != pygame.KEYDOWN or self.handle_autopilot_key(event):
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.return_to_menu()
+            return
+        if self.game_over:
+            if event.key == pygame.K_SPACE:
+                self.reset()
+            return
+
+        player = self.snakes[PLAYER]
+        direction = player['direction']
+        if event.key == pygame.K_UP and direction != (0, 1):
+            player['next_direction'] = (0, -1)
+        elif event.key == pygame.K_DOWN and direction != (0, -1):
+            player['next_direction'] = (0, 1)
+        elif event.key == pygame.K_LEFT and direction != (1, 0):
+            player['next_direction'] = (-1, 0)
+        elif event.key == pygame.K_RIGHT and direction != (-1, 0):
+            player['next_direction'] = (1, 0)
+
+    # --- Simulation ---
+
+    def update(self):
+        # The arena keeps running under the game-over overlay
+        current_time = self.get_ticks()
+        self.restart_attract_mode()
+        if current_time - self.move_timer <= self.move_interval:
+            return
+        self.move_timer = current_time
+
+        for i, snake in enumerate(self.snakes):
+            if not snake['alive'] and current_time >= snake['respawn_at'] and (i != PLAYER or not self.game_over):
+                self._spawn(i)
+        self._step_snakes()
+        self._top_up_food()
+
+    def _step_snakes(self):
+        width, height = self.grid_width, self.grid_height
+        owner = self.owner
+
+        # 1. Every live snake picks its next cell (-1 off the board)
+        moves = []
+        for i, snake in enumerate(self.snakes):
+            if not snake['alive']:
+                continue
+            if i != PLAYER or self.autopilot:
+                snake['next_direction'] = self._think(snake)
+            snake['direction'] = dx, dy = snake['next_direction']
+            head = snake['body'][0]
+            x, y = head % width + dx, head // width + dy
+            moves.append((i, y * width + x if 0 <= x < width and 0 <= y < height else -1))
+
+        # 2. Resolve against the board as it was before anyone moved (tails count,
+        # like in Snake), then heads that arrive on the same cell
+        dead = set()
+        claims = {}
+        for i, cell in moves:
+            if cell < 0:
+                dead.add(i)
+            elif owner[cell]:
+                dead.add(i)
+                if owner[cell] - 1 == PLAYER and i != PLAYER:
+                    self.kills += 1
+            else:
+                claims.setdefault(cell, []).append(i)
+        for cell, claimants in claims.items():
+            if len(claimants) > 1:
+                longest = max(len(self.snakes[i]['body']) for i in claimants)
+                winners = [i for i in claimants if len(self.snakes[i]['body']) == longest]
+                for i in claimants:
+                    if len(winners) > 1 or i != winners[0]:
+                        dead.add(i)
+                        if winners == [PLAYER]:
+                            self.kills += 1
+
+        # 3. Apply: survivors move (and grow if they ate), the dead become food
+        for i, cell in moves:
+            if i in dead:
+                continue
+            snake = self.snakes[i]
+            body = snake['body']
+            body_color, head_color = self.palette[i]
+            self._paint(body[0], body_color)
+            body.appendleft(cell)
+            owner[cell] = i + 1
+            self._paint(cell, head_color)
+            if self.food[cell]:
+                self._remove_food(cell)
+                if i == PLAYER:
+                    self.score += 10
+                    self.play_sound("score")
+            else:
+                tail = body.pop()
+                owner[tail] = 0
+                self._paint(tail, COLORS["BACKGROUND"])
+
+        for i in sorted(dead):
+            self._kill(i)
+
+    def _kill(self, index):
+        snake = self.snakes[index]
+        for cell in snake['body']:
+            self.owner[cell] = 0
+            self._paint(cell, COLORS["BACKGROUND"])
+        for cell in list(snake['body'])[::2]:
+            self._add_food(cell)
+        snake['body'].clear()
+        snake['alive'] = False
+        snake['respawn_at'] = self.get_ticks() + SNAKE_ARENA_RESPAWN_MS
+
+        if index == PLAYER and not self.autopilot:
+            self.end_game()
+
+    # --- AI ---
+
+    def _think(self, snake):
+        """Direction for an AI snake: towards its food target, avoiding moves into tight spots."""
+        width, height = self.grid_width, self.grid_height
+        owner = self.owner
+        target = snake['target']
+        if target is None or not self.food[target]:
+            target = snake['target'] = self._pick_food(snake['body'][0])
+
+        head = snake['body'][0]
+        hx, hy = head % width, head // width
+        reverse = (-snake['direction'][0], -snake['direction'][1])
+        moves = []
+        for dx, dy in DIRECTIONS:
+            if (dx, dy) == reverse:
+                continue
+            nx, ny = hx + dx, hy + dy
+            if nx < 0 or nx >= width or ny < 0 or ny >= height or owner[ny * width + nx]:
+                continue
+            distance = abs(nx - target % width) + abs(ny - target // width) if target is not None else 0
+            moves.append((distance, nx, ny, (dx, dy)))
+        moves.sort(key=lambda move: move[0])  # Stable: ties keep DIRECTIONS order
+
+        # Closest move with enough room behind it; the flood fill only runs in
+        # tight spots (on open ground every neighbour but our own head is free)
+        best = None
+        for distance, nx, ny, direction in moves:
+            if self._free_neighbours(nx, ny) >= 3:
+                return direction
+            room = flood_fill(width, height, owner, ny * width + nx, SNAKE_ARENA_LOOKAHEAD)
+            if room >= SNAKE_ARENA_LOOKAHEAD:
+                return direction
+            if best is None or room > best[0]:
+                best = (room, direction)
+        return best[1] if best else snake['direction']
+
+    def _pick_food(self, head):
+        """Nearest of a few randomly sampled food cells, or None if there's no food."""
+        if not self.food_cells:
+            return None
+        width = self.grid_width
+        hx, hy = head % width, head // width
+        best = None
+        for _ in range(SNAKE_ARENA_FOOD_SAMPLES):
+            cell = self.food_cells[self.rng.randrange(len(self.food_cells))]
+            distance = abs(cell % width - hx) + abs(cell // width - hy)
+            if best is None or distance < best[0]:
+                best = (distance, cell)
+        return best[1]
+
+    def _free_neighbours(self, x, y):
+        width, height, owner = self.grid_width, self.grid_height, self.owner
+        count = 0
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and not owner[ny * width + nx]:
+                count += 1
+        return count
+
+    # --- Drawing ---
+
+    def draw(self):
+        self.screen.fill(COLORS["BACKGROUND"])
+        # The whole board in one scale + blit; its pixels were kept up to date as cells changed
+        pygame.transform.scale(self.board, self.view.size, self.scaled)
+        self.screen.blit(self.scaled, self.view)
+
+        player = self.snakes[PLAYER]
+        if player['alive']:
+            head = player['body'][0]
+            cell = self.cell_size
+            center = (self.view.left + (head % self.grid_width) * cell + cell // 2,
+                      self.view.top + (head // self.grid_width) * cell + cell // 2)
+            pygame.draw.circle(self.screen, COLORS["WHITE"], center, cell * 2, 1)
+
+        alive = sum(1 for snake in self.snakes if snake['alive'])
+        self.text.draw_hud(self.screen, self.font, f"Score: {self.score}  Kills: {self.kills}", COLORS["TEXT"], (10, 10))
+        self.text.draw_hud(self.screen, self.font, f"Snakes: {alive}/{len(self.snakes)}", COLORS["TEXT"], (10, 40))
+        self.draw_autopilot_hud(self.font, (10, 70))
+
+        if self.game_over:
+            self.draw_game_over_overlay(f"Score: {self.score}")
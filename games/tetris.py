@@ -1,5 +1,4 @@
 import pygame
-import random
 from settings import *
 from games.base_game import BaseGame
 
@@ -24,35 +23,198 @@ COLORS_LIST = [
     (255, 0, 0)    # Red (Z)
 ]
 
+# Bitboard: each board row is an int with column c at bit c + BOARD_PAD and the
+# padding bits on both sides set as walls, so a piece row hits the board or a
+# wall exactly when (piece row mask << (x + BOARD_PAD)) & board row is non-zero
+BOARD_PAD = 4
+PAD_BITS = (1 << BOARD_PAD) - 1
+EMPTY_ROW = PAD_BITS | (PAD_BITS << (TETRIS_COLS + BOARD_PAD))
+FULL_ROW = (1 << (TETRIS_COLS + 2 * BOARD_PAD)) - 1
+
+
+I_PIECE, O_PIECE = 0, 1
+
+# Keys that shift the piece, and which way
+SHIFT_KEYS = {pygame.K_LEFT: -1, pygame.K_RIGHT: 1}
+
+
+def shape_masks(shape):
+    """Row masks of a shape matrix, column c at bit c."""
+    return tuple(sum(1 << c for c, val in enumerate(row) if val) for row in shape)
+
+
+def shape_cells(shape):
+    """(row, column) of every block in a shape matrix."""
+    return tuple((r, c) for r, row in enumerate(shape) for c, val in enumerate(row) if val)
+
+
+def rotation_states(shape):
+    """
+    The four SRS orientations of a shape (spawn, clockwise, 180, counter-clockwise).
+    Each is (top, masks, cells): cells as (row, column) in the piece's square
+    box, masks for box rows top, top + 1, ... that have blocks.
+    """
+    size = max(len(shape), len(shape[0]))
+    offset = (size - len(shape)) // 2  # I spawns on the second row of its 4x4 box
+    box = [[0] * size for _ in range(size)]
+    for r, row in enumerate(shape):
+        box[r + offset][:len(row)] = row
+    states = []
+    for _ in range(4):
+        filled = [r for r, row in enumerate(box) if any(row)]
+        top, bottom = filled[0], filled[-1] + 1
+        states.append((top, shape_masks(box[top:bottom]), shape_cells(box)))
+        box = [list(row) for row in zip(*box[::-1])]  # Clockwise
+    return tuple(states)
+
+
+# PIECE_STATES[kind][rotation] -> (top, masks, cells)
+PIECE_STATES = tuple(rotation_states(shape) for shape in SHAPES)
+
+
+def _kicks(table):
+    # Nested tuples, kicks[from][to], so a lookup doesn't build a key. SRS
+    # tables are written with y pointing up; the board's y points down.
+    return tuple(tuple(tuple((dx, -dy) for dx, dy in table[start, end]) if (start, end) in table else None
+                       for end in range(4))
+                 for start in range(4))
+
+
+# SRS wall kicks: (from rotation, to rotation) -> offsets tried in order
+KICKS = _kicks({
+    (0, 1): ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)),
+    (1, 0): ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),
+    (1, 2): ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),
+    (2, 1): ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)),
+    (2, 3): ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),
+    (3, 2): ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),
+    (3, 0): ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),
+    (0, 3): ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),
+})
+I_KICKS = _kicks({
+    (0, 1): ((0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)),
+    (1, 0): ((0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)),
+    (1, 2): ((0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)),
+    (2, 1): ((0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)),
+    (2, 3): ((0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)),
+    (3, 2): ((0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)),
+    (3, 0): ((0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)),
+    (0, 3): ((0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)),
+})
+PIECE_KICKS = tuple(I_KICKS if kind == I_PIECE else KICKS for kind in range(len(SHAPES)))
+
+
+# Board rules as plain functions of a rows list, so the AI (games/tetris_ai.py)
+# can play them out on boards of its own. y is the row of a piece's first mask row.
+
+def spawn_position(kind):
+    """Box position (x, y) a new piece starts at: centred, top block row on the board's first row."""
+    shape = SHAPES[kind]
+    size = max(len(shape), len(shape[0]))
+    return TETRIS_COLS // 2 - size // 2, -PIECE_STATES[kind][0][0]
+
+
+def collides(rows, masks, x, y):
+    """True if row masks with bit 0 at column x overlap a wall, the floor or a block."""
+    shift = x + BOARD_PAD
+    if shift < 0 or y + len(masks) > TETRIS_ROWS:
+        return True
+    for mask in masks:
+        # Above the board only the walls count
+        if (rows[y] if y >= 0 else EMPTY_ROW) & (mask << shift):
+            return True
+        y += 1
+    return False
+
+
+def landing_row(rows, masks, x, y):
+    """Row a piece at (x, y) comes to rest on when dropped; one AND per mask row per row fallen."""
+    shift = x + BOARD_PAD
+    shifted = [mask << shift for mask in masks]
+    last = TETRIS_ROWS - len(shifted)
+    while y < last:
+        r = y + 1
+        for mask in shifted:
+            if (rows[r] if r >= 0 else EMPTY_ROW) & mask:
+                return y
+            r += 1
+        y += 1
+    return y
+
+
+def rotate(rows, kind, rotation, turn, x, y):
+    """
+    (rotation, x, y) of a piece's box after turning clockwise (turn=1) or
+    counter-clockwise (-1) with the first SRS kick that fits, or None.
+    """
+    if kind == O_PIECE:
+        return None
+    new_rotation = (rotation + turn) % 4
+    top, masks, _ = PIECE_STATES[kind][new_rotation]
+    for dx, dy in PIECE_KICKS[kind][rotation][new_rotation]:
+        if not collides(rows, masks, x + dx, y + dy + top):
+            return new_rotation, x + dx, y + dy
+    return None
+
 class TetrisGame(BaseGame):
-    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Tetris"):
-        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name)
+    def __init__(self, screen, return_to_menu_callback, highscore_manager=None, sound_manager=None, game_name="Tetris", clock=None, input_source=None, input_profile=TETRIS_INPUT_PROFILE):
+        super().__init__(screen, create_game_callback=None, game_over_callback=None, highscore_manager=highscore_manager, sound_manager=sound_manager, game_name=game_name, clock=clock, input_source=input_source)
         self.return_to_menu = return_to_menu_callback
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_HUD)
+        self.font = self.text.get_font(FONT_SIZE_HUD)
+        self.default_input_profile = input_profile
+        self.set_input_profile(input_profile)
         self.reset()
 
     def reset(self):
+        # rows: bitboard for collisions and line clears; grid: colour of each cell, for drawing
+        self.rows = [EMPTY_ROW] * TETRIS_ROWS
         self.grid = [[0 for _ in range(TETRIS_COLS)] for _ in range(TETRIS_ROWS)]
+        # Locked blocks as drawn, kept in step with grid by _lock_piece/_clear_lines; None = rebuild on next draw
+        self.locked_layer = None
         self.current_piece = self._get_new_piece()
         self.next_piece = self._get_new_piece()
         self.score = 0
         self.game_over = False
+        if self.autopilot:
+            self.autopilot.reset()
         self.drop_timer = 0
         self.drop_interval = 500
         self.fast_drop = False
+        # Held shift key (the latest pressed wins) and when it next moves the piece, in ms
+        self.shift_key = None
+        self.shift_due = 0
+
+    def start_session(self):
+        super().start_session()
+        self.set_input_profile(self.default_input_profile)
+
+    def set_input_profile(self, name):
+        """Picks the auto-shift timing (TETRIS_INPUT_PROFILES) for held left/right."""
+        self.input_profile = name
+        self.das = TETRIS_INPUT_PROFILES[name]["das"]
+        self.arr = TETRIS_INPUT_PROFILES[name]["arr"]
 
     def _get_new_piece(self):
-        shape_idx = random.randint(0, len(SHAPES) - 1)
-        shape = SHAPES[shape_idx]
-        color = COLORS_LIST[shape_idx]
+        # A piece is its kind, rotation and the top-left of its box; shapes come from PIECE_STATES
+        kind = self.rng.randint(0, len(SHAPES) - 1)
+        x, y = spawn_position(kind)
         return {
-            'shape': shape,
-            'color': color,
-            'x': TETRIS_COLS // 2 - len(shape[0]) // 2,
-            'y': 0
+            'kind': kind,
+            'rotation': 0,
+            'color': COLORS_LIST[kind],
+            'x': x,
+            'y': y
         }
 
+    def create_autopilot(self):
+        from games.tetris_ai import TetrisAutopilot  # tetris_ai builds on this module
+        # Same rule as Snake's: no deadline while the session is recorded, or its replay would diverge
+        return TetrisAutopilot(self, time_budget_ms=None if self.recorded else TETRIS_AI_TIME_BUDGET_MS)
+
     def handle_events(self, event):
+        if self.handle_autopilot_key(event):
+            return
+
         if self.game_over:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                 self.reset()
@@ -61,14 +223,14 @@ class TetrisGame(BaseGame):
             return
 
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_LEFT:
-                self._move(-1, 0)
-            elif event.key == pygame.K_RIGHT:
-                self._move(1, 0)
+            if event.key in SHIFT_KEYS:
+                self._start_shift(event.key)
             elif event.key == pygame.K_DOWN:
                 self.fast_drop = True
             elif event.key == pygame.K_UP:
-                self._rotate()
+                self._rotate(1)
+            elif event.key == pygame.K_z:
+                self._rotate(-1)
             elif event.key == pygame.K_SPACE:
                 self._hard_drop()
             elif event.key == pygame.K_ESCAPE:
@@ -79,9 +241,18 @@ class TetrisGame(BaseGame):
 
     def update(self):
         if self.game_over:
+            self.restart_attract_mode()
             return
 
-        current_time = pygame.time.get_ticks()
+        if self.autopilot:
+            self.autopilot.tick()
+            if self.game_over:
+                return
+
+        current_time = self.get_ticks()
+        if self.shift_key is not None:
+            self._auto_shift(current_time)
+
         interval = 50 if self.fast_drop else self.drop_interval
         
         if current_time - self.drop_timer > interval:
@@ -89,76 +260,112 @@ class TetrisGame(BaseGame):
             if not self._move(0, 1):
                 self._lock_piece()
 
+    def _start_shift(self, key):
+        # First step on the press itself, so the piece moves in the frame the key went down
+        self.shift_key = key
+        self.shift_due = self.get_ticks() + self.das
+        self._move(SHIFT_KEYS[key], 0)
+
+    def _auto_shift(self, now):
+        """
+        Repeats the held shift: every step that fell due since the last tick,
+        so the piece is where millisecond timing puts it even when arr is
+        shorter than a tick.
+        """
+        keys = self.get_pressed()
+        if not keys[self.shift_key]:
+            # Released; if the other direction is still held it takes over, after its own delay
+            self.shift_key = next((key for key in SHIFT_KEYS if keys[key]), None)
+            self.shift_due = now + self.das
+            return
+        moves = 0
+        while self.shift_due <= now and moves < TETRIS_COLS:
+            if not self._move(SHIFT_KEYS[self.shift_key], 0):
+                # Against a wall or the stack: stay charged and carry on from here once free
+                self.shift_due = now
+                return
+            self.shift_due += self.arr
+            moves += 1
+
+    def set_row(self, r, colors):
+        """Sets board row r from a list of colours (0 for empty); for tools and test setups."""
+        self.grid[r] = list(colors)
+        self.rows[r] = EMPTY_ROW | sum(1 << (c + BOARD_PAD) for c, color in enumerate(colors) if color)
+        self.locked_layer = None
+
     def _move(self, dx, dy):
-        new_x = self.current_piece['x'] + dx
-        new_y = self.current_piece['y'] + dy
-        if not self._check_collision(self.current_piece['shape'], new_x, new_y):
-            self.current_piece['x'] = new_x
-            self.current_piece['y'] = new_y
+        piece = self.current_piece
+        top, masks, _ = PIECE_STATES[piece['kind']][piece['rotation']]
+        new_x = piece['x'] + dx
+        new_y = piece['y'] + dy
+        if not self._check_collision(masks, new_x, new_y + top):
+            piece['x'] = new_x
+            piece['y'] = new_y
             return True
         return False
 
-    def _rotate(self):
-        shape = self.current_piece['shape']
-        new_shape = [list(row) for row in zip(*shape[::-1])] # Rotate matrix
-        if not self._check_collision(new_shape, self.current_piece['x'], self.current_piece['y']):
-            self.current_piece['shape'] = new_shape
+    def _rotate(self, turn):
+        """Rotates clockwise (turn=1) or counter-clockwise (-1), trying the SRS kicks in order."""
+        piece = self.current_piece
+        rotated = rotate(self.rows, piece['kind'], piece['rotation'], turn, piece['x'], piece['y'])
+        if rotated is None:
+            return False
+        piece['rotation'], piece['x'], piece['y'] = rotated
+        return True
 
-    def _check_collision(self, shape, x, y):
-        for r, row in enumerate(shape):
-            for c, val in enumerate(row):
-                if val:
-                    grid_x = x + c
-                    grid_y = y + r
-                    if grid_x < 0 or grid_x >= TETRIS_COLS or grid_y >= TETRIS_ROWS:
-                        return True
-                    if grid_y >= 0 and self.grid[grid_y][grid_x]:
-                        return True
-        return False
+    def _check_collision(self, masks, x, y):
+        """True if row masks placed with their first row at board row y and bit 0 at column x overlap a wall, the floor or a block."""
+        return collides(self.rows, masks, x, y)
 
     def _lock_piece(self):
-        for r, row in enumerate(self.current_piece['shape']):
-            for c, val in enumerate(row):
-                if val:
-                    grid_y = self.current_piece['y'] + r
-                    grid_x = self.current_piece['x'] + c
-                    if grid_y < 0:
-                        self.game_over = True
-                        self.play_sound("gameover")
-                        self.check_and_save_highscore(self.score)
-                        return
-                    self.grid[grid_y][grid_x] = self.current_piece['color']
-        
-        self._clear_lines()
-        self.current_piece = self.next_piece
+        piece = self.current_piece
+        top, masks, cells = PIECE_STATES[piece['kind']][piece['rotation']]
+        x, y = piece['x'], piece['y']
+        if y + top < 0:
+            self.end_game()
+            return
+        for r, mask in enumerate(masks, y + top):
+            self.rows[r] |= mask << (x + BOARD_PAD)
+        for r, c in cells:
+            self.grid[y + r][x + c] = piece['color']
+            if self.locked_layer:
+                self._draw_block(x + c, y + r, piece['color'], surface=self.locked_layer)
+
+        self._clear_lines(y + top, y + top + len(masks))
+        self.current_piece = piece = self.next_piece
         self.next_piece = self._get_new_piece()
-        
-        if self._check_collision(self.current_piece['shape'], self.current_piece['x'], self.current_piece['y']):
-            self.game_over = True
-            self.play_sound("gameover")
-            self.check_and_save_highscore(self.score)
-
-    def _clear_lines(self):
-        lines_cleared = 0
-        new_grid = [row for row in self.grid if any(cell == 0 for cell in row)]
-        lines_cleared = TETRIS_ROWS - len(new_grid)
-        for _ in range(lines_cleared):
-            new_grid.insert(0, [0 for _ in range(TETRIS_COLS)])
-        self.grid = new_grid
+
+        top, masks, _ = PIECE_STATES[piece['kind']][piece['rotation']]
+        if self._check_collision(masks, piece['x'], piece['y'] + top):
+            self.end_game()
+
+    def _clear_lines(self, top=0, bottom=TETRIS_ROWS):
+        # Only rows the last piece touched can have filled up
+        full = [r for r in range(top, bottom) if self.rows[r] == FULL_ROW]
+        for r in full:  # Top to bottom, so the indices of later rows don't move
+            del self.rows[r]
+            del self.grid[r]
+            self.rows.insert(0, EMPTY_ROW)
+            self.grid.insert(0, [0 for _ in range(TETRIS_COLS)])
+            if self.locked_layer:
+                # Slide everything above the cleared row down a cell and blank the top row
+                above = self.locked_layer.subsurface((0, 0, TETRIS_COLS * TETRIS_CELL_SIZE, (r + 1) * TETRIS_CELL_SIZE))
+                above.scroll(0, TETRIS_CELL_SIZE)
+                above.fill(COLORS["BACKGROUND"], (0, 0, TETRIS_COLS * TETRIS_CELL_SIZE, TETRIS_CELL_SIZE))
+        lines_cleared = len(full)
         self.score += lines_cleared * 100
         if lines_cleared > 0:
             self.play_sound("score")
 
     def _hard_drop(self):
-        while self._move(0, 1):
-            pass
+        self.current_piece['y'] = self._get_ghost_position()
         self._lock_piece()
 
     def _get_ghost_position(self):
-        ghost_y = self.current_piece['y']
-        while not self._check_collision(self.current_piece['shape'], self.current_piece['x'], ghost_y + 1):
-            ghost_y += 1
-        return ghost_y
+        """Box row the current piece would land on."""
+        piece = self.current_piece
+        top, masks, _ = PIECE_STATES[piece['kind']][piece['rotation']]
+        return landing_row(self.rows, masks, piece['x'], piece['y'] + top) - top
 
     def draw(self):
         self.screen.fill(COLORS["BACKGROUND"])
@@ -168,24 +375,21 @@ class TetrisGame(BaseGame):
                          (TETRIS_OFFSET_X - 2, TETRIS_OFFSET_Y - 2, 
                           TETRIS_COLS * TETRIS_CELL_SIZE + 4, TETRIS_ROWS * TETRIS_CELL_SIZE + 4), 1)
 
-        # Draw Locked Blocks
-        for r, row in enumerate(self.grid):
-            for c, color in enumerate(row):
-                if color:
-                    self._draw_block(c, r, color)
+        # Draw Locked Blocks: one blit of the cached layer, however full the board is
+        if self.locked_layer is None:
+            self.locked_layer = self._build_locked_layer()
+        self.screen.blit(self.locked_layer, (TETRIS_OFFSET_X, TETRIS_OFFSET_Y))
 
         # Draw Ghost Piece
         ghost_y = self._get_ghost_position()
-        for r, row in enumerate(self.current_piece['shape']):
-            for c, val in enumerate(row):
-                if val:
-                    self._draw_block(self.current_piece['x'] + c, ghost_y + r, (50, 50, 50), outline=True)
+        piece = self.current_piece
+        cells = PIECE_STATES[piece['kind']][piece['rotation']][2]
+        for r, c in cells:
+            self._draw_block(piece['x'] + c, ghost_y + r, (50, 50, 50), outline=True)
 
         # Draw Current Piece
-        for r, row in enumerate(self.current_piece['shape']):
-            for c, val in enumerate(row):
-                if val:
-                    self._draw_block(self.current_piece['x'] + c, self.current_piece['y'] + r, self.current_piece['color'])
+        for r, c in cells:
+            self._draw_block(piece['x'] + c, piece['y'] + r, piece['color'])
 
         # Draw UI (Score, Next Piece)
         self._draw_ui()
@@ -193,29 +397,46 @@ class TetrisGame(BaseGame):
         if self.game_over:
             self.draw_game_over_overlay(f"Score: {self.score}")
 
-    def _draw_block(self, x, y, color, outline=False):
-        rect = pygame.Rect(TETRIS_OFFSET_X + x * TETRIS_CELL_SIZE, 
-                           TETRIS_OFFSET_Y + y * TETRIS_CELL_SIZE, 
+    def _build_locked_layer(self):
+        layer = pygame.Surface((TETRIS_COLS * TETRIS_CELL_SIZE, TETRIS_ROWS * TETRIS_CELL_SIZE))
+        if pygame.display.get_surface():
+            layer = layer.convert()
+        layer.fill(COLORS["BACKGROUND"])
+        for r, row in enumerate(self.grid):
+            for c, color in enumerate(row):
+                if color:
+                    self._draw_block(c, r, color, surface=layer)
+        return layer
+
+    def _draw_block(self, x, y, color, outline=False, surface=None):
+        # On the screen by default; on the locked layer (board-relative) when given
+        if surface is None:
+            surface = self.screen
+            left, top = TETRIS_OFFSET_X, TETRIS_OFFSET_Y
+        else:
+            left, top = 0, 0
+        rect = pygame.Rect(left + x * TETRIS_CELL_SIZE,
+                           top + y * TETRIS_CELL_SIZE,
                            TETRIS_CELL_SIZE, TETRIS_CELL_SIZE)
         if outline:
-            pygame.draw.rect(self.screen, color, rect, 1)
+            pygame.draw.rect(surface, color, rect, 1)
         else:
-            pygame.draw.rect(self.screen, color, rect)
-            pygame.draw.rect(self.screen, COLORS["BACKGROUND"], rect, 1)
+            pygame.draw.rect(surface, color, rect)
+            pygame.draw.rect(surface, COLORS["BACKGROUND"], rect, 1)
 
     def _draw_ui(self):
         # Score
-        score_surf = self.font.render(f"Score: {self.score}", True, COLORS["TEXT"])
-        self.screen.blit(score_surf, (TETRIS_OFFSET_X + TETRIS_COLS * TETRIS_CELL_SIZE + 20, TETRIS_OFFSET_Y))
+        self.text.draw_hud(self.screen, self.font, f"Score: {self.score}", COLORS["TEXT"], (TETRIS_OFFSET_X + TETRIS_COLS * TETRIS_CELL_SIZE + 20, TETRIS_OFFSET_Y))
+        self.draw_autopilot_hud(self.font, (10, 10))
 
         # Next Piece Label
-        next_surf = self.font.render("Next:", True, COLORS["TEXT"])
+        next_surf = self.text.render(self.font, "Next:", COLORS["TEXT"])
         self.screen.blit(next_surf, (TETRIS_OFFSET_X + TETRIS_COLS * TETRIS_CELL_SIZE + 20, TETRIS_OFFSET_Y + 50))
 
         # Next Piece Preview
         preview_x = TETRIS_OFFSET_X + TETRIS_COLS * TETRIS_CELL_SIZE + 20
         preview_y = TETRIS_OFFSET_Y + 80
-        for r, row in enumerate(self.next_piece['shape']):
+        for r, row in enumerate(SHAPES[self.next_piece['kind']]):
             for c, val in enumerate(row):
                 if val:
                     rect = pygame.Rect(preview_x + c * TETRIS_CELL_SIZE, 
@@ -0,0 +1,222 @@
+import time
+from array import array
+from settings import *
+from games.tetris import (PIECE_STATES, O_PIECE, BOARD_PAD, EMPTY_ROW, FULL_ROW,
+                          spawn_position, collides, landing_row, rotate)
+
+# Turns tried from the spawn orientation: none, clockwise, twice, counter-clockwise
+ROTATION_SEQUENCES = ((), (1,), (1, 1), (-1,))
+COLUMN_MASK = (1 << TETRIS_COLS) - 1
+PAIR_MASK = (1 << (TETRIS_COLS - 1)) - 1  # Bit c set for every column c that has a right-hand neighbour
+# Set bits of every possible row of cells
+POPCOUNT = bytes(bin(cells).count("1") for cells in range(1 << TETRIS_COLS))
+LOSS = float("-inf")
+
+
+def placements(rows, kind, rotation, x, y):
+    """
+    Generates every resting spot a piece at (rotation, x, y) reaches by
+    turning, then sliding sideways, then hard-dropping, as (turns, column,
+    rotation, row): the plan to get there and the box position it locks at.
+    Spots that different orientations share (I, S and Z) come up once. Lazy,
+    so a search can stop between any two.
+    """
+    seen = set()
+    for turns in ((),) if kind == O_PIECE else ROTATION_SEQUENCES:
+        state = (rotation, x, y)
+        for turn in turns:
+            state = rotate(rows, kind, state[0], turn, state[1], state[2])
+            if state is None:
+                break
+        if state is None:
+            continue
+        new_rotation, start_x, box_y = state
+        top, masks, _ = PIECE_STATES[kind][new_rotation]
+        for step in (-1, 1):
+            column = start_x if step < 0 else start_x + 1
+            while not collides(rows, masks, column, box_y + top):
+                land = landing_row(rows, masks, column, box_y + top)
+                key = (land, tuple(mask << column + BOARD_PAD for mask in masks))
+                if key not in seen:
+                    seen.add(key)
+                    yield turns, column, new_rotation, land - top
+                column += step
+
+
+def place(rows, kind, rotation, x, y):
+    """Board after locking a piece at (rotation, x, y) and clearing lines: (rows, lines), or None if it locks above the top."""
+    top, masks, _ = PIECE_STATES[kind][rotation]
+    y += top
+    if y < 0:
+        return None
+    rows = rows[:]
+    shift = x + BOARD_PAD
+    full = 0
+    for r, mask in enumerate(masks, y):
+        rows[r] |= mask << shift
+        if rows[r] == FULL_ROW:
+            full += 1
+    if full:
+        rows = [EMPTY_ROW] * full + [row for row in rows if row != FULL_ROW]
+    return rows, full
+
+
+def board_features(rows):
+    """
+    (aggregate height, holes, bumpiness) in one top-down pass. covered has a
+    bit for every column whose stack has started, so each row adds the
+    covered columns to the heights, covered-but-empty cells to the holes, and
+    covered/uncovered neighbours to the bumpiness.
+    """
+    covered = height = holes = bumpiness = 0
+    for row in rows:
+        cells = (row >> BOARD_PAD) & COLUMN_MASK
+        if not covered:
+            if not cells:
+                continue
+        else:
+            holes += POPCOUNT[covered & ~cells]
+        covered |= cells
+        height += POPCOUNT[covered]
+        bumpiness += POPCOUNT[(covered ^ (covered >> 1)) & PAIR_MASK]
+    return height, holes, bumpiness
+
+
+def score_board(rows, lines, weights=TETRIS_AI_WEIGHTS):
+    height, holes, bumpiness = board_features(rows)
+    return (weights["height"] * height + weights["lines"] * lines +
+            weights["holes"] * holes + weights["bumpiness"] * bumpiness)
+
+
+class TetrisAutopilot:
+    """
+    Plays a TetrisGame through its _rotate/_move/_hard_drop methods.
+
+    For each new piece it scores every placement of the current piece
+    followed by every placement of next_piece (two plies) with a weighted
+    heuristic (TETRIS_AI_WEIGHTS: aggregate height, lines cleared, holes,
+    bumpiness), then turns, slides and drops the piece one action per tick.
+
+    Each tick's scoring stops at time_budget_ms (TETRIS_AI_TIME_BUDGET_MS)
+    and at placement_budget boards, so a decision spreads over several
+    frames. Pass time_budget_ms=None where runs must be deterministic; with
+    placement_budget=None as well the whole search runs in one tick.
+    stats() reports boards scored per second and search time per tick.
+
+    TetrisGame creates one for attract mode; marathons run it headless as
+    the runner's controller:
+
+        runner.run(100000, TetrisAutopilot(placement_budget=None))
+    """
+    def __init__(self, game=None, placement_budget=TETRIS_AI_PLACEMENT_BUDGET, weights=TETRIS_AI_WEIGHTS,
+                 time_budget_ms=TETRIS_AI_TIME_BUDGET_MS):
+        self.placement_budget = placement_budget
+        self.time_budget_ms = time_budget_ms
+        self.weights = weights
+        self.game = None
+        self.evaluated = 0         # Boards scored, both plies
+        self.search_seconds = 0.0
+        self.pieces = 0
+        self.tick_ms = array('f')  # Search time of every tick that searched
+        if game is not None:
+            self.attach(game)
+
+    def attach(self, game):
+        self.game = game
+        self.reset()
+
+    def reset(self):
+        self.piece = None   # The game's piece dict the plan is for
+        self.search = None  # Generator of the running search
+        self.plan = None    # (turns left, target column) once decided
+
+    def __call__(self, runner):
+        """HeadlessRunner controller interface."""
+        if self.game is not runner.game:
+            self.attach(runner.game)
+        self.tick()
+        return None
+
+    def stats(self):
+        times = sorted(self.tick_ms)
+        return {
+            "pieces": self.pieces,
+            "placements": self.evaluated,
+            "placements_per_sec": round(self.evaluated / self.search_seconds) if self.search_seconds else 0,
+            "search_ms_p99": round(times[int(0.99 * (len(times) - 1))], 3) if times else 0,
+            "search_ms_max": round(times[-1], 3) if times else 0,
+        }
+
+    def tick(self):
+        game = self.game
+        if game.game_over:
+            return
+        piece = game.current_piece
+        if piece is not self.piece:
+            # New piece (or a reset): search from where it is now
+            self.piece = piece
+            self.plan = None
+            self.search = self._search(game.rows, piece, game.next_piece['kind'])
+            self.pieces += 1
+
+        if self.plan is None:
+            start = time.perf_counter()
+            deadline = None if self.time_budget_ms is None else start + self.time_budget_ms / 1000
+            budget = self.placement_budget
+            try:
+                while budget is None or budget > 0:
+                    next(self.search)
+                    if budget is not None:
+                        budget -= 1
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+            except StopIteration as done:
+                self.plan = done.value
+            elapsed = time.perf_counter() - start
+            self.search_seconds += elapsed
+            self.tick_ms.append(elapsed * 1000)
+            if self.plan is None:
+                return
+        self._act()
+
+    def _act(self):
+        """One step of the plan: a turn, a sidestep, or the drop."""
+        game = self.game
+        turns, column = self.plan
+        if turns:
+            self.plan = (turns[1:], column)
+            if game._rotate(turns[0]):
+                return
+        else:
+            x = game.current_piece['x']
+            if x != column and game._move(1 if column > x else -1, 0):
+                return
+        # Planned spot reached (or the way there got blocked): drop here
+        game._hard_drop()
+
+    def _search(self, rows, piece, next_kind):
+        """
+        Generator: yields after every board it scores, so callers can stop
+        between any two, and returns (turns, column) of the best placement.
+        """
+        weights = self.weights
+        next_x, next_y = spawn_position(next_kind)
+        next_masks = PIECE_STATES[next_kind][0][1]
+        next_top = PIECE_STATES[next_kind][0][0]
+        best = None
+        for turns, column, rotation, row in placements(rows, piece['kind'], piece['rotation'], piece['x'], piece['y']):
+            first = place(rows, piece['kind'], rotation, column, row)
+            value = LOSS
+            self.evaluated += 1
+            yield
+            if first is not None and not collides(first[0], next_masks, next_x, next_y + next_top):
+                board, lines = first
+                for _, next_column, next_rotation, next_row in placements(board, next_kind, 0, next_x, next_y):
+                    second = place(board, next_kind, next_rotation, next_column, next_row)
+                    if second is not None:
+                        value = max(value, score_board(second[0], lines + second[1], weights))
+                    self.evaluated += 1
+                    yield
+            if best is None or value > best[0]:
+                best = (value, turns, column)
+        return (best[1], best[2]) if best else ((), piece['x'])
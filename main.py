@@ -5,15 +5,7 @@ from managers.state_manager import GameStateManager
 from managers.highscore_manager import HighscoreManager
 from managers.sound_manager import SoundManager
 from ui.menu import MainMenu
-from games.snake import SnakeGame
-from games.tetris import TetrisGame
-from games.breakout import BreakoutGame
-from games.pong import PongGame
-from games.invaders import InvadersGame
-from games.flappy import FlappyGame
-from games.minesweeper import MinesweeperGame
-from games.memory import MemoryGame
-from games.asteroids import AsteroidsGame
+from games.registry import GameRegistry
 
 def main():
     pygame.init()
@@ -30,46 +22,28 @@ def main():
     state_manager = GameStateManager(None)
     
     # Initialize Menu (needed for return_to_menu callback)
-    # Games dict will be populated after games are created
-    menu = MainMenu(screen, state_manager, {})
+    # Games registry will be attached after it is created
+    menu = MainMenu(screen, state_manager, {}, highscore_manager)
     
     # Define callback to return to menu AFTER menu is created
     # This prevents the callback from referencing undefined objects
     def return_to_menu():
         state_manager.set_state(menu)
     
-    # Now initialize games with the valid callback
-    snake_game = SnakeGame(screen, return_to_menu, highscore_manager, sound_manager, "Snake")
-    tetris_game = TetrisGame(screen, return_to_menu, highscore_manager, sound_manager, "Tetris")
-    breakout_game = BreakoutGame(screen, return_to_menu, highscore_manager, sound_manager, "Breakout")
-    pong_game = PongGame(screen, return_to_menu, highscore_manager, sound_manager, "Pong")
-    invaders_game = InvadersGame(screen, return_to_menu, highscore_manager, sound_manager, "Invaders")
-    flappy_game = FlappyGame(screen, return_to_menu, highscore_manager, sound_manager, "Flappy")
-    minesweeper_game = MinesweeperGame(screen, return_to_menu, highscore_manager, sound_manager, "Minesweeper")
-    memory_game = MemoryGame(screen, return_to_menu, highscore_manager, sound_manager, "Memory")
-    asteroids_game = AsteroidsGame(screen, return_to_menu, highscore_manager, sound_manager, "Asteroids")
-
-    # Dictionary of games for the menu
-    games_dict = {
-        "Tetris": tetris_game,
-        "Snake": snake_game,
-        "Breakout": breakout_game,
-        "Pong": pong_game,
-        "Invaders": invaders_game,
-        "Flappy": flappy_game,
-        "Minesweeper": minesweeper_game,
-        "Memory": memory_game,
-        "Asteroids": asteroids_game
-    }
+    # Games are only registered here; each one is imported and constructed
+    # the first time it is selected from the menu
+    games = GameRegistry(screen, return_to_menu, highscore_manager, sound_manager,
+                         clock=state_manager, max_live=GAME_REGISTRY_MAX_LIVE)
     
-    # Update menu with games dictionary
-    menu.games = games_dict
+    # Update menu with games registry
+    menu.games = games
     menu.game_names = list(menu.games.keys()) + ["Quit"]
     
     # Set initial state to Menu
     state_manager.set_state(menu)
 
     running = True
+    frame_ms = clock.tick(FPS)
     while running:
         # Event Handling
         for event in pygame.event.get():
@@ -78,18 +52,21 @@ def main():
             # Pass event to current state
             state_manager.handle_events(event)
 
-        # Update
-        state_manager.update()
+        # Update (fixed-timestep: 0..SIM_MAX_STEPS ticks depending on elapsed time)
+        state_manager.advance(frame_ms)
 
         # Draw
         state_manager.draw()
         
-        # Render
-        pygame.display.flip()
+        # Render (full flip, or only changed regions when RENDER_MODE is "dirty")
+        state_manager.present()
 
-        # Cap the frame rate
-        clock.tick(FPS)
+        # Cap the render rate; the simulation rate is SIM_FPS regardless
+        frame_ms = clock.tick(FPS)
+        state_manager.end_frame(clock.get_fps())
 
+    state_manager.shutdown()
+    highscore_manager.close()
     pygame.quit()
     sys.exit()
 
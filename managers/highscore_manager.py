@@ -1,42 +1,195 @@
+import atexit
 import json
 import os
+import sqlite3
+import threading
+import time
+from settings import *
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_game_score ON runs (game, score);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+# The old JSON file stored Minesweeper as 1000 - seconds so that higher was better
+LEGACY_INVERTED_SCORES = {"Minesweeper": 1000}
+# How long the writer waits after a run for more runs before committing
+WRITE_COALESCE_SECONDS = 0.5
+# Longest flush() waits for the writer by default
+FLUSH_TIMEOUT_SECONDS = 5.0
+
+
+def lower_is_better(game_name):
+    return game_name in LOWER_SCORE_IS_BETTER
+
+
+def _connect(path):
+    db = sqlite3.connect(path)
+    # WAL lets the menu read while the writer commits; NORMAL is still crash-safe under WAL
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    return db
 
-HIGHSCORE_FILE = "highscores.json"
 
 class HighscoreManager:
-    def __init__(self):
-        self.scores = {}
-        self._load_scores()
+    """
+    Leaderboard kept in SQLite: every finished run is stored with a timestamp,
+    and best/top-N follow each game's score direction (LOWER_SCORE_IS_BETTER).
 
-    def _load_scores(self):
-        if os.path.exists(HIGHSCORE_FILE):
+    save_score() never touches the disk. It updates the in-memory best (what
+    the menu and overlays read, an O(1) dict lookup) and queues the run; a
+    background writer commits queued runs in batches, one transaction per
+    burst. close() (also registered with atexit) commits whatever is left.
+    An existing highscores.json is imported once, as one run per game.
+    """
+    def __init__(self, path=HIGHSCORE_DB, legacy_path=HIGHSCORE_LEGACY_FILE, coalesce_seconds=WRITE_COALESCE_SECONDS):
+        self.path = path
+        self.coalesce_seconds = coalesce_seconds
+        self.best = {}  # game -> best score (None if no runs), filled on first lookup
+
+        # Reads happen on the game thread through this connection; the writer has its own
+        self.db = _connect(path)
+        self.db.executescript(SCHEMA)
+        self._import_legacy_json(legacy_path)
+
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._pending = []   # (game, score, played_at) not yet handed to the writer
+        self._writing = []   # Batch the writer is committing right now
+        self._urgent = False
+        self._closing = False
+        self.writer_error = None  # Set if the writer couldn't open the database; nothing gets saved then
+        self._writer = threading.Thread(target=self._writer_loop, name="highscore-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _import_legacy_json(self, legacy_path):
+        if self.db.execute("SELECT 1 FROM meta WHERE key = 'legacy_json_imported'").fetchone():
+            return
+        runs = []
+        if legacy_path and os.path.exists(legacy_path):
             try:
-                with open(HIGHSCORE_FILE, 'r') as f:
-                    self.scores = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                print("Failed to load high scores. Starting fresh.")
-                self.scores = {}
-        else:
-            self.scores = {}
+                with open(legacy_path, 'r') as f:
+                    scores = json.load(f)
+                played_at = os.path.getmtime(legacy_path)
+                for game_name, score in scores.items():
+                    if game_name in LEGACY_INVERTED_SCORES:
+                        score = LEGACY_INVERTED_SCORES[game_name] - score
+                    runs.append((game_name, int(score), played_at))
+            except (json.JSONDecodeError, IOError, ValueError, AttributeError):
+                print("Failed to import old high scores. Starting fresh.")
+                runs = []
+        with self.db:
+            self.db.executemany("INSERT INTO runs (game, score, played_at) VALUES (?, ?, ?)", runs)
+            self.db.execute("INSERT INTO meta (key, value) VALUES ('legacy_json_imported', ?)", (str(time.time()),))
 
     def get_score(self, game_name):
-        return self.scores.get(game_name, 0)
+        """Best score for a game, or None if it has no runs yet."""
+        if game_name not in self.best:
+            self.best[game_name] = self._query_best(game_name)
+        return self.best[game_name]
+
+    def _query_best(self, game_name):
+        aggregate = "MIN" if lower_is_better(game_name) else "MAX"
+        try:
+            row = self.db.execute(f"SELECT {aggregate}(score) FROM runs WHERE game = ?", (game_name,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Failed to load high scores: {e}")
+            return None
+        return row[0]
+
+    def is_better(self, game_name, score, than):
+        if than is None:
+            return True
+        return score < than if lower_is_better(game_name) else score > than
 
     def save_score(self, game_name, new_score):
         """
-        Updates the high score for a game if the new score is higher.
-        Returns True if a new high score was set, False otherwise.
+        Records a finished run. Returns True if it set a new best for the game,
+        False otherwise.
         """
-        current_high = self.get_score(game_name)
-        if new_score > current_high:
-            self.scores[game_name] = new_score
-            self._write_to_file()
-            return True
-        return False
+        self.get_score(game_name)  # Make sure the cached best is loaded before comparing
+        new_best = self.is_better(game_name, new_score, self.best[game_name])
+        if new_best:
+            self.best[game_name] = new_score
+        with self._lock:
+            self._pending.append((game_name, new_score, time.time()))
+            self._wake.notify_all()
+        return new_best
+
+    def top_scores(self, game_name, limit=LEADERBOARD_SIZE):
+        """The game's best runs as [(score, played_at)], best first, including unsaved ones."""
+        with self._lock:
+            unsaved = [(score, played_at) for game, score, played_at in self._pending + self._writing
+                       if game == game_name]
+        order = "ASC" if lower_is_better(game_name) else "DESC"
+        try:
+            saved = self.db.execute(f"SELECT score, played_at FROM runs WHERE game = ? ORDER BY score {order} LIMIT ?",
+                                    (game_name, limit)).fetchall()
+        except sqlite3.Error as e:
+            print(f"Failed to load high scores: {e}")
+            saved = []
+        # A batch may land between the two reads; a set drops the duplicate
+        runs = sorted(set(saved) | set(unsaved), key=lambda run: run[0], reverse=not lower_is_better(game_name))
+        return runs[:limit]
+
+    def flush(self, timeout=FLUSH_TIMEOUT_SECONDS):
+        """
+        Blocks until every run saved so far is committed. Returns False on
+        timeout, or at once if the writer has failed (see writer_error).
+        """
+        with self._lock:
+            self._urgent = True
+            self._wake.notify_all()
+            self._wake.wait_for(lambda: self.writer_error or (not self._pending and not self._writing), timeout)
+            return not self.writer_error and not self._pending and not self._writing
+
+    def close(self, timeout=2.0):
+        """Commits anything pending and stops the writer. Safe to call more than once."""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            self._wake.notify_all()
+        self._writer.join(timeout)
+        self.db.close()
 
-    def _write_to_file(self):
+    def _writer_loop(self):
         try:
-            with open(HIGHSCORE_FILE, 'w') as f:
-                json.dump(self.scores, f, indent=4)
-        except IOError as e:
-            print(f"Failed to save high scores: {e}")
\ No newline at end of file
+            db = _connect(self.path)
+        except sqlite3.Error as e:
+            print(f"Failed to open high score database: {e}")
+            with self._lock:
+                self.writer_error = e
+                self._wake.notify_all()
+            return
+        while True:
+            with self._lock:
+                self._wake.wait_for(lambda: self._pending or self._closing)
+                if not self._closing and not self._urgent:
+                    # Let a burst of runs settle into one transaction
+                    self._wake.wait_for(lambda: self._closing or self._urgent, self.coalesce_seconds)
+                self._writing, self._pending = self._pending, []
+                self._urgent = False
+                batch = self._writing
+                closing = self._closing
+            if batch:
+                try:
+                    with db:
+                        db.executemany("INSERT INTO runs (game, score, played_at) VALUES (?, ?, ?)", batch)
+                except sqlite3.Error as e:
+                    print(f"Failed to save high scores: {e}")
+            with self._lock:
+                self._writing = []
+                self._wake.notify_all()
+            if closing:
+                db.close()
+                return
@@ -0,0 +1,119 @@
+import time
+from collections import deque
+import pygame
+from settings import *
+from ui.text import text_renderer
+
+PHASES = ("event", "update", "draw", "flip")
+PHASE_COLORS = {
+    "event": COLORS["WARNING"],
+    "update": COLORS["ACCENT"],
+    "draw": COLORS["HIGHLIGHT"],
+    "flip": COLORS["SUCCESS"],
+}
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """
+    Rolling per-phase frame timings, collected by GameStateManager.
+
+    Phases are timed with perf_counter around the manager's forwarding calls,
+    so every game and the menu are covered without touching their code. The
+    overlay (toggled with PROFILER_HOTKEY) shows a scrolling stacked graph of
+    recent frames plus p50/p95/p99 per phase.
+    """
+    def __init__(self, history=PROFILER_HISTORY):
+        self.history = history
+        self.visible = False
+        self.fps = 0.0
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.font = None
+        self.graph = None
+        self.reset()
+
+    def reset(self):
+        self.samples = {phase: deque(maxlen=self.history) for phase in PHASES}
+        self.totals = deque(maxlen=self.history)
+        self.current = dict.fromkeys(PHASES, 0.0)
+        if self.graph:
+            self.graph.fill(COLORS["BLACK"])
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def add(self, phase, start):
+        """Adds the time since start (a perf_counter value) to this frame's phase, in ms."""
+        self.current[phase] += (time.perf_counter() - start) * 1000
+
+    def end_frame(self, fps):
+        self.fps = fps
+        total = 0.0
+        for phase in PHASES:
+            self.samples[phase].append(self.current[phase])
+            total += self.current[phase]
+        self.totals.append(total)
+        if self.visible:
+            self._scroll_graph()
+        self.current = dict.fromkeys(PHASES, 0.0)
+
+    def stats(self, phase):
+        """(p50, p95, p99) in ms for a phase over the rolling window."""
+        values = sorted(self.samples[phase])
+        return percentile(values, 0.50), percentile(values, 0.95), percentile(values, 0.99)
+
+    def _scroll_graph(self):
+        # The graph is only ever shifted by one column per frame, so its cost
+        # doesn't grow with the history length
+        if self.graph is None:
+            self.graph = pygame.Surface((self.history, PROFILER_GRAPH_HEIGHT))
+            self.graph.fill(COLORS["BLACK"])
+        width, height = self.graph.get_size()
+        self.graph.scroll(-1, 0)
+        pygame.draw.line(self.graph, COLORS["BLACK"], (width - 1, 0), (width - 1, height - 1))
+
+        scale = height / PROFILER_GRAPH_MAX_MS
+        y = height
+        for phase in PHASES:
+            bar = self.current[phase] * scale
+            if bar >= 1:
+                pygame.draw.line(self.graph, PHASE_COLORS[phase], (width - 1, y - 1), (width - 1, max(0, int(y - bar))))
+            y -= bar
+        budget_y = height - int(1000 / FPS * scale)
+        self.graph.set_at((width - 1, max(0, budget_y)), COLORS["DANGER"])
+
+    def draw(self, surface, state_name):
+        if self.font is None:
+            self.font = text_renderer.get_font(14)
+
+        lines = [(f"{state_name}   FPS: {self.fps:.1f}", COLORS["TEXT"])]
+        frame_values = sorted(self.totals)
+        lines.append((f"frame  p50 {percentile(frame_values, 0.5):5.2f}  p95 {percentile(frame_values, 0.95):5.2f}  "
+                      f"p99 {percentile(frame_values, 0.99):5.2f} ms", COLORS["TEXT"]))
+        for phase in PHASES:
+            p50, p95, p99 = self.stats(phase)
+            lines.append((f"{phase:<6} p50 {p50:5.2f}  p95 {p95:5.2f}  p99 {p99:5.2f} ms", PHASE_COLORS[phase]))
+
+        line_height = self.font.get_linesize()
+        graph_height = PROFILER_GRAPH_HEIGHT if self.graph else 0
+        panel = pygame.Rect(0, 0, max(self.history, 300) + 16, len(lines) * line_height + graph_height + 20)
+        panel.topright = (SCREEN_WIDTH - 8, 8)
+
+        backdrop = pygame.Surface(panel.size)
+        backdrop.set_alpha(200)
+        backdrop.fill(COLORS["BACKGROUND"])
+        surface.blit(backdrop, panel.topleft)
+        pygame.draw.rect(surface, COLORS["GRID"], panel, 1)
+
+        y = panel.top + 6
+        for text, color in lines:
+            text_renderer.draw_hud(surface, self.font, text, color, (panel.left + 8, y))
+            y += line_height
+        if self.graph:
+            surface.blit(self.graph, (panel.left + 8, y + 6))
@@ -0,0 +1,292 @@
+"""
+Input recording and deterministic replay.
+
+A session runs from the moment a game is entered until it returns to the
+menu. The recorder seeds the game's random stream, logs every input event
+it receives (stamped with the simulation tick it arrived before) and the
+held-key lookups update() makes, then saves it all with a digest of the
+final game state. Replaying feeds the same seed, clock, events and key
+state into a fresh instance on the headless runner and checks the digest.
+
+    python -m managers.replay replays/Snake_20260101-120000_5400.json
+    python -m managers.replay replays/Snake_20260101-120000_5400.json --watch --speed 2
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from array import array
+from collections import deque
+import pygame
+from settings import *
+
+REPLAY_VERSION = 1
+RECORDED_EVENT_TYPES = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+EVENT_ATTRS = ("key", "mod", "unicode", "scancode", "button", "pos")
+# Bookkeeping set from outside the game's logic, or only by draw(); not part of its state
+DIGEST_SKIP_ATTRS = {"active", "render_alpha", "camera", "recorded"}
+
+
+def encode_event(event):
+    attrs = {}
+    for name in EVENT_ATTRS:
+        if hasattr(event, name):
+            value = getattr(event, name)
+            attrs[name] = list(value) if name == "pos" else value
+    return event.type, attrs
+
+
+def decode_event(event_type, attrs):
+    attrs = dict(attrs)
+    if "pos" in attrs:
+        attrs["pos"] = tuple(attrs["pos"])
+    return pygame.event.Event(event_type, **attrs)
+
+
+def _canonical(value):
+    """Stable text form of plain game state; None for things that aren't state (surfaces, callbacks...)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    if isinstance(value, pygame.Rect):
+        return repr(tuple(value))
+    if isinstance(value, (list, tuple, deque)):
+        return "[" + ",".join(_canonical(v) or "?" for v in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_canonical(v) or "?" for v in value)) + "}"
+    if isinstance(value, dict):
+        items = sorted((repr(k), _canonical(v) or "?") for k, v in value.items())
+        return "{" + ",".join(f"{k}:{v}" for k, v in items) + "}"
+    if isinstance(value, (bytes, bytearray, array)):
+        return hashlib.sha1(bytes(value)).hexdigest()
+    return None
+
+
+def state_digest(game):
+    """Hash of a game's plain attributes plus its RNG state; equal digests mean equal runs."""
+    parts = []
+    for name in sorted(vars(game)):
+        if name in DIGEST_SKIP_ATTRS:
+            continue
+        text = _canonical(getattr(game, name))
+        if text is not None:
+            parts.append(f"{name}={text}")
+    parts.append(f"rng={_canonical(game.rng.getstate())}")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+
+class RecordingKeys:
+    """
+    Wraps a game's input source and remembers the value of every held key the
+    game looks up, so the exact answers can be fed back on replay.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.pressed = None
+        self.known = {}
+        self.changed = False
+
+    def get_pressed(self):
+        self.pressed = self.source.get_pressed()
+        return self
+
+    def __getitem__(self, key):
+        value = bool(self.pressed[key])
+        if self.known.get(key) != value:
+            self.known[key] = value
+            self.changed = True
+        return value
+
+
+class ReplayKeys:
+    """Input source that answers held-key lookups from a recording."""
+    def __init__(self):
+        self.known = {}
+
+    def get_pressed(self):
+        return self
+
+    def __getitem__(self, key):
+        return self.known.get(key, False)
+
+
+class InputRecorder:
+    """Records one session at a time; driven by GameStateManager."""
+    def __init__(self, output_dir=REPLAY_DIR):
+        self.output_dir = output_dir
+        self.game = None
+        self.last_path = None
+
+    @property
+    def recording(self):
+        return self.game is not None
+
+    def begin(self, game, start_tick, tick_ms):
+        """Starts a session. Call before the game's reset() so the seed applies to it."""
+        if self.recording:
+            self.end()
+        self.game = game
+        game.recorded = True
+        self.seed = random.randrange(2 ** 32)
+        game.seed(self.seed)
+        self.original_input = game.input
+        self.keys = RecordingKeys(game.input)
+        game.input = self.keys
+        self.start_tick = start_tick
+        self.tick_ms = tick_ms
+        self.ticks = 0
+        self.events = []
+        self.key_log = []
+
+    def record_event(self, event):
+        if self.recording and event.type in RECORDED_EVENT_TYPES:
+            event_type, attrs = encode_event(event)
+            self.events.append([self.ticks, event_type, attrs])
+
+    def end_tick(self):
+        if not self.recording:
+            return
+        if self.keys.changed:
+            # Stamped with the tick that made the lookups; replay applies it before that tick
+            self.key_log.append([self.ticks, {str(k): v for k, v in self.keys.known.items()}])
+            self.keys.changed = False
+        self.ticks += 1
+
+    def end(self):
+        """Ends the session and writes it to output_dir. Returns the file path."""
+        if not self.recording:
+            return None
+        game = self.game
+        game.input = self.original_input
+        game.recorded = False
+        self.game = None
+        data = {
+            "version": REPLAY_VERSION,
+            "game": game.game_name,
+            "seed": self.seed,
+            "start_tick": self.start_tick,
+            "tick_ms": self.tick_ms,
+            "ticks": self.ticks,
+            "events": self.events,
+            "keys": self.key_log,
+            "digest": state_digest(game),
+        }
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.output_dir, f"{game.game_name}_{stamp}_{self.start_tick}.json")
+        try:
+            with open(path, "w") as f:
+                json.dump(data, f)
+            self.last_path = path
+        except IOError as e:
+            print(f"Failed to save replay: {e}")
+            return None
+        return path
+
+
+class ReplayPlayer:
+    """Re-runs a recorded session on the headless runner."""
+    def __init__(self, data):
+        from games.headless import HeadlessRunner
+        from games.registry import find_entry, load_game_class
+
+        if isinstance(data, str):
+            with open(data) as f:
+                data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        self.data = data
+
+        try:
+            module_name, class_name, game_kwargs = find_entry(data["game"])
+        except KeyError:
+            raise ValueError(f"Unknown game in replay: {data['game']}")
+        game_class = load_game_class(module_name, class_name)
+
+        self.runner = HeadlessRunner(game_class, game_name=data["game"], tick_ms=data["tick_ms"], **game_kwargs)
+        self.keys = ReplayKeys()
+        game = self.runner.game
+        game.input = self.keys
+        game.recorded = True
+        # Same starting point as the recording: clock, seed, then a new session
+        self.runner.clock.tick = data["start_tick"]
+        game.seed(data["seed"])
+        game.start_session()
+        game.reset()
+
+    @property
+    def game(self):
+        return self.runner.game
+
+    def run(self, on_tick=None):
+        """
+        Replays every tick. on_tick(player) is called after each one (used for
+        watching). Returns a result dict including whether the digest matched.
+        """
+        data = self.data
+        events = data["events"]
+        key_log = data["keys"]
+        event_index = key_index = 0
+        start = time.perf_counter()
+
+        for tick in range(data["ticks"]):
+            pending = []
+            while event_index < len(events) and events[event_index][0] == tick:
+                pending.append(decode_event(events[event_index][1], events[event_index][2]))
+                event_index += 1
+            while key_index < len(key_log) and key_log[key_index][0] == tick:
+                self.keys.known = {int(k): v for k, v in key_log[key_index][1].items()}
+                key_index += 1
+            self.runner.step(pending)
+            if on_tick:
+                on_tick(self)
+
+        # Events that arrived after the last tick (e.g. the ESC that ended it)
+        for _, event_type, attrs in events[event_index:]:
+            self.game.handle_events(decode_event(event_type, attrs))
+
+        elapsed = time.perf_counter() - start
+        digest = state_digest(self.game)
+        return {
+            "game": data["game"],
+            "ticks": data["ticks"],
+            "elapsed_s": elapsed,
+            "speedup": (data["ticks"] * data["tick_ms"] / 1000) / elapsed if elapsed > 0 else 0.0,
+            "digest": digest,
+            "match": digest == data["digest"],
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded game session.")
+    parser.add_argument("replay", help="path to a replay JSON file")
+    parser.add_argument("--watch", action="store_true", help="show the replay in a window")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed when watching (0 = unthrottled)")
+    args = parser.parse_args(argv)
+
+    on_tick = None
+    if args.watch:
+        pygame.init()
+        display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption(f"{TITLE} - Replay")
+        clock = pygame.time.Clock()
+
+        def on_tick(player):
+            pygame.event.pump()
+            player.game.draw()
+            display.blit(player.runner.screen, (0, 0))
+            pygame.display.flip()
+            if args.speed > 0:
+                clock.tick(SIM_FPS * args.speed)
+
+    player = ReplayPlayer(args.replay)
+    result = player.run(on_tick)
+    print(f"{result['game']}: {result['ticks']} ticks in {result['elapsed_s']:.3f}s "
+          f"({result['speedup']:.0f}x real time), digest {'OK' if result['match'] else 'MISMATCH'}")
+    return 0 if result["match"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
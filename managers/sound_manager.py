@@ -1,43 +1,226 @@
 import pygame
 import os
+import threading
+from collections import OrderedDict, deque
+from settings import *
+
+SOUND_FILES = {
+    "select": "select.wav",
+    "shoot": "shoot.wav",
+    "jump": "jump.wav",
+    "explosion": "explosion.wav",
+    "gameover": "gameover.wav",
+    "score": "score.wav"
+}
+MUSIC_FILE = "music.wav"
+MUSIC_JOB = None  # Queue entry that loads and starts the music
+SYNTH_JOB = "<synth>"  # Queue entry that imports the runtime synthesizer (numpy)
 
 class SoundManager:
-    def __init__(self):
-        self.sounds = {}
-        self.sound_dir = "assets/sounds"
-        self._load_sounds()
+    """
+    Sounds are registered by name and decoded on a background loader thread,
+    warm set (SOUND_WARM_SET) first, so startup doesn't wait on audio files.
+    play() on a sound that isn't decoded yet does nothing and moves it to the
+    front of the queue; the music is loaded on the same thread.
+
+    Effects play on a fixed pool of SOUND_MAX_VOICES channels following
+    SOUND_VOICE_RULES: repeats within a sound's cooldown are dropped, a sound
+    over its voice cap replaces its own oldest voice, and with every channel
+    busy the oldest voice of the lowest priority (not above the new sound's)
+    is stolen. Otherwise the new sound is dropped, so bursts can't cut off
+    cues like "gameover".
+
+    play(name, pitch=..., volume=...) gives variants: pitch-shifted effects
+    are synthesized in memory (managers.sound_synth) and kept in a bounded
+    LRU, volume is applied per channel. Variants are built on the loader
+    thread too; until one is ready the sound plays at its normal pitch.
+    """
+    def __init__(self, sound_dir="assets/sounds", warm_set=SOUND_WARM_SET):
+        self.sounds = {}      # name -> decoded Sound, only once ready
+        self.registered = {}  # name -> (path, volume)
+        self.sound_dir = sound_dir
+        self._lock = threading.Lock()
+        self._queue = deque()
+        self._loader = None
+        self.synth = None  # managers.sound_synth once imported, False if unavailable
+        self.variants = OrderedDict()  # (name, pitch) -> synthesized Sound (None if it failed), least recently used first
+
+        self.channels = []
+        self.voices = []       # Per channel: (sound name, priority, start ms) of what it last played
+        self.last_played = {}  # name -> ms, for cooldowns
+        if pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(SOUND_MAX_VOICES)
+            self.channels = [pygame.mixer.Channel(i) for i in range(SOUND_MAX_VOICES)]
+            self.voices = [None] * SOUND_MAX_VOICES
 
-    def _load_sounds(self):
         if not os.path.exists(self.sound_dir):
             print("Sound directory not found. Skipping audio.")
             return
 
-        sound_files = {
-            "select": "select.wav",
-            "shoot": "shoot.wav",
-            "jump": "jump.wav",
-            "explosion": "explosion.wav",
-            "gameover": "gameover.wav",
-            "score": "score.wav"
-        }
-
-        for name, filename in sound_files.items():
-            path = os.path.join(self.sound_dir, filename)
-            if os.path.exists(path):
-                try:
-                    self.sounds[name] = pygame.mixer.Sound(path)
-                    self.sounds[name].set_volume(0.3)
-                except Exception as e:
-                    print(f"Failed to load sound {filename}: {e}")
+        for name, filename in SOUND_FILES.items():
+            self.register(name, filename)
+        for name in reversed(warm_set):
+            self._enqueue(name, front=True)
+        self._enqueue(SYNTH_JOB)
+
+    def register(self, name, filename, volume=0.3):
+        """Adds a sound under name; it's decoded in the background."""
+        self.registered[name] = (os.path.join(self.sound_dir, filename), volume)
+        self._enqueue(name)
+
+    def is_ready(self, sound_name):
+        return sound_name in self.sounds
+
+    def play(self, sound_name, pitch=1.0, volume=1.0):
+        if not self.channels:
+            return
+        sound = self.sounds.get(sound_name)
+        if sound is None and sound_name in self.registered:
+            # Not decoded yet: load it next, and never stall the frame for it
+            self._enqueue(sound_name, front=True)
+        if pitch != 1.0:
+            sound = self._variant(sound_name, pitch) or sound
+        if sound is None:
+            return
+
+        priority, max_voices, cooldown = SOUND_VOICE_RULES.get(sound_name, SOUND_DEFAULT_VOICE_RULE)
+        now = pygame.time.get_ticks()
+        last = self.last_played.get(sound_name)
+        if last is not None and now - last < cooldown:
+            return  # Coalesce duplicates from the same frame / burst
+
+        index = self._pick_channel(sound_name, priority, max_voices)
+        if index is None:
+            return
+        self.channels[index].set_volume(volume)
+        self.channels[index].play(sound)
+        self.voices[index] = (sound_name, priority, now)
+        self.last_played[sound_name] = now
+
+    def _pick_channel(self, sound_name, priority, max_voices):
+        """Index of the channel a new voice of sound_name should use, or None to drop it."""
+        playing = []
+        free = None
+        for i, channel in enumerate(self.channels):
+            if channel.get_busy():
+                playing.append(i)
             else:
-                print(f"Sound file missing: {filename}")
+                self.voices[i] = None
+                if free is None:
+                    free = i
+
+        own = [i for i in playing if self.voices[i] and self.voices[i][0] == sound_name]
+        if len(own) >= max_voices:
+            return min(own, key=lambda i: self.voices[i][2])
+        if free is not None:
+            return free
 
-    def play(self, sound_name):
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        # Every channel busy: steal the oldest of the lowest-priority voices
+        candidates = [i for i in playing if self.voices[i] is None or self.voices[i][1] <= priority]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda i: self.voices[i][1:] if self.voices[i] else (-1, 0))
+
+    def _variant(self, sound_name, pitch):
+        """
+        Cached Sound for an effect at a pitch, or None if there isn't one. A
+        missing one is queued for the loader thread to synthesize.
+        """
+        if self.synth is False or (self.synth and not self.synth.can_synthesize(sound_name)):
+            return None
+        key = (sound_name, round(pitch, 2))
+        with self._lock:
+            if key in self.variants:
+                self.variants.move_to_end(key)
+                return self.variants[key]
+        self._enqueue(key)
+        return None
+
+    def _build_variant(self, key):
+        if self.synth is None:
+            self._load_synth()  # Asked for before the synth job came up
+        sound_name, pitch = key
+        if not self.synth or not self.synth.can_synthesize(sound_name):
+            return
+        try:
+            sound = self.synth.synthesize(sound_name, pitch)
+            sound.set_volume(self.registered.get(sound_name, (None, 0.3))[1])
+        except (ValueError, pygame.error) as e:
+            print(f"Failed to synthesize sound {sound_name}: {e}")
+            sound = None  # Cached too, so it isn't retried on every play
+        with self._lock:
+            self.variants[key] = sound
+            if len(self.variants) > SOUND_VARIANT_CACHE_SIZE:
+                self.variants.popitem(last=False)
 
     def play_music(self):
-        music_path = os.path.join(self.sound_dir, "music.wav")
+        self._enqueue(MUSIC_JOB, front=True)
+
+    def stop_music(self):
+        with self._lock:
+            if MUSIC_JOB in self._queue:
+                self._queue.remove(MUSIC_JOB)
+        pygame.mixer.music.stop()
+
+    def wait_until_loaded(self, timeout=None):
+        """Blocks until the loader has nothing left to do (for tools and tests)."""
+        loader = self._loader
+        if loader is not None:
+            loader.join(timeout)
+
+    def _enqueue(self, job, front=False):
+        with self._lock:
+            if job in self._queue:
+                self._queue.remove(job)
+            if front:
+                self._queue.appendleft(job)
+            else:
+                self._queue.append(job)
+            # The loader exits when the queue runs dry; start a new one on demand
+            if self._loader is None or not self._loader.is_alive():
+                self._loader = threading.Thread(target=self._loader_loop, name="sound-loader", daemon=True)
+                self._loader.start()
+
+    def _loader_loop(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._loader = None
+                    return
+                job = self._queue.popleft()
+            if job is MUSIC_JOB:
+                self._start_music()
+            elif job == SYNTH_JOB:
+                if self.synth is None:
+                    self._load_synth()
+            elif isinstance(job, tuple):
+                self._build_variant(job)  # (name, pitch)
+            elif job not in self.sounds:
+                self._load_sound(job)
+
+    def _load_sound(self, name):
+        path, volume = self.registered[name]
+        if not os.path.exists(path):
+            print(f"Sound file missing: {os.path.basename(path)}")
+            return
+        try:
+            sound = pygame.mixer.Sound(path)
+            sound.set_volume(volume)
+            self.sounds[name] = sound
+        except Exception as e:
+            print(f"Failed to load sound {os.path.basename(path)}: {e}")
+
+    def _load_synth(self):
+        try:
+            from managers import sound_synth
+            sound_synth.warm_up()
+            self.synth = sound_synth
+        except ImportError as e:
+            print(f"Runtime sound synthesis unavailable: {e}")
+            self.synth = False
+
+    def _start_music(self):
+        music_path = os.path.join(self.sound_dir, MUSIC_FILE)
         if os.path.exists(music_path):
             try:
                 pygame.mixer.music.load(music_path)
@@ -47,6 +230,3 @@ class SoundManager:
                 print(f"Failed to load music: {e}")
         else:
             print("Music file not found.")
-
-    def stop_music(self):
-        pygame.mixer.music.stop()
@@ -0,0 +1,42 @@
+"""
+Sound effects synthesized at runtime straight into mixer buffers, from the
+same parameter table utils_sound_gen.py builds the WAV files from. Needs
+numpy; SoundManager imports this on its loader thread and does without it
+if numpy is missing.
+"""
+import os
+import numpy as np
+import pygame
+import utils_sound_gen
+
+# Parameters scaled by the pitch factor
+PITCH_PARAMS = ("frequency", "start_freq", "end_freq")
+# Effect name ("score") -> (generator, parameters)
+SYNTH_SPECS = {os.path.splitext(filename)[0]: (generator, params)
+               for filename, generator, params in utils_sound_gen.SOUNDS}
+
+
+def can_synthesize(name):
+    return name in SYNTH_SPECS
+
+
+def warm_up():
+    """Runs every generator once on a tiny buffer so the first real variant doesn't pay numpy's setup costs."""
+    for generator, params in SYNTH_SPECS.values():
+        utils_sound_gen.GENERATORS[generator](**dict(params, duration=0.01))
+
+
+def synthesize(name, pitch=1.0):
+    """Builds a pygame Sound for a named effect, pitch-shifted, in the mixer's own format."""
+    generator, params = SYNTH_SPECS[name]
+    frequency, size, channels = pygame.mixer.get_init()
+    if size != -16:
+        raise ValueError(f"Unsupported mixer sample size: {size}")
+
+    params = dict(params, sample_rate=frequency)
+    for key in PITCH_PARAMS:
+        if key in params:
+            params[key] *= pitch
+    mono = np.frombuffer(utils_sound_gen.GENERATORS[generator](**params), dtype='<i2').astype(np.int16)
+    frames = np.repeat(mono[:, None], channels, axis=1)  # Same sample on every channel
+    return pygame.mixer.Sound(buffer=frames.tobytes())
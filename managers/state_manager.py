@@ -1,12 +1,51 @@
+import time
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, SIM_TICK_MS, SIM_MAX_STEPS, RENDER_MODE, DIRTY_RECT_MAX_COVERAGE, PROFILER_HOTKEY, RECORD_REPLAYS
+from managers.profiler import FrameProfiler
+from managers.replay import InputRecorder
+
 class GameStateManager:
-    def __init__(self, initial_state):
+    def __init__(self, initial_state, tick_ms=SIM_TICK_MS, max_steps=SIM_MAX_STEPS, render_mode=RENDER_MODE,
+                 record_replays=RECORD_REPLAYS):
         self.current_state = initial_state
+        # "dirty": states that implement get_dirty_rects() are presented with
+        # pygame.display.update(rects); everything else still gets a full flip
+        self.render_mode = render_mode
+        self.force_full_flip = True
+        # Times the event/update/draw/flip phases of every state
+        self.profiler = FrameProfiler()
+        # Records each game session (seed, input, held keys) for replay
+        self.recorder = InputRecorder() if record_replays else None
+        # Fixed-timestep scheduler: wall-clock frame time is accumulated and
+        # spent in whole simulation ticks, so game speed doesn't depend on FPS
+        self.tick_ms = tick_ms
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 1.0  # Fraction of a tick left over, used for render interpolation
+        self.sim_ticks = 0
+
+    def get_ticks(self):
+        """
+        Simulation time in milliseconds. Games use the manager as their clock so
+        timers (Snake moves, Tetris drops...) advance with ticks, not wall time.
+        """
+        return int(self.sim_ticks * self.tick_ms)
 
     def get_state(self):
         return self.current_state
 
     def set_state(self, state):
+        if self.recorder:
+            # Sessions start on entering a game (seeded before its reset) and end on leaving it
+            if hasattr(state, 'rng'):
+                self.recorder.begin(state, self.sim_ticks, self.tick_ms)
+            else:
+                self.recorder.end()
         self.current_state = state
+        self.force_full_flip = True
+        self.profiler.reset()
+        if hasattr(self.current_state, 'start_session'):
+            self.current_state.start_session()
         if hasattr(self.current_state, 'reset'):
             self.current_state.reset()
         # If the state has an 'active' flag, set it
@@ -14,10 +53,83 @@ class GameStateManager:
             self.current_state.active = True
 
     def handle_events(self, event):
+        # The window contents may have been lost; repaint everything next frame
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.force_full_flip = True
+        if event.type == pygame.KEYDOWN and event.key == PROFILER_HOTKEY:
+            self.profiler.toggle()
+            self.force_full_flip = True
+            return
+        if self.recorder:
+            self.recorder.record_event(event)
+        start = time.perf_counter()
         self.current_state.handle_events(event)
+        self.profiler.add("event", start)
+
+    def advance(self, frame_ms):
+        """
+        Runs as many fixed simulation ticks as the elapsed frame time allows.
+        Returns the number of ticks that were run.
+        """
+        start = time.perf_counter()
+        self.accumulator += frame_ms
+        steps = 0
+        while self.accumulator >= self.tick_ms and steps < self.max_steps:
+            self.update()
+            self.accumulator -= self.tick_ms
+            steps += 1
+
+        # Too far behind (e.g. window dragged, disk stall): drop the backlog
+        # instead of spiralling, keeping only the partial tick
+        if self.accumulator >= self.tick_ms:
+            self.accumulator %= self.tick_ms
+
+        self.alpha = self.accumulator / self.tick_ms
+        if hasattr(self.current_state, 'render_alpha'):
+            self.current_state.render_alpha = self.alpha
+        self.profiler.add("update", start)
+        return steps
 
     def update(self):
         self.current_state.update()
+        self.sim_ticks += 1
+        if self.recorder:
+            self.recorder.end_tick()
 
     def draw(self):
+        start = time.perf_counter()
         self.current_state.draw()
+        self.profiler.add("draw", start)
+        if self.profiler.visible:
+            state_name = getattr(self.current_state, 'game_name', type(self.current_state).__name__)
+            self.profiler.draw(pygame.display.get_surface(), state_name)
+
+    def present(self):
+        """Pushes the drawn frame to the display (dirty rects or a full flip)."""
+        start = time.perf_counter()
+        rects = None
+        if self.render_mode == "dirty" and hasattr(self.current_state, 'get_dirty_rects'):
+            # Always collect, even when flipping, so the state's diff stays in sync
+            rects = self.current_state.get_dirty_rects()
+
+        # The overlay isn't part of the state's regions, so flip while it's shown
+        if self.force_full_flip or self.profiler.visible or rects is None or self._coverage(rects) > DIRTY_RECT_MAX_COVERAGE:
+            self.force_full_flip = False
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        self.profiler.add("flip", start)
+
+    def shutdown(self):
+        """Finishes any in-progress recording; call before quitting."""
+        if self.recorder:
+            self.recorder.end()
+
+    def end_frame(self, fps):
+        """Closes the profiler's frame; call once per rendered frame."""
+        self.profiler.end_frame(fps)
+
+    def _coverage(self, rects):
+        # Overlaps are counted twice, which only errs towards a full flip
+        area = sum(r.width * r.height for r in rects)
+        return area / (SCREEN_WIDTH * SCREEN_HEIGHT)
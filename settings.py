@@ -6,6 +6,55 @@ SCREEN_HEIGHT = 600
 FPS = 60
 TITLE = "Retro Games Hub"
 
+# Simulation (fixed timestep, independent of the render rate above)
+SIM_FPS = 60                  # Game physics is tuned per tick at this rate
+SIM_TICK_MS = 1000 / SIM_FPS
+SIM_MAX_STEPS = 5             # Catch-up limit per rendered frame; older backlog is dropped
+
+# Rendering
+RENDER_MODE = "full"            # "full" flips every frame; "dirty" pushes only changed regions
+DIRTY_RECT_MAX_COVERAGE = 0.4   # Dirty area (fraction of screen) above which we flip instead
+
+# Frame profiler overlay
+PROFILER_HOTKEY = pygame.K_F3
+PROFILER_HISTORY = 240          # Frames kept for percentiles and the graph
+PROFILER_GRAPH_HEIGHT = 60
+PROFILER_GRAPH_MAX_MS = 33.3    # Graph's vertical scale (two 60 Hz frames)
+
+# Input recording (replays are saved per game session, see managers/replay.py)
+RECORD_REPLAYS = False
+REPLAY_DIR = "replays"
+
+# High scores (SQLite leaderboard, see managers/highscore_manager.py)
+HIGHSCORE_DB = "highscores.db"
+HIGHSCORE_LEGACY_FILE = "highscores.json"       # Imported into the database once
+LOWER_SCORE_IS_BETTER = {"Memory", "Minesweeper"}  # Moves / seconds; every other game is higher-is-better
+LEADERBOARD_SIZE = 10
+
+# Audio: sounds decoded first by the background loader, ahead of the rest
+SOUND_WARM_SET = ("select", "score", "gameover")
+# Voice management: mixer channels shared by all effects, and per sound
+# (priority, max simultaneous voices, cooldown ms). Higher priority steals
+# from lower; repeats inside the cooldown are dropped.
+SOUND_MAX_VOICES = 8
+SOUND_VOICE_RULES = {
+    "gameover": (3, 1, 500),
+    "explosion": (2, 3, 40),
+    "score": (1, 2, 30),
+    "select": (1, 2, 30),
+    "jump": (1, 2, 30),
+    "shoot": (0, 3, 60),
+}
+SOUND_DEFAULT_VOICE_RULE = (1, 2, 30)
+SOUND_VARIANT_CACHE_SIZE = 32   # Pitch-shifted effects synthesized at runtime kept in memory
+
+# Game registry: max constructed games kept alive (None keeps every game played)
+GAME_REGISTRY_MAX_LIVE = None
+
+# Attract mode (games with an autopilot): toggled in-game, off again on every new session
+AUTOPILOT_TOGGLE_KEY = pygame.K_a
+ATTRACT_RESTART_MS = 2000         # Restart this long after a game over while the autopilot plays
+
 # Colors (Neon / Cyberpunk Theme)
 COLORS = {
     "BACKGROUND": (10, 10, 15),      # Very Dark Blue/Black
@@ -29,6 +78,8 @@ FONT_NAME = "arial"  # Fallback
 FONT_SIZE_TITLE = 72
 FONT_SIZE_MENU = 40
 FONT_SIZE_HUD = 28
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by ui.text.TextRenderer
+HUD_TEXT_CACHE_SIZE = 32  # draw_hud() strings, kept apart so changing numbers don't evict labels
 
 # Game Specific Settings
 
@@ -38,11 +89,43 @@ TETRIS_ROWS = 20
 TETRIS_CELL_SIZE = 28
 TETRIS_OFFSET_X = (SCREEN_WIDTH - (TETRIS_COLS * TETRIS_CELL_SIZE)) // 2
 TETRIS_OFFSET_Y = (SCREEN_HEIGHT - (TETRIS_ROWS * TETRIS_CELL_SIZE)) // 2
+# Auto-shift while left/right is held: first repeat das ms after the press, then
+# one cell every arr ms (0: straight to the wall). Timed in ms, not frames.
+TETRIS_INPUT_PROFILES = {
+    "classic": {"das": 267, "arr": 100},  # NES-like: 16 and 6 frames
+    "standard": {"das": 167, "arr": 33},  # 10 and 2 frames
+    "fast": {"das": 100, "arr": 0},
+}
+TETRIS_INPUT_PROFILE = "standard"
+# Autopilot (games/tetris_ai.py), for attract mode and headless marathons
+TETRIS_AI_TIME_BUDGET_MS = 1.0    # Search time per tick; a decision spreads over a few dozen ticks
+TETRIS_AI_PLACEMENT_BUDGET = 40   # Boards scored per tick (under 1 ms); the only cap where runs must be deterministic
+TETRIS_AI_WEIGHTS = {"height": -0.510066, "lines": 0.760666, "holes": -0.35663, "bumpiness": -0.184483}
 
 # Snake
 SNAKE_CELL_SIZE = 20
 SNAKE_GRID_WIDTH = SCREEN_WIDTH // SNAKE_CELL_SIZE
 SNAKE_GRID_HEIGHT = SCREEN_HEIGHT // SNAKE_CELL_SIZE
+SNAKE_LARGE_GRID = (1000, 1000)   # "Snake XL": world in cells, viewed through a scrolling camera
+SNAKE_CAMERA_SMOOTHING = 0.25     # Fraction of the way to the head the camera moves per frame
+SNAKE_MINIMAP_SIZE = 120
+# Autopilot (games/snake_ai.py): attract mode and headless soak tests
+SNAKE_AI_TIME_BUDGET_MS = 1.0     # Planning time per tick, the whole tick under one deadline
+SNAKE_AI_NODE_BUDGET = 400        # Path search nodes per tick; the only cap where runs must be deterministic
+SNAKE_AI_FLOOD_LIMIT = 400        # Cells counted when judging a fallback move
+SNAKE_AI_RETRY_TICKS = 30         # Ticks before a target that failed the tail check is tried again
+SNAKE_AI_STALE_FACTOR = 4         # Search tree size (x distance) before re-aiming at the moved head
+# Snake Arena (games/snake_arena.py): the player among many AI snakes on one board
+SNAKE_ARENA_GRID = (160, 120)     # Whole board on screen at 5 px per cell
+SNAKE_ARENA_SNAKES = 80           # AI snakes besides the player
+SNAKE_ARENA_FOOD = 250            # Food kept on the board (dead snakes drop more)
+SNAKE_ARENA_START_LENGTH = 4
+SNAKE_ARENA_MOVE_MS = 100
+SNAKE_ARENA_RESPAWN_MS = 1500
+SNAKE_ARENA_FOOD_SAMPLES = 6      # Food cells an AI snake compares when it needs a new target
+SNAKE_ARENA_LOOKAHEAD = 24        # Cells an AI snake flood-fills before moving into a tight spot
+SNAKE_ARENA_COLORS = [(255, 120, 0), (255, 0, 100), (160, 90, 255), (255, 220, 0),
+                      (0, 140, 255), (255, 255, 255), (255, 90, 190), (120, 255, 160)]
 
 # Breakout
 BREAKOUT_PADDLE_WIDTH = 100
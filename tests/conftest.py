@@ -0,0 +1,17 @@
+import os
+import sys
+
+# Headless pygame: no window, no audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+@pytest.fixture(scope="session")
+def screen():
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -0,0 +1,85 @@
+import json
+import threading
+import pytest
+import managers.highscore_manager as highscore_manager
+from managers.highscore_manager import HighscoreManager
+
+
+@pytest.fixture
+def store(tmp_path):
+    manager = HighscoreManager(str(tmp_path / "scores.db"), legacy_path=None, coalesce_seconds=0)
+    yield manager
+    manager.close()
+
+
+def reopen(manager):
+    manager.close()
+    return HighscoreManager(manager.path, legacy_path=None, coalesce_seconds=0)
+
+
+def test_no_runs_has_no_best(store):
+    assert store.get_score("Minesweeper") is None
+    assert store.get_score("Snake") is None
+    assert store.top_scores("Snake") == []
+
+
+def test_higher_is_better(store):
+    assert store.save_score("Snake", 10)
+    assert not store.save_score("Snake", 5)
+    assert store.save_score("Snake", 30)
+    assert store.get_score("Snake") == 30
+    assert [score for score, _ in store.top_scores("Snake")] == [30, 10, 5]
+
+
+def test_lower_is_better(store):
+    # Minesweeper is timed in seconds (LOWER_SCORE_IS_BETTER); 0 is a real best
+    assert store.save_score("Minesweeper", 40)
+    assert not store.save_score("Minesweeper", 90)
+    assert store.save_score("Minesweeper", 0)
+    assert store.get_score("Minesweeper") == 0
+    assert [score for score, _ in store.top_scores("Minesweeper")] == [0, 40, 90]
+
+
+def test_runs_are_committed(store):
+    store.save_score("Snake", 7)
+    store.save_score("Memory", 12)
+    assert store.flush()
+    store = reopen(store)
+    try:
+        assert store.get_score("Snake") == 7
+        assert store.get_score("Memory") == 12
+    finally:
+        store.close()
+
+
+def test_legacy_json_imported_once(tmp_path):
+    legacy = tmp_path / "highscores.json"
+    # The old file kept Minesweeper as 1000 - seconds
+    legacy.write_text(json.dumps({"Snake": 50, "Minesweeper": 900}))
+    path = str(tmp_path / "scores.db")
+    manager = HighscoreManager(path, legacy_path=str(legacy), coalesce_seconds=0)
+    assert manager.get_score("Snake") == 50
+    assert manager.get_score("Minesweeper") == 100
+    manager.close()
+
+    manager = HighscoreManager(path, legacy_path=str(legacy), coalesce_seconds=0)
+    try:
+        assert [score for score, _ in manager.top_scores("Snake")] == [50]
+    finally:
+        manager.close()
+
+
+def test_flush_returns_when_writer_failed(tmp_path, monkeypatch):
+    connect = highscore_manager._connect
+
+    def writer_cannot_connect(path):
+        if threading.current_thread().name == "highscore-writer":
+            raise highscore_manager.sqlite3.OperationalError("unable to open database file")
+        return connect(path)
+    monkeypatch.setattr(highscore_manager, "_connect", writer_cannot_connect)
+
+    manager = HighscoreManager(str(tmp_path / "scores.db"), legacy_path=None, coalesce_seconds=0)
+    manager.save_score("Snake", 1)
+    assert manager.flush(timeout=None) is False  # Would wait forever on a dead writer
+    assert manager.writer_error is not None
+    manager.close()
@@ -0,0 +1,90 @@
+import random
+import pygame
+import pytest
+from games.headless import HeadlessRunner, KeyboardState, key_event
+from games.registry import GAME_ENTRIES, GameRegistry
+from games.snake import SnakeGame
+from managers.replay import ReplayPlayer
+from managers.state_manager import GameStateManager
+from settings import *
+
+
+class Menu:
+    """Stands in for MainMenu: the state the manager returns to between sessions."""
+    def handle_events(self, event):
+        pass
+
+    def update(self):
+        pass
+
+
+@pytest.fixture
+def hub(screen, tmp_path):
+    """(state manager recording to tmp_path, game registry, menu state)."""
+    manager = GameStateManager(None, record_replays=True)
+    manager.recorder.output_dir = str(tmp_path)
+    menu = Menu()
+    registry = GameRegistry(screen, lambda: manager.set_state(menu), clock=manager)
+    manager.set_state(menu)
+    return manager, registry, menu
+
+
+def play_session(manager, registry, menu, name, frames, first_events=()):
+    """Enters a game, plays random input for a number of frames, leaves it, and replays the recording."""
+    game = registry[name]
+    keyboard = KeyboardState()
+    game.input = keyboard
+    manager.set_state(game)
+    for event in first_events:
+        manager.handle_events(event)
+    rnd = random.Random(name)
+    for frame in range(frames):
+        if frame % 7 == 0:
+            keyboard.release_all()
+            keyboard.press(rnd.choice([pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_w]))
+            manager.handle_events(key_event(rnd.choice([pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_SPACE, pygame.K_DOWN])))
+            pos = (rnd.randrange(SCREEN_WIDTH), rnd.randrange(SCREEN_HEIGHT))
+            manager.handle_events(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=rnd.choice([1, 3]), pos=pos))
+        manager.advance(rnd.choice([8, 16.7, 33, 50]))
+    manager.handle_events(key_event(pygame.K_ESCAPE))
+    if manager.current_state is not menu:
+        manager.set_state(menu)
+    return ReplayPlayer(manager.recorder.last_path).run()
+
+
+@pytest.mark.parametrize("name", [entry[0] for entry in GAME_ENTRIES])
+def test_replay_round_trip(hub, name):
+    manager, registry, menu = hub
+    result = play_session(manager, registry, menu, name, 600)
+    assert result["match"]
+    assert result["ticks"] > 0
+
+
+@pytest.mark.parametrize("name", ["Snake", "Tetris", "Snake Arena"])
+def test_autopilot_is_per_session(hub, name):
+    # Attract mode switched on in one session must not leak into the next one's replay
+    manager, registry, menu = hub
+    assert play_session(manager, registry, menu, name, 120, [key_event(AUTOPILOT_TOGGLE_KEY)])["match"]
+    result = play_session(manager, registry, menu, name, 300)
+    assert result["match"]
+
+
+def test_input_profile_is_per_session(hub):
+    manager, registry, menu = hub
+    play_session(manager, registry, menu, "Tetris", 60)
+    registry["Tetris"].set_input_profile("fast")  # e.g. left over from a tool or benchmark
+    assert play_session(manager, registry, menu, "Tetris", 300)["match"]
+
+
+def test_snake_autopilot_deadline_only_when_not_recorded(hub):
+    manager, registry, menu = hub
+    game = registry["Snake"]
+    manager.set_state(game)
+    manager.handle_events(key_event(AUTOPILOT_TOGGLE_KEY))
+    assert game.autopilot.time_budget_ms is None  # A timer would make the replay diverge
+    manager.set_state(menu)
+    assert not game.recorded
+
+    runner = HeadlessRunner(SnakeGame)
+    runner.step([key_event(AUTOPILOT_TOGGLE_KEY)])
+    assert runner.game.autopilot.time_budget_ms == SNAKE_AI_TIME_BUDGET_MS
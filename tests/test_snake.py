@@ -0,0 +1,42 @@
+from games.headless import HeadlessRunner
+from games.snake import SnakeGame
+from games.snake_ai import SnakeAutopilot
+
+
+def assert_free_index(game):
+    """occupied, free_cells and free_slot all describe the board the snake deque says."""
+    body = {y * game.grid_width + x for x, y in game.snake}
+    assert len(body) == len(game.snake)
+    assert {cell for cell, taken in enumerate(game.occupied) if taken} == body
+    assert len(game.free_cells) + len(body) == game.grid_width * game.grid_height
+    assert set(game.free_cells) == set(range(len(game.occupied))) - body
+    for slot, cell in enumerate(game.free_cells):
+        assert game.free_slot[cell] == slot
+    assert all(game.free_slot[cell] == -1 for cell in body)
+    if game.food:
+        assert not game.occupied[game.food[1] * game.grid_width + game.food[0]]
+
+
+def test_free_cell_index_follows_the_snake():
+    runner = HeadlessRunner(SnakeGame, seed=11)
+    game = runner.game
+    autopilot = SnakeAutopilot(time_budget_ms=None)
+    powerups = []
+    apply_powerup = game._apply_powerup
+
+    def record_powerup(p_type):
+        powerups.append(p_type)
+        apply_powerup(p_type)
+    game._apply_powerup = record_powerup
+
+    eaten = 0
+    for _ in range(6000):
+        if game.game_over:
+            game.reset()
+        game.move_interval = 0  # A move every tick
+        length = len(game.snake)
+        runner.step(autopilot(runner) or ())
+        eaten += len(game.snake) > length
+        assert_free_index(game)
+    assert eaten > 20
+    assert "CUT" in powerups and len(set(powerups)) > 2
@@ -0,0 +1,74 @@
+from array import array
+from collections import deque
+from games.headless import HeadlessRunner
+from games.snake_arena import SnakeArenaGame, PLAYER
+
+
+def arena(*snakes):
+    """
+    Empty 20x10 arena holding exactly the given snakes, as (cells head first,
+    direction); snake 0 is the player. Every snake keeps going its own way.
+    """
+    runner = HeadlessRunner(SnakeArenaGame, grid_size=(20, 10), snake_count=len(snakes) - 1, seed=1)
+    game = runner.game
+    cells = game.grid_width * game.grid_height
+    game.owner = array('H', [0]) * cells
+    game.food = bytearray(cells)
+    game.food_cells = array('i')
+    game.food_slot = array('i', [-1]) * cells
+    for i, (body, direction) in enumerate(snakes):
+        snake = game.snakes[i]
+        snake['body'] = deque(y * game.grid_width + x for x, y in body)
+        for cell in snake['body']:
+            game.owner[cell] = i + 1
+        snake['direction'] = snake['next_direction'] = direction
+        snake['alive'] = True
+    game._think = lambda snake: snake['next_direction']
+    return game
+
+
+def head(game, index):
+    cell = game.snakes[index]['body'][0]
+    return cell % game.grid_width, cell // game.grid_width
+
+
+def test_head_on_both_die():
+    # Heads on neighbouring cells, each moving into the other's
+    game = arena(([(5, 5), (4, 5), (3, 5), (2, 5)], (1, 0)),
+                 ([(6, 5), (7, 5), (8, 5)], (-1, 0)))
+    game._step_snakes()
+    assert not game.snakes[PLAYER]['alive'] and not game.snakes[1]['alive']
+    assert game.game_over
+    assert game.kills == 1  # The AI ran into the player
+
+
+def test_longer_snake_wins_the_contested_cell():
+    game = arena(([(4, 5), (3, 5), (2, 5), (1, 5)], (1, 0)),
+                 ([(6, 5), (7, 5), (8, 5)], (-1, 0)))
+    game._step_snakes()
+    assert game.snakes[PLAYER]['alive'] and not game.snakes[1]['alive']
+    assert head(game, PLAYER) == (5, 5)
+    assert game.kills == 1
+    assert not game.game_over
+
+
+def test_equal_lengths_both_die_on_the_contested_cell():
+    game = arena(([(4, 5), (3, 5), (2, 5)], (1, 0)),
+                 ([(6, 5), (7, 5), (8, 5)], (-1, 0)),
+                 ([(5, 3), (5, 2), (5, 1)], (0, 1)))  # Not contesting; moves to (5, 4)
+    game._step_snakes()
+    assert not game.snakes[PLAYER]['alive'] and not game.snakes[1]['alive']
+    assert game.snakes[2]['alive'] and head(game, 2) == (5, 4)
+    assert game.kills == 0
+    assert game.owner[5 * game.grid_width + 5] == 0
+
+
+def test_tail_leaving_this_tick_still_blocks():
+    # The AI's tail at (5, 5) moves away this tick, but tails count, as in Snake
+    game = arena(([(4, 5), (3, 5), (2, 5)], (1, 0)),
+                 ([(6, 4), (6, 5), (5, 5)], (0, -1)))
+    game._step_snakes()
+    assert not game.snakes[PLAYER]['alive']
+    assert game.snakes[1]['alive'] and head(game, 1) == (6, 3)
+    assert game.owner[5 * game.grid_width + 5] == 0
+    assert game.game_over
@@ -0,0 +1,113 @@
+import threading
+import pytest
+from managers import sound_manager
+from managers.sound_manager import SoundManager
+
+
+class FakeSound:
+    def __init__(self, name):
+        self.name = name
+
+    def set_volume(self, volume):
+        pass
+
+
+class FakeChannel:
+    """Mixer channel that stays busy with whatever it last played."""
+    def __init__(self):
+        self.sound = None
+
+    def get_busy(self):
+        return self.sound is not None
+
+    def set_volume(self, volume):
+        pass
+
+    def play(self, sound):
+        self.sound = sound
+
+
+class FakeSynth:
+    """Stands in for managers.sound_synth; remembers which thread did the work."""
+    def __init__(self):
+        self.threads = []
+
+    def can_synthesize(self, name):
+        return True
+
+    def synthesize(self, name, pitch):
+        self.threads.append(threading.current_thread().name)
+        return FakeSound(f"{name}@{pitch}")
+
+
+@pytest.fixture
+def sounds(tmp_path, monkeypatch):
+    """(SoundManager on fake channels with every effect decoded, function setting the clock in ms)."""
+    now = [0]
+    monkeypatch.setattr(sound_manager.pygame.time, "get_ticks", lambda: now[0])
+    manager = SoundManager(sound_dir=str(tmp_path / "missing"))
+    manager.channels = [FakeChannel() for _ in range(3)]
+    manager.voices = [None] * 3
+    for name in sound_manager.SOUND_FILES:
+        manager.sounds[name] = FakeSound(name)
+
+    def set_time(ms):
+        now[0] = ms
+    return manager, set_time
+
+
+def playing(manager):
+    return [channel.sound.name if channel.sound else None for channel in manager.channels]
+
+
+def test_steals_oldest_lowest_priority_voice(sounds):
+    manager, set_time = sounds
+    for t, name in enumerate(["shoot", "explosion", "shoot"]):
+        set_time(t * 100)
+        manager.play(name)
+    set_time(300)
+    manager.play("gameover")  # Every channel busy: the older of the two shoots goes
+    assert playing(manager) == ["gameover", "explosion", "shoot"]
+
+    set_time(400)
+    manager.play("explosion")  # Lowest priority goes first, even though it's newer
+    assert playing(manager) == ["gameover", "explosion", "explosion"]
+    set_time(500)
+    manager.play("shoot")  # Nothing at or below its priority to steal: dropped
+    assert playing(manager) == ["gameover", "explosion", "explosion"]
+    assert manager.voices[2][2] == 400
+
+
+def test_sound_stays_within_its_voice_cap(sounds):
+    manager, set_time = sounds
+    set_time(0)
+    manager.play("gameover")
+    set_time(1000)
+    manager.play("gameover")  # Cap of one voice: replaces itself, free channels stay free
+    assert playing(manager) == ["gameover", None, None]
+    assert manager.voices[0][2] == 1000
+
+
+def test_variants_are_synthesized_off_the_game_thread(sounds):
+    manager, set_time = sounds
+    manager.synth = synth = FakeSynth()
+    manager.play("score", pitch=1.5)
+    assert playing(manager)[0] == "score"  # Base sound until the variant is ready
+    manager.wait_until_loaded(5)
+    assert synth.threads == ["sound-loader"]
+
+    set_time(1000)
+    manager.play("score", pitch=1.5)
+    assert "score@1.5" in playing(manager)
+
+
+def test_undecoded_sound_is_queued_not_synthesized(sounds):
+    manager, set_time = sounds
+    manager.synth = synth = FakeSynth()
+    del manager.sounds["explosion"]
+    manager.register("explosion", "explosion.wav")
+    manager.wait_until_loaded(5)  # File is missing, so it stays undecoded
+    manager.play("explosion")
+    manager.wait_until_loaded(5)
+    assert playing(manager) == [None, None, None]
+    assert synth.threads == []
@@ -0,0 +1,212 @@
+import pygame
+import pytest
+from games.headless import HeadlessRunner, key_event
+from games.tetris import (TetrisGame, EMPTY_ROW, BOARD_PAD, I_PIECE, O_PIECE, spawn_position, collides, rotate,
+                          PIECE_STATES)
+from games.tetris_ai import TetrisAutopilot, board_features, place
+from settings import *
+
+
+def grid_rows(game):
+    """The bitboard rows the colour grid says the board should have."""
+    return [EMPTY_ROW | sum(1 << (c + BOARD_PAD) for c, color in enumerate(row) if color) for row in game.grid]
+
+
+def board(*lines):
+    """Bitboard rows from strings drawn top to bottom ('#' block, '.' empty), padded with empty rows above."""
+    rows = [EMPTY_ROW | sum(1 << (c + BOARD_PAD) for c, cell in enumerate(line) if cell == "#") for line in lines]
+    return [EMPTY_ROW] * (TETRIS_ROWS - len(rows)) + rows
+
+
+T_PIECE = 2
+
+
+def assert_layer_matches_grid(game):
+    # The incrementally updated layer against one drawn from scratch
+    expected = game._build_locked_layer()
+    assert pygame.image.tobytes(game.locked_layer, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_bitboard_and_locked_layer_follow_grid():
+    runner = HeadlessRunner(TetrisGame, restart_on_game_over=True, render_every=1, seed=7)
+    game = runner.game
+    autopilot = TetrisAutopilot(placement_budget=None, time_budget_ms=None)
+    lines = 0
+    for tick in range(4000):
+        score = game.score
+        runner.step(autopilot(runner) or ())
+        assert game.rows == grid_rows(game)
+        if game.score > score:
+            lines += 1
+            assert_layer_matches_grid(game)
+        elif tick % 250 == 0:
+            assert_layer_matches_grid(game)
+    assert lines > 10
+
+
+def test_multi_line_clear_keeps_layer_in_step():
+    runner = HeadlessRunner(TetrisGame, seed=1)
+    game = runner.game
+    # Three full rows with a one-cell well in column 0, and a stray block above them
+    for r in range(TETRIS_ROWS - 3, TETRIS_ROWS):
+        game.set_row(r, [0] + [COLORS["ACCENT"]] * (TETRIS_COLS - 1))
+    game.set_row(TETRIS_ROWS - 4, [0, 0, COLORS["DANGER"]] + [0] * (TETRIS_COLS - 3))
+    game.draw()  # Builds the layer, so the clear below has to update it in place
+
+    x, y = spawn_position(I_PIECE)
+    game.current_piece = {'kind': I_PIECE, 'rotation': 0, 'color': COLORS["WARNING"], 'x': x, 'y': y}
+    assert game._rotate(1)
+    while game._move(-1, 0):
+        pass
+    game._hard_drop()
+
+    assert game.score == 300
+    assert game.rows == grid_rows(game)
+    assert game.grid[-1] == [COLORS["WARNING"], 0, COLORS["DANGER"]] + [0] * (TETRIS_COLS - 3)
+    assert_layer_matches_grid(game)
+
+
+def test_board_features():
+    rows = board(
+        "#.........",
+        "...#......",
+        "##.#......",
+    )
+    # Heights 3,1,0,2 (6); a hole under column 0's top; bumpiness |3-1| + |1-0| + |0-2| + |2-0|
+    assert board_features(rows) == (6, 1, 7)
+    assert board_features(board()) == (0, 0, 0)
+
+
+def test_place_clears_lines():
+    rows = board(
+        "#########.",
+        "#########.",
+    )
+    # Vertical I (rotation 1 has its blocks in box column 2) dropped down the right-hand well
+    placed, lines = place(rows, I_PIECE, 1, TETRIS_COLS - 3, TETRIS_ROWS - 4)
+    assert lines == 2
+    assert placed == board(".........#", ".........#")
+    assert place(rows, I_PIECE, 1, TETRIS_COLS - 3, -3) is None  # Locks above the top
+
+
+def test_autopilot_finds_the_tetris():
+    runner = HeadlessRunner(TetrisGame, seed=2)
+    game = runner.game
+    for r, row in enumerate(board("#########.", "#########.", "#########.", "#########.")):
+        game.set_row(r, [COLORS["GRID"] if row >> (c + BOARD_PAD) & 1 else 0 for c in range(TETRIS_COLS)])
+    x, y = spawn_position(I_PIECE)
+    game.current_piece = {'kind': I_PIECE, 'rotation': 0, 'color': COLORS["WARNING"], 'x': x, 'y': y}
+    autopilot = TetrisAutopilot(game, placement_budget=None, time_budget_ms=None)
+    piece = game.current_piece
+    while game.current_piece is piece:
+        autopilot.tick()
+    assert game.score == 400
+    assert game.rows == [EMPTY_ROW] * TETRIS_ROWS
+
+
+def test_search_stops_at_the_budgets():
+    game = HeadlessRunner(TetrisGame, seed=3).game
+    autopilot = TetrisAutopilot(game, placement_budget=25, time_budget_ms=None)
+    autopilot.tick()
+    assert autopilot.evaluated == 25 and autopilot.plan is None
+    autopilot = TetrisAutopilot(game, placement_budget=None, time_budget_ms=0)
+    autopilot.tick()
+    assert autopilot.evaluated == 1  # A deadline already passed still lets one board through
+
+
+def test_jlstz_wall_kick():
+    # T pointing right with its stem against the left wall; turning back to spawn
+    # doesn't fit in place, so SRS kick 2 (one column right) applies
+    top, masks, _ = PIECE_STATES[T_PIECE][1]
+    assert not collides(board(), masks, -1, 5 + top)
+    assert rotate(board(), T_PIECE, 1, -1, -1, 5) == (0, 0, 5)
+
+
+def test_jlstz_floor_kick_goes_up():
+    # T flat on the floor turning clockwise: kick 3 is (-1, +1) in SRS's y-up
+    # terms, one row up on the board. With the sign wrong, kick 4 would fire instead.
+    assert rotate(board(), T_PIECE, 0, 1, 3, TETRIS_ROWS - 2) == (1, 2, TETRIS_ROWS - 3)
+
+
+def test_i_floor_kick():
+    # Flat I on the floor turning upright: only kick 5, (+1, +2), fits
+    assert rotate(board(), I_PIECE, 0, 1, 3, TETRIS_ROWS - 2) == (1, 4, TETRIS_ROWS - 4)
+
+
+def test_i_wall_kick():
+    # Upright I against the right wall turning flat: kick 2 moves it one column left
+    assert rotate(board(), I_PIECE, 1, 1, TETRIS_COLS - 3, 5) == (2, TETRIS_COLS - 4, 5)
+
+
+def test_rotation_refused_when_no_kick_fits():
+    rows = board(*["####.#####"] * 4)
+    assert rotate(rows, I_PIECE, 1, 1, 2, TETRIS_ROWS - 4) is None
+    assert rotate(rows, I_PIECE, 1, -1, 2, TETRIS_ROWS - 4) is None
+
+
+def shift_runner(profile):
+    """Runner on a 1 ms clock with an O piece at spawn that never falls, so only shifting moves it."""
+    runner = HeadlessRunner(TetrisGame, tick_ms=1, seed=4)
+    game = runner.game
+    game.set_input_profile(profile)
+    x, y = spawn_position(O_PIECE)
+    game.current_piece = {'kind': O_PIECE, 'rotation': 0, 'color': COLORS["WARNING"], 'x': x, 'y': y}
+    game.drop_interval = 10 ** 9
+    return runner
+
+
+def press(runner, key):
+    runner.keyboard.press(key)
+    runner.game.handle_events(key_event(key))
+
+
+def run_until(runner, ms):
+    while runner.clock.get_ticks() <= ms:
+        runner.step()
+
+
+@pytest.mark.parametrize("profile", list(TETRIS_INPUT_PROFILES))
+def test_auto_shift_follows_das_and_arr(profile):
+    runner = shift_runner(profile)
+    game = runner.game
+    das, arr = game.das, game.arr
+    start = game.current_piece['x']
+    # One move on the press, then at das, das + arr, das + 2 * arr... until the wall at column 0
+    due = [0] + [das + i * arr for i in range(start - 1)]
+    press(runner, pygame.K_LEFT)
+    for ms in range(das + start * arr + 5):
+        run_until(runner, ms)
+        assert game.current_piece['x'] == start - sum(1 for t in due if t <= ms), ms
+    assert game.current_piece['x'] == 0
+
+
+def test_zero_arr_travels_to_the_wall_at_das():
+    runner = shift_runner("fast")
+    game = runner.game
+    press(runner, pygame.K_RIGHT)
+    run_until(runner, game.das - 1)
+    assert game.current_piece['x'] == spawn_position(O_PIECE)[0] + 1
+    run_until(runner, game.das)
+    assert game.current_piece['x'] == TETRIS_COLS - 2
+
+
+def test_latest_shift_key_wins():
+    runner = shift_runner("classic")
+    game = runner.game
+    start = game.current_piece['x']
+    press(runner, pygame.K_LEFT)
+    run_until(runner, 100)
+    pressed = runner.clock.get_ticks()
+    press(runner, pygame.K_RIGHT)  # Both held now: right takes over, with its own delay
+    assert game.current_piece['x'] == start
+    run_until(runner, pressed + game.das - 1)
+    assert game.current_piece['x'] == start
+    run_until(runner, pressed + game.das)
+    assert game.current_piece['x'] == start + 1
+
+    runner.keyboard.release(pygame.K_RIGHT)  # Left is still held and takes back over after das
+    release = runner.clock.get_ticks()
+    run_until(runner, release + game.das - 1)
+    assert game.current_piece['x'] == start + 1
+    run_until(runner, release + game.das)
+    assert game.current_piece['x'] == start
@@ -0,0 +1,16 @@
+from ui.text import TextRenderer
+
+
+def test_changing_hud_text_keeps_labels_cached(screen):
+    text = TextRenderer()
+    font = text.get_font(20)
+    labels = [text.render(font, f"Label {i}", (255, 255, 255)) for i in range(20)]
+
+    # A per-frame timer: a new string every frame, far more than either cache holds
+    for frame in range(1000):
+        text.draw_hud(screen, font, f"{frame * 16.7:.1f} ms", (255, 255, 0), (0, 0))
+
+    misses = text.misses
+    assert [text.render(font, f"Label {i}", (255, 255, 255)) for i in range(20)] == labels
+    assert text.misses == misses
+    assert len(text.hud_surfaces) == text.max_hud_entries
@@ -0,0 +1,50 @@
+import pygame
+
+
+class DirtyTracker:
+    """
+    Works out which screen regions changed between two frames.
+
+    While drawing, a state calls track(key, rect, signature) for every region
+    whose look depends on some piece of state (a board cell, a HUD line...).
+    collect() then returns the rects whose signature or position changed since
+    the previous frame (old and new position when something moved), or None
+    when there is nothing to diff against yet and the whole screen must be
+    pushed.
+    """
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.previous = None
+        self.current = {}
+
+    def track(self, key, rect, signature=None):
+        if self.enabled:
+            self.current[key] = (pygame.Rect(rect), signature)
+
+    def invalidate(self):
+        """Forget the previous frame so the next collect() asks for a full update."""
+        self.previous = None
+
+    def collect(self):
+        if not self.enabled:
+            return None
+
+        previous, current = self.previous, self.current
+        self.previous = current
+        self.current = {}
+        if previous is None:
+            return None
+
+        rects = []
+        for key, (rect, signature) in current.items():
+            old = previous.get(key)
+            if old is None:
+                rects.append(rect)
+            elif old[1] != signature or old[0] != rect:
+                rects.append(rect)
+                if old[0] != rect:
+                    rects.append(old[0])
+        for key, (rect, _) in previous.items():
+            if key not in current:
+                rects.append(rect)
+        return rects
@@ -1,31 +1,59 @@
 import pygame
 import random
 from settings import *
+from ui.dirty import DirtyTracker
+from ui.text import text_renderer
+
+PARTICLE_COLORS = [COLORS["ACCENT"], COLORS["HIGHLIGHT"], COLORS["GRID"]]
 
 class MainMenu:
-    def __init__(self, screen, game_manager, games_dict):
+    def __init__(self, screen, game_manager, games_dict, highscore_manager=None):
         self.screen = screen
         self.game_manager = game_manager
-        self.games = games_dict # Dictionary of {"Name": GameInstance}
+        self.games = games_dict # {"Name": GameInstance} mapping, usually a lazy GameRegistry
+        self.highscore_manager = highscore_manager
         self.game_names = list(self.games.keys()) + ["Quit"]
         self.selected_index = 0
-        self.font_title = pygame.font.SysFont(FONT_NAME, FONT_SIZE_TITLE)
-        self.font_menu = pygame.font.SysFont(FONT_NAME, FONT_SIZE_MENU)
-        self.font_small = pygame.font.SysFont(FONT_NAME, 20)
+        self.text = text_renderer
+        self.font_title = self.text.get_font(FONT_SIZE_TITLE)
+        self.font_menu = self.text.get_font(FONT_SIZE_MENU)
+        self.font_small = self.text.get_font(20)
+        self.dirty_tracker = DirtyTracker(enabled=RENDER_MODE == "dirty")
         
+        # Static parts of the menu (title, panel, entries, instructions) are
+        # baked into one layer, rebuilt only when names/selection/scores change
+        self.layer = None
+        self.layer_key = None
+        self.layer_rect = None
+        self.row_rects = []
+
         # Background Particles
+        self.particle_sheet = self._build_particle_sheet()
         self.particles = []
         for _ in range(50):
             self.particles.append(self._create_particle())
 
     def _create_particle(self):
-        return {
+        particle = {
             'x': random.randint(0, SCREEN_WIDTH),
             'y': random.randint(0, SCREEN_HEIGHT),
             'speed': random.randint(1, 3),
             'size': random.randint(1, 3),
-            'color': random.choice([COLORS["ACCENT"], COLORS["HIGHLIGHT"], COLORS["GRID"]])
+            'color': random.choice(PARTICLE_COLORS)
         }
+        # Cell of this particle's sprite in the particle sheet
+        particle['area'] = pygame.Rect((particle['size'] - 1) * 3, PARTICLE_COLORS.index(particle['color']) * 3,
+                                       particle['size'], particle['size'])
+        return particle
+
+    def _build_particle_sheet(self):
+        # One 3x3 cell per (colour, size); particles are blitted from it in a batch
+        sheet = pygame.Surface((9, 3 * len(PARTICLE_COLORS)))
+        sheet.fill(COLORS["BACKGROUND"])
+        for row, color in enumerate(PARTICLE_COLORS):
+            for size in range(1, 4):
+                sheet.fill(color, ((size - 1) * 3, row * 3, size, size))
+        return sheet
 
     def handle_events(self, event):
         if event.type == pygame.KEYDOWN:
@@ -51,19 +79,39 @@ class MainMenu:
     def draw(self):
         self.screen.fill(COLORS["BACKGROUND"])
         
-        # Draw Particles
-        for p in self.particles:
-            pygame.draw.rect(self.screen, p['color'], (p['x'], p['y'], p['size'], p['size']))
+        # Draw Particles (one batched blit from the sprite sheet)
+        sheet = self.particle_sheet
+        self.screen.blits([(sheet, (p['x'], p['y']), p['area']) for p in self.particles], doreturn=False)
+        for i, p in enumerate(self.particles):
+            self.dirty_tracker.track(("particle", i), (p['x'], p['y'], p['size'], p['size']), p['color'])
+
+        # Draw Title, Panel, Entries and Instructions
+        scores = tuple(self._best_score(name) for name in self.game_names)
+        key = (tuple(self.game_names), self.selected_index, scores)
+        if key != self.layer_key:
+            self.layer = self._build_layer(scores)
+            self.layer_key = key
+            self.layer_rect = self.layer.get_bounding_rect()
+        self.screen.blit(self.layer, self.layer_rect, self.layer_rect, pygame.BLEND_PREMULTIPLIED)
+
+        self.dirty_tracker.track("panel", self.panel_rect, len(self.game_names))
+        for i, row_rect in enumerate(self.row_rects):
+            self.dirty_tracker.track(("row", i), row_rect, (self.game_names[i], i == self.selected_index, scores[i]))
+
+    def _build_layer(self, scores):
+        # Composed in premultiplied alpha so antialiased text over the shadow and
+        # the translucent panel comes out exactly as if drawn on the screen
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
 
         # Draw Title
-        title_surf = self.font_title.render(TITLE, True, COLORS["ACCENT"])
+        title_surf = self.text.render(self.font_title, TITLE, COLORS["ACCENT"])
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 80))
         
         # Simple Shadow for Title
-        shadow_surf = self.font_title.render(TITLE, True, COLORS["HIGHLIGHT"])
+        shadow_surf = self.text.render(self.font_title, TITLE, COLORS["HIGHLIGHT"])
         shadow_rect = shadow_surf.get_rect(center=(SCREEN_WIDTH // 2 + 3, 80 + 3))
-        self.screen.blit(shadow_surf, shadow_rect)
-        self.screen.blit(title_surf, title_rect)
+        self._blit_premultiplied(layer, shadow_surf, shadow_rect)
+        self._blit_premultiplied(layer, title_surf, title_rect)
 
         # Draw Menu Panel - size to fit all games (scroll-friendly if more added later)
         panel_width = 500
@@ -74,13 +122,12 @@ class MainMenu:
         panel_rect = pygame.Rect((SCREEN_WIDTH - panel_width) // 2, 150, panel_width, panel_height)
         start_y = panel_rect.top + 22
         line_height = (panel_height - 44) // num_items  # even spacing
+        self.panel_rect = panel_rect
+        self.row_rects = []
 
         # Semi-transparent background for panel
-        s = pygame.Surface((panel_width, panel_height))
-        s.set_alpha(50)
-        s.fill(COLORS["GRID"])
-        self.screen.blit(s, panel_rect.topleft)
-        pygame.draw.rect(self.screen, COLORS["ACCENT"], panel_rect, 2)
+        layer.fill((*(c * 50 // 255 for c in COLORS["GRID"]), 50), panel_rect)
+        pygame.draw.rect(layer, COLORS["ACCENT"], panel_rect, 2)
 
         # Draw Menu Options with High Scores aligned
         item_font = self.font_small if num_items > 8 else self.font_menu
@@ -88,12 +135,13 @@ class MainMenu:
         for i, name in enumerate(self.game_names):
             y_pos = start_y + i * line_height
             row_center_y = y_pos + line_height // 2
+            self.row_rects.append(pygame.Rect(panel_rect.left + 10, y_pos, panel_width - 20, line_height))
 
             # Selection Highlight
             if i == self.selected_index:
                 highlight_rect = pygame.Rect(panel_rect.left + 10, y_pos + 2, panel_width - 20, line_height - 4)
-                pygame.draw.rect(self.screen, (30, 30, 50), highlight_rect)
-                pygame.draw.rect(self.screen, COLORS["HIGHLIGHT"], highlight_rect, 1)
+                pygame.draw.rect(layer, (30, 30, 50), highlight_rect)
+                pygame.draw.rect(layer, COLORS["HIGHLIGHT"], highlight_rect, 1)
                 color = COLORS["HIGHLIGHT"]
                 indicator = ">"
             else:
@@ -101,29 +149,48 @@ class MainMenu:
                 indicator = ""
 
             # Game Name (Left Aligned)
-            name_surf = item_font.render(f"{indicator} {name}", True, color)
+            name_surf = self.text.render(item_font, f"{indicator} {name}", color)
             name_rect = name_surf.get_rect(midleft=(panel_rect.left + 30, row_center_y))
-            self.screen.blit(name_surf, name_rect)
+            self._blit_premultiplied(layer, name_surf, name_rect)
 
             # High Score (Right Aligned)
-            if name != "Quit":
-                game_instance = self.games[name]
-                if game_instance.highscore_manager:
-                    high_score = game_instance.highscore_manager.get_score(name)
-                    score_text = f"{high_score}" if high_score > 0 else "-"
-                    score_surf = self.font_small.render(score_text, True, COLORS["ACCENT"])
-                    score_rect = score_surf.get_rect(right=panel_rect.right - 30, centery=row_center_y)
-                    self.screen.blit(score_surf, score_rect)
-
-                    # Label "Best"
-                    label_surf = self.font_small.render("Best:", True, COLORS["GRID"])
-                    label_rect = label_surf.get_rect(right=score_rect.left - 10, centery=row_center_y)
-                    self.screen.blit(label_surf, label_rect)
+            score_text = scores[i]
+            if score_text is not None:
+                score_surf = self.text.render(self.font_small, score_text, COLORS["ACCENT"])
+                score_rect = score_surf.get_rect(right=panel_rect.right - 30, centery=row_center_y)
+                self._blit_premultiplied(layer, score_surf, score_rect)
+
+                # Label "Best"
+                label_surf = self.text.render(self.font_small, "Best:", COLORS["GRID"])
+                label_rect = label_surf.get_rect(right=score_rect.left - 10, centery=row_center_y)
+                self._blit_premultiplied(layer, label_surf, label_rect)
 
         # Draw Instructions
-        inst_surf = self.font_menu.render("ARROWS to Select, ENTER to Play", True, COLORS["GRID"])
+        inst_surf = self.text.render(self.font_menu, "ARROWS to Select, ENTER to Play", COLORS["GRID"])
         inst_rect = inst_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-        self.screen.blit(inst_surf, inst_rect)
+        self._blit_premultiplied(layer, inst_surf, inst_rect)
+
+        if pygame.display.get_surface():
+            layer = layer.convert_alpha()
+        return layer
     
+    def _blit_premultiplied(self, layer, surf, pos):
+        # premul_alpha() misreads font output directly (transparent pixels come
+        # back opaque), so copy the text onto a plain SRCALPHA surface first
+        straight = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
+        straight.blit(surf, (0, 0))
+        layer.blit(straight.premul_alpha(), pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    def _best_score(self, name):
+        """Text of a row's "Best:" column ("-" before the first run), or None for rows without one."""
+        if name == "Quit" or not self.highscore_manager:
+            return None
+        best = self.highscore_manager.get_score(name)
+        return "-" if best is None else str(best)
+
+    def get_dirty_rects(self):
+        """Regions changed since last frame (particles, selection), or None for a full flip."""
+        return self.dirty_tracker.collect()
+
     def reset(self):
         pass
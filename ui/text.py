@@ -0,0 +1,139 @@
+import pygame
+from collections import OrderedDict
+from settings import *
+
+# Characters baked into each glyph atlas (printable ASCII)
+ATLAS_CHARS = "".join(chr(c) for c in range(32, 127))
+
+
+class GlyphAtlas:
+    """
+    One font/colour's printable ASCII glyphs rasterised once into a single
+    surface. New strings are composed from glyph areas with one blits() call,
+    so HUD text whose numbers keep changing never goes through the font
+    rasteriser. Kerning is ignored, which is invisible at HUD sizes.
+    """
+    def __init__(self, font, color):
+        self.height = font.get_height()
+        self.areas = {}
+        glyphs = []
+        width = 0
+        for char in ATLAS_CHARS:
+            surf = font.render(char, True, color)
+            glyphs.append((char, surf))
+            width += surf.get_width()
+
+        self.surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        x = 0
+        for char, surf in glyphs:
+            # MAX onto the transparent atlas copies the glyph's pixels and alpha as-is
+            self.surface.blit(surf, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.areas[char] = pygame.Rect(x, 0, surf.get_width(), self.height)
+            x += surf.get_width()
+
+    def can_draw(self, text):
+        return all(char in self.areas for char in text)
+
+    def size(self, text):
+        return sum(self.areas[char].width for char in text), self.height
+
+    def compose(self, text):
+        """Builds a surface for text out of cached glyphs."""
+        out = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        atlas = self.surface
+        batch = []
+        x = 0
+        for char in text:
+            area = self.areas[char]
+            batch.append((atlas, (x, 0), area, pygame.BLEND_RGBA_MAX))
+            x += area.width
+        out.blits(batch, doreturn=False)
+        return out
+
+
+class TextRenderer:
+    """
+    Shared font and text cache for every game and the menu.
+
+    - get_font() resolves each SysFont once.
+    - render() keeps an LRU cache of rendered surfaces keyed by font, text and
+      colour, for labels and anything that changes rarely.
+    - draw_hud() is for strings that change often ("Score: 1230"): an
+      unchanged string is a single cached blit, and a new one is composed
+      from the glyph atlas instead of being rasterised. These go in a small
+      LRU of their own, so a timer or the profiler overlay making a new
+      string every frame only ever evicts other HUD strings.
+    """
+    def __init__(self, max_entries=TEXT_CACHE_SIZE, max_hud_entries=HUD_TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.max_hud_entries = max_hud_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hud_surfaces = OrderedDict()
+        self.atlases = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size, name=FONT_NAME):
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surf = self._cached(self.surfaces, key)
+        if surf is None:
+            surf = self._store(self.surfaces, self.max_entries, key, font.render(text, antialias, color))
+        return surf
+
+    def _cached(self, cache, key):
+        surf = cache.get(key)
+        if surf is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return surf
+
+    def _store(self, cache, max_entries, key, surf):
+        cache[key] = surf
+        if len(cache) > max_entries:
+            cache.popitem(last=False)
+        return surf
+
+    def draw(self, surface, font, text, color, **anchor):
+        """Blits cached text positioned like get_rect(**anchor), e.g. center=(x, y). Returns its rect."""
+        surf = self.render(font, text, color)
+        rect = surf.get_rect(**anchor)
+        surface.blit(surf, rect)
+        return rect
+
+    def get_atlas(self, font, color):
+        key = (font, tuple(color))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(font, color)
+            self.atlases[key] = atlas
+        return atlas
+
+    def render_hud(self, font, text, color):
+        key = (font, text, tuple(color))
+        surf = self._cached(self.hud_surfaces, key)
+        if surf is None:
+            atlas = self.get_atlas(font, color)
+            if atlas.can_draw(text):
+                surf = atlas.compose(text)
+            else:
+                surf = font.render(text, True, color)
+            self._store(self.hud_surfaces, self.max_hud_entries, key, surf)
+        return surf
+
+    def draw_hud(self, surface, font, text, color, pos):
+        """Draws often-changing text with its top-left at pos. Returns its rect."""
+        return surface.blit(self.render_hud(font, text, color), pos)
+
+
+text_renderer = TextRenderer()
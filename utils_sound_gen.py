@@ -1,10 +1,16 @@
 import wave
-import math
-import struct
-import random
 import os
+import sys
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 
 OUTPUT_DIR = "assets/sounds"
+# Parameter hashes of the files last written; unchanged sounds are skipped
+MANIFEST_FILE = os.path.join(OUTPUT_DIR, ".manifest.json")
+# Bump when the synthesis code changes so every file is rebuilt
+GENERATOR_VERSION = 2
 
 def save_wav(filename, data, sample_rate=44100):
     filepath = os.path.join(OUTPUT_DIR, filename)
@@ -15,122 +21,129 @@ def save_wav(filename, data, sample_rate=44100):
         f.writeframes(data)
     print(f"Generated {filepath}")
 
+def to_pcm16(samples):
+    # Truncates toward zero like int() did in the per-sample version
+    return samples.astype('<i2').tobytes()
+
 def generate_square_wave(frequency, duration, volume=0.5, sample_rate=44100):
     n_samples = int(sample_rate * duration)
-    data = bytearray()
     period = sample_rate / frequency
-    for i in range(n_samples):
-        value = 32767 * volume if (i % period) < (period / 2) else -32768 * volume
-        data += struct.pack('<h', int(value))
-    return data
+    i = np.arange(n_samples, dtype=np.float64)
+    values = np.where((i % period) < (period / 2), 32767 * volume, -32768 * volume)
+    return to_pcm16(values)
 
-def generate_noise(duration, volume=0.5, sample_rate=44100):
+def generate_noise(duration, volume=0.5, sample_rate=44100, seed=0):
+    # Seeded so the same parameters always give the same file
     n_samples = int(sample_rate * duration)
-    data = bytearray()
-    for i in range(n_samples):
-        value = random.randint(-32768, 32767) * volume
-        data += struct.pack('<h', int(value))
-    return data
+    rng = np.random.default_rng(seed)
+    values = rng.integers(-32768, 32767, n_samples, endpoint=True) * volume
+    return to_pcm16(values)
 
 def generate_sawtooth(start_freq, end_freq, duration, volume=0.5, sample_rate=44100):
     n_samples = int(sample_rate * duration)
-    data = bytearray()
-    for i in range(n_samples):
-        progress = i / n_samples
-        freq = start_freq + (end_freq - start_freq) * progress
-        period = sample_rate / freq
-        phase = (i % period) / period
-        value = (2 * phase - 1) * 32767 * volume
-        data += struct.pack('<h', int(value))
-    return data
+    i = np.arange(n_samples, dtype=np.float64)
+    progress = i / n_samples
+    freq = start_freq + (end_freq - start_freq) * progress
+    period = sample_rate / freq
+    phase = (i % period) / period
+    values = (2 * phase - 1) * 32767 * volume
+    return to_pcm16(values)
 
 def generate_melody(duration=20.0, volume=0.2, sample_rate=44100):
     """Generates a simple looping melody."""
     bpm = 120
     beat_duration = 60 / bpm
-    
+
     # Simple C Major arpeggio / sequence
-    notes = [
+    notes = np.array([
         261.63, 329.63, 392.00, 523.25, # C, E, G, C
         220.00, 261.63, 329.63, 440.00, # A, C, E, A
         174.61, 220.00, 261.63, 349.23, # F, A, C, F
         196.00, 246.94, 293.66, 392.00  # G, B, D, G
-    ]
-    
+    ])
+
     # Bassline notes (lower octave)
-    bass_notes = [130.81, 110.00, 87.31, 98.00] # C, A, F, G
-    
-    data = bytearray()
+    bass_notes = np.array([130.81, 110.00, 87.31, 98.00]) # C, A, F, G
+
     total_samples = int(duration * sample_rate)
-    samples_generated = 0
-    
-    note_index = 0
-    bass_index = 0
-    
+
     # 4 beats per bar
     samples_per_beat = int(beat_duration * sample_rate)
     samples_per_note = samples_per_beat // 2 # Eighth notes
     samples_per_bass = samples_per_beat * 4 # Whole note
-    
-    while samples_generated < total_samples:
-        current_note_freq = notes[note_index % len(notes)]
-        current_bass_freq = bass_notes[(samples_generated // samples_per_bass) % len(bass_notes)]
-        
-        # Determine remaining samples for this note
-        chunk_size = min(samples_per_note, total_samples - samples_generated)
-        
-        # Generate mixed wave (Square for lead, Sawtooth for bass)
-        # We process sample by sample for mixing, which is slow in Python but fine for this short generation
-        # Actually, let's just generate chunks and append
-        
-        period_lead = sample_rate / current_note_freq
-        period_bass = sample_rate / current_bass_freq
-        
-        for i in range(chunk_size):
-            t = samples_generated + i
-            
-            # Lead (Square)
-            val_lead = 1.0 if (t % period_lead) < (period_lead / 2) else -1.0
-            
-            # Bass (Sawtooth)
-            phase_bass = (t % period_bass) / period_bass
-            val_bass = 2 * phase_bass - 1
-            
-            # Mix
-            mixed_val = (val_lead * 0.6 + val_bass * 0.4) * 32767 * volume
-            
-            data += struct.pack('<h', int(mixed_val))
-            
-        samples_generated += chunk_size
-        note_index += 1
-
-    return data
 
-# Generate Sounds
-if __name__ == "__main__":
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    # Every sample at once: which note it falls in, and the bass note at that note's start
+    t = np.arange(total_samples)
+    note_index = t // samples_per_note
+    note_start = note_index * samples_per_note
+    period_lead = sample_rate / notes[note_index % len(notes)]
+    period_bass = sample_rate / bass_notes[(note_start // samples_per_bass) % len(bass_notes)]
 
-    print("Generating sound effects...")
-    # 1. Menu Select (Short high blip)
-    save_wav("select.wav", generate_square_wave(880, 0.05, 0.3))
+    t = t.astype(np.float64)
+    # Lead (Square)
+    val_lead = np.where((t % period_lead) < (period_lead / 2), 1.0, -1.0)
+    # Bass (Sawtooth)
+    val_bass = 2 * ((t % period_bass) / period_bass) - 1
 
-    # 2. Shoot (Slide down pitch)
-    save_wav("shoot.wav", generate_sawtooth(880, 110, 0.15, 0.3))
+    # Mix
+    return to_pcm16((val_lead * 0.6 + val_bass * 0.4) * 32767 * volume)
 
-    # 3. Jump (Slide up pitch)
-    save_wav("jump.wav", generate_sawtooth(220, 660, 0.1, 0.3))
+GENERATORS = {
+    "square": generate_square_wave,
+    "noise": generate_noise,
+    "sawtooth": generate_sawtooth,
+    "melody": generate_melody,
+}
 
-    # 4. Explosion (Noise)
-    save_wav("explosion.wav", generate_noise(0.3, 0.4))
-    
-    # 5. Game Over (Descending low tones)
-    save_wav("gameover.wav", generate_sawtooth(200, 50, 0.5, 0.4))
+# (output file, generator, parameters)
+SOUNDS = [
+    ("select.wav", "square", {"frequency": 880, "duration": 0.05, "volume": 0.3}),          # Menu Select (Short high blip)
+    ("shoot.wav", "sawtooth", {"start_freq": 880, "end_freq": 110, "duration": 0.15, "volume": 0.3}),  # Slide down pitch
+    ("jump.wav", "sawtooth", {"start_freq": 220, "end_freq": 660, "duration": 0.1, "volume": 0.3}),    # Slide up pitch
+    ("explosion.wav", "noise", {"duration": 0.3, "volume": 0.4}),                            # Noise
+    ("gameover.wav", "sawtooth", {"start_freq": 200, "end_freq": 50, "duration": 0.5, "volume": 0.4}), # Descending low tones
+    ("score.wav", "square", {"frequency": 1200, "duration": 0.1, "volume": 0.3}),           # Ding
+    ("music.wav", "melody", {"duration": 16.0, "volume": 0.15}),                             # Looping Melody
+]
 
-    # 6. Score (Ding)
-    save_wav("score.wav", generate_square_wave(1200, 0.1, 0.3))
+def sound_hash(generator, params):
+    spec = json.dumps({"version": GENERATOR_VERSION, "generator": generator, "params": params}, sort_keys=True)
+    return hashlib.sha256(spec.encode()).hexdigest()
 
-    print("Generating soundtrack...")
-    # 7. Soundtrack (Looping Melody)
-    save_wav("music.wav", generate_melody(duration=16.0, volume=0.15))
-    print("Done.")
\ No newline at end of file
+def build_sound(filename, generator, params):
+    save_wav(filename, GENERATORS[generator](**params))
+    return filename
+
+def load_manifest():
+    try:
+        with open(MANIFEST_FILE) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+def build_all(force=False):
+    """Regenerates sounds whose parameters changed (or all with force), in parallel."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    manifest = {} if force else load_manifest()
+    hashes = {filename: sound_hash(generator, params) for filename, generator, params in SOUNDS}
+    stale = [(filename, generator, params) for filename, generator, params in SOUNDS
+             if manifest.get(filename) != hashes[filename]
+             or not os.path.exists(os.path.join(OUTPUT_DIR, filename))]
+
+    if not stale:
+        print("Sounds up to date.")
+    elif len(stale) == 1:
+        build_sound(*stale[0])  # Not worth starting a pool for
+    else:
+        with ProcessPoolExecutor() as pool:
+            list(pool.map(build_sound, *zip(*stale)))
+
+    with open(MANIFEST_FILE, 'w') as f:
+        json.dump(hashes, f, indent=4, sort_keys=True)
+    return [filename for filename, _, _ in stale]
+
+# Generate Sounds
+if __name__ == "__main__":
+    print("Generating sounds...")
+    build_all(force="--force" in sys.argv)
+    print("Done.")